@@ -1,10 +1,12 @@
 from flask import Flask, jsonify
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
+from flask_migrate import Migrate
 from dotenv import load_dotenv
 import os
 
 db = SQLAlchemy()
+migrate = Migrate()
 
 def create_app():
     load_dotenv()
@@ -17,9 +19,45 @@ def create_app():
     # Basic configuration
     app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['ANALYTICS_STORE'] = os.getenv('ANALYTICS_STORE', '').lower() in ('1', 'true', 'yes')
+    app.config['QUERY_BACKEND'] = os.getenv('QUERY_BACKEND', 'postgresql').lower()
+    app.config['RESPONSE_CACHE'] = os.getenv('RESPONSE_CACHE', 'memory').lower()
+    app.config['RESPONSE_CACHE_MAX_ENTRIES'] = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 4096))
+    app.config['RESPONSE_CACHE_MAX_MB'] = int(os.getenv('RESPONSE_CACHE_MAX_MB', 256))
+    app.config['RESPONSE_CACHE_URL'] = os.getenv('RESPONSE_CACHE_URL', 'redis://localhost:6379/0')
+    app.config['RESPONSE_CACHE_TTL'] = int(os.getenv('RESPONSE_CACHE_TTL', 24 * 60 * 60))
+    app.config['JSON_PROVIDER'] = os.getenv('JSON_PROVIDER', 'orjson').lower()
+    app.config['COMPRESS_MIN_SIZE'] = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+    app.config['COMPRESS_ENCODINGS'] = tuple(
+        encoding.strip() for encoding in os.getenv('COMPRESS_ENCODINGS', 'br,gzip').lower().split(',') if encoding.strip()
+    )
+    # Cache-Control per blueprint, e.g. CACHE_CONTROL_PLAYER="public, max-age=3600"
+    app.config['CACHE_CONTROL'] = {
+        blueprint: os.environ[f'CACHE_CONTROL_{blueprint.upper()}']
+        for blueprint in ('player', 'batting', 'pitching')
+        if f'CACHE_CONTROL_{blueprint.upper()}' in os.environ
+    }
+
+    # Serialize responses with orjson unless JSON_PROVIDER=default
+    if app.config['JSON_PROVIDER'] == 'orjson':
+        from .json_provider import OrjsonProvider
+        app.json = OrjsonProvider(app)
+
+    # Read-only DuckDB over Parquet exports instead of PostgreSQL
+    if app.config['QUERY_BACKEND'] == 'duckdb':
+        from .duckdb_backend import configure_duckdb
+        configure_duckdb(app)
     
     # Initialize extensions
     db.init_app(app)
+    migrate.init_app(app, db)
+    
+    # Register models with the metadata used by migrations
+    from . import models
+
+    if app.config['QUERY_BACKEND'] == 'duckdb':
+        from .duckdb_backend import attach_parquet_views
+        attach_parquet_views(app)
     
     # Basic test route at root level
     # @app.route('/')
@@ -32,6 +70,22 @@ def create_app():
     # Import and register blueprints
     from .routes import init_routes
     init_routes(app)
+
+    # Load the in-memory analytics store when ANALYTICS_STORE is set
+    from .controllers.column_store import column_store
+    column_store.init_app(app)
+
+    # Compress large JSON responses last, after they are tagged and cached uncompressed
+    from .compression import compression
+    compression.init_app(app)
+
+    # Answer revalidations with 304 before the response cache and the routes run
+    from .conditional_get import conditional_get
+    conditional_get.init_app(app)
+
+    # Serve repeat GETs from the response cache until the dataset version changes
+    from .response_cache import response_cache
+    response_cache.init_app(app)
     
     # Debug: Print all registered routes
     # print('\nRegistered Routes:')
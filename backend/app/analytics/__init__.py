@@ -0,0 +1,12 @@
+from .columns import float_array, bool_array, column_values, column_kind, typed_array, nullable
+from .zones import RectangularGrid, StatcastGrid, parse_grid, zone_metrics
+from .kde import binned_kde, scott_factor
+from .cache import LRUCache
+from .sampling import stratified_sample, label_centroids
+from .hexbin import field_angles, field_coordinates, hex_bins
+
+__all__ = ['float_array', 'bool_array', 'column_values', 'column_kind', 'typed_array', 'nullable',
+           'RectangularGrid', 'StatcastGrid', 'parse_grid', 'zone_metrics',
+           'binned_kde', 'scott_factor', 'LRUCache',
+           'stratified_sample', 'label_centroids',
+           'field_angles', 'field_coordinates', 'hex_bins']
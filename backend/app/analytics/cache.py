@@ -0,0 +1,50 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    A thread-safe mapping that evicts its least recently used entries beyond
+    ``maxsize`` entries, or beyond ``maxbytes`` total ``len()`` of the values
+    when that is given (a value larger than ``maxbytes`` is not stored).
+    """
+
+    def __init__(self, maxsize=1024, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _weight(self, value):
+        return len(value) if self.maxbytes is not None else 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, value):
+        weight = self._weight(value)
+        if self.maxbytes is not None and weight > self.maxbytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._weight(self._entries[key])
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self.nbytes += weight
+            while len(self._entries) > self.maxsize or (self.maxbytes is not None and self.nbytes > self.maxbytes):
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= self._weight(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
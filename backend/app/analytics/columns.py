@@ -0,0 +1,57 @@
+from datetime import date
+from decimal import Decimal
+import numpy as np
+
+
+def float_array(values):
+    """Float array from nullable column values, with None as NaN"""
+    return np.array(values, dtype=float)
+
+
+def bool_array(values):
+    """Boolean array from nullable column values, with None as False"""
+    return np.fromiter((bool(value) for value in values), dtype=bool, count=len(values))
+
+
+def column_values(rows, width):
+    """Transpose query rows into one tuple of values per selected column"""
+    return tuple(zip(*rows)) if rows else ((),) * width
+
+
+def column_kind(sql_type):
+    """How a column of ``sql_type`` is held in memory: 'float', 'bool', 'date' or 'object'"""
+    try:
+        python_type = sql_type.python_type
+    except NotImplementedError:
+        return 'object'
+    if python_type is bool:
+        return 'bool'
+    if python_type in (int, float, Decimal):
+        return 'float'
+    if python_type is date:
+        return 'date'
+    return 'object'
+
+
+def typed_array(values, kind):
+    """
+    Typed array from nullable column values: integers and floats as float64
+    with None as NaN, booleans with None as False, dates as datetime64[D]
+    with None as NaT, and anything else as an object array.
+    """
+    if kind == 'float':
+        return float_array(values)
+    if kind == 'bool':
+        return bool_array(values)
+    if kind == 'date':
+        return np.array(values, dtype='datetime64[D]')
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def nullable(array):
+    """Python values from a typed column array, with NaN and NaT back to None"""
+    if array.dtype.kind == 'f':
+        return [None if value != value else value for value in array.tolist()]
+    return array.tolist()
@@ -0,0 +1,59 @@
+"""
+Hexagonal binning for the spray chart.
+
+Batted balls are placed in field coordinates (feet, home plate at the
+origin, +y toward center field) and snapped to a pointy-top hexagonal grid
+by rounding their cube coordinates, all as array operations. Bins are then
+identified by their axial (q, r) pair, so per-bin counters can be
+accumulated with ``np.bincount`` over the returned inverse index.
+"""
+import numpy as np
+
+SQRT3 = np.sqrt(3.0)
+MAX_FIELD_ANGLE = 45.0
+
+
+def field_angles(horizontal_angles):
+    """Spray angles in degrees from center field, wrapped to (-180, 180] and clamped to the foul lines"""
+    angles = np.asarray(horizontal_angles, dtype=float)
+    angles = np.where(angles > 180, angles - 360, angles)
+    return np.clip(angles, -MAX_FIELD_ANGLE, MAX_FIELD_ANGLE)
+
+
+def field_coordinates(distances, angles):
+    """Field x/y in feet from distance and spray angle (degrees from center field)"""
+    radians = np.radians(angles)
+    distances = np.asarray(distances, dtype=float)
+    return distances * np.sin(radians), distances * np.cos(radians)
+
+
+def hex_bins(x, y, size):
+    """
+    Snap points to pointy-top hexagons with circumradius ``size``.
+
+    Returns (center_x, center_y, inverse): one center per occupied bin, in
+    axial (r, q) order, and each point's bin index.
+    """
+    x = np.asarray(x, dtype=float) / size
+    y = np.asarray(y, dtype=float) / size
+
+    q = SQRT3 / 3 * x - y / 3
+    r = 2 / 3 * y
+    s = -q - r
+
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+
+    axial = np.column_stack((rr, rq)).astype(int)
+    if axial.size == 0:
+        return np.empty(0), np.empty(0), np.empty(0, dtype=int)
+
+    keys, inverse = np.unique(axial, axis=0, return_inverse=True)
+    bin_r, bin_q = keys[:, 0], keys[:, 1]
+    center_x = size * SQRT3 * (bin_q + bin_r / 2)
+    center_y = size * 1.5 * bin_r
+    return center_x, center_y, inverse.reshape(-1)
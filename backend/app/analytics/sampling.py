@@ -0,0 +1,74 @@
+"""
+Stratified downsampling for scatter payloads.
+
+Every label (pitch type) keeps a share of the point budget proportional to
+its size, at least one point each when the budget allows, so each type's
+cloud keeps its shape. Sampling is seeded so the same data and budget
+always return the same points.
+"""
+import numpy as np
+
+
+def _labels(labels):
+    return np.array(['' if label is None else str(label) for label in labels])
+
+
+def allocate(counts, budget):
+    """Split ``budget`` points across groups of ``counts`` with the largest-remainder method"""
+    counts = np.asarray(counts, dtype=int)
+    if counts.sum() <= budget:
+        return counts
+
+    base = np.minimum(counts, 1) if budget >= counts.size else np.zeros_like(counts)
+    remaining = budget - base.sum()
+    spare = counts - base
+
+    quotas = spare * remaining / spare.sum()
+    shares = np.floor(quotas).astype(int)
+    leftover = remaining - shares.sum()
+    shares[np.argsort(shares - quotas, kind='stable')[:leftover]] += 1
+    return base + shares
+
+
+def stratified_sample(labels, max_points, seed=0):
+    """Return the sorted indexes of at most ``max_points`` rows, sampled per label"""
+    labels = _labels(labels)
+    if labels.size <= max_points:
+        return np.arange(labels.size)
+
+    keys, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    shares = allocate(counts, max_points)
+    rng = np.random.default_rng(seed)
+
+    keep = [
+        rng.choice(np.flatnonzero(inverse == group), size=share, replace=False)
+        for group, share in enumerate(shares)
+        if share
+    ]
+    return np.sort(np.concatenate(keep)) if keep else np.arange(0)
+
+
+def label_centroids(labels, columns):
+    """
+    Mean of every column per label, ignoring missing values, plus the
+    label's row count. ``columns`` maps names to float arrays with NaN for
+    missing values; unlabelled rows are left out.
+    """
+    labels = _labels(labels)
+    keys, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+
+    means = {}
+    for name, values in columns.items():
+        present = ~np.isnan(values)
+        sums = np.bincount(inverse, weights=np.where(present, values, 0), minlength=keys.size)
+        present_counts = np.bincount(inverse, weights=present, minlength=keys.size)
+        means[name] = [
+            round(float(total / count), 2) if count else None
+            for total, count in zip(sums, present_counts)
+        ]
+
+    return {
+        key: {'count': int(count), **{name: means[name][group] for name in columns}}
+        for group, (key, count) in enumerate(zip(keys.tolist(), counts))
+        if key
+    }
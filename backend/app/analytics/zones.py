@@ -0,0 +1,168 @@
+"""
+Vectorized strike-zone binning for the zone heatmap.
+
+A grid maps plate_x/plate_z column arrays to zone indexes in one pass;
+``zone_metrics`` then accumulates every per-zone counter with
+``np.bincount``. Rectangular grids are described by their interior edges,
+so the outer rows and columns are open-ended and no pitch is dropped.
+"""
+import numpy as np
+
+STRIKE_ZONE_X = (-0.83, 0.83)
+# The band the 3x3 heatmap has always used for its middle row
+HEATMAP_ZONE_Z = (1.5, 2.5)
+# Rulebook-style zone used for the Statcast 13-zone layout
+STATCAST_ZONE_Z = (1.5, 3.5)
+
+MAX_GRID_SIZE = 50
+
+
+def _edges(values):
+    edges = np.asarray(values, dtype=float)
+    if edges.ndim != 1 or edges.size == 0 or not np.all(np.isfinite(edges)):
+        raise ValueError("edges must be a non-empty list of numbers")
+    if np.any(np.diff(edges) <= 0):
+        raise ValueError("edges must be strictly increasing")
+    if edges.size + 1 > MAX_GRID_SIZE:
+        raise ValueError(f"at most {MAX_GRID_SIZE} bins per axis")
+    return edges
+
+
+def _digitize(values, edges):
+    """
+    Bin ``values`` against interior ``edges``. A value on an edge goes to the
+    neighbouring bin nearer the middle of the grid, which keeps the central
+    zone closed on both sides as the original thresholds did.
+    """
+    lower = np.searchsorted(edges, values, side='left')
+    upper = np.searchsorted(edges, values, side='right')
+    center = edges.size / 2
+    return np.where(np.abs(upper - center) < np.abs(lower - center), upper, lower)
+
+
+class RectangularGrid:
+    """An nx-by-nz grid defined by interior x and z edges"""
+
+    def __init__(self, x_edges, z_edges):
+        self.x_edges = _edges(x_edges)
+        self.z_edges = _edges(z_edges)
+        self.nx = self.x_edges.size + 1
+        self.nz = self.z_edges.size + 1
+        self.size = self.nx * self.nz
+
+    @classmethod
+    def regular(cls, nx, nz):
+        """Split the heatmap zone evenly into nx-2 by nz-2 cells, ringed by open-ended outer bins"""
+        if nx < 3 or nz < 3:
+            raise ValueError("grids need at least 3 bins per axis")
+        return cls(np.linspace(*STRIKE_ZONE_X, nx - 1), np.linspace(*HEATMAP_ZONE_Z, nz - 1))
+
+    def labels(self):
+        # Column by column, z labels counting down, as the 3x3 payload has always been laid out
+        return [{"x": x, "z": z} for x in range(self.nx) for z in range(self.nz - 1, -1, -1)]
+
+    def bin(self, plate_x, plate_z):
+        return _digitize(plate_x, self.x_edges) * self.nz + _digitize(plate_z, self.z_edges)
+
+
+class StatcastGrid:
+    """
+    The Statcast 13-zone layout: zones 1-9 cover the strike zone in thirds,
+    numbered left to right from the top row; 11-14 are the out-of-zone
+    quadrants (top-left, top-right, bottom-left, bottom-right).
+    """
+
+    ZONES = (1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 13, 14)
+
+    def __init__(self, x_bounds=STRIKE_ZONE_X, z_bounds=STATCAST_ZONE_Z):
+        self.x_bounds = x_bounds
+        self.z_bounds = z_bounds
+        self.size = len(self.ZONES)
+
+    def labels(self):
+        return [{"zone": zone} for zone in self.ZONES]
+
+    def bin(self, plate_x, plate_z):
+        (x_low, x_high), (z_low, z_high) = self.x_bounds, self.z_bounds
+        inside = (plate_x >= x_low) & (plate_x <= x_high) & (plate_z >= z_low) & (plate_z <= z_high)
+
+        column = np.clip(((plate_x - x_low) / (x_high - x_low) * 3).astype(int), 0, 2)
+        row = np.clip(((z_high - plate_z) / (z_high - z_low) * 3).astype(int), 0, 2)
+        in_zone = row * 3 + column
+
+        left = plate_x < (x_low + x_high) / 2
+        top = plate_z >= (z_low + z_high) / 2
+        out_of_zone = 9 + np.where(top, 0, 2) + np.where(left, 0, 1)
+
+        return np.where(inside, in_zone, out_of_zone)
+
+
+def parse_grid(grid=None, x_edges=None, z_edges=None):
+    """
+    Build a grid from request arguments: ``grid=3x3`` (default), ``5x5`` or
+    any ``NxM``, ``grid=statcast`` (or ``13``) for the 13-zone layout, or
+    comma-separated ``x_edges``/``z_edges`` for arbitrary interior edges.
+    Raises ValueError for anything it cannot parse.
+    """
+    if x_edges or z_edges:
+        default = RectangularGrid.regular(3, 3)
+        return RectangularGrid(
+            [float(edge) for edge in x_edges.split(',')] if x_edges else default.x_edges,
+            [float(edge) for edge in z_edges.split(',')] if z_edges else default.z_edges
+        )
+
+    grid = (grid or "3x3").strip().lower()
+    if grid in ("statcast", "13"):
+        return StatcastGrid()
+
+    nx, separator, nz = grid.partition("x")
+    if not separator:
+        raise ValueError(f"unknown grid '{grid}'")
+    nx, nz = int(nx), int(nz)
+    if max(nx, nz) > MAX_GRID_SIZE:
+        raise ValueError(f"at most {MAX_GRID_SIZE} bins per axis")
+    return RectangularGrid.regular(nx, nz)
+
+
+def _percent(part, whole):
+    return round(part / whole * 100, 1)
+
+
+def zone_metrics(grid, plate_x, plate_z, swing, contact, in_play, called_strike, swinging_strike, post_strikes):
+    """
+    Compute the heatmap metrics for every zone of ``grid``.
+
+    Takes one array per column (floats with NaN for missing locations,
+    booleans with missing values as False) and returns one dict per zone in
+    ``grid.labels()`` order.
+    """
+    valid = ~np.isnan(plate_x) & ~np.isnan(plate_z)
+    zones = grid.bin(plate_x[valid], plate_z[valid])
+
+    def count(mask=None):
+        weights = None if mask is None else mask[valid]
+        return np.bincount(zones, weights=weights, minlength=grid.size).astype(int).tolist()
+
+    whiffs = swing & ~contact & ~in_play
+    strikeouts = (post_strikes == 3) & (swinging_strike | called_strike)
+
+    total_pitches = int(valid.sum())
+    columns = zip(count(), count(swing), count(whiffs), count(called_strike), count(strikeouts))
+
+    zone_data = []
+    for label, (pitches, swings, zone_whiffs, called_strikes, zone_strikeouts) in zip(grid.labels(), columns):
+        zone_data.append({
+            **label,
+            "pitch_percent": _percent(pitches, total_pitches) if pitches else 0,
+            "total_pitches": pitches,
+            "swing_percent": _percent(swings, pitches) if pitches else 0,
+            "swings": swings,
+            "whiffs": zone_whiffs,
+            "strikeouts": zone_strikeouts,
+            "k_percent": _percent(zone_strikeouts, pitches) if pitches else 0,
+            "whiff_percent": _percent(zone_whiffs, swings) if swings else 0,
+            "swinging_strikes": zone_whiffs,
+            "called_strikes": called_strikes
+        })
+
+    return zone_data
@@ -0,0 +1,68 @@
+"""
+Negotiated gzip/brotli compression of JSON responses.
+
+A JSON response of at least COMPRESS_MIN_SIZE bytes is compressed with the
+best encoding in COMPRESS_ENCODINGS that the client's Accept-Encoding
+allows. A compressed response's strong ETag gets the encoding as a
+suffix (``"<etag>-gzip"``), because the bytes differ per encoding, and the
+compressed body is cached under that ETag, so responses served from the
+response cache are not compressed again.
+"""
+import gzip
+import brotli
+from flask import request
+from .analytics import LRUCache
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+# Every encoding an ETag suffix can name, in order of preference
+ENCODINGS = ('br', 'gzip')
+
+COMPRESSORS = {
+    'br': lambda body: brotli.compress(body, quality=BROTLI_QUALITY),
+    'gzip': lambda body: gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0),
+}
+
+
+class Compression:
+    def __init__(self):
+        self.encodings = ()
+        self.min_size = 0
+        self._compressed = LRUCache(maxsize=1024, maxbytes=64 * 1024 * 1024)
+
+    def init_app(self, app):
+        self.encodings = tuple(
+            encoding for encoding in app.config.get('COMPRESS_ENCODINGS', ENCODINGS) if encoding in COMPRESSORS
+        )
+        self.min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+        if self.encodings:
+            app.after_request(self._compress)
+
+    def _compress(self, response):
+        if response.status_code == 304:
+            response.vary.add('Accept-Encoding')
+            return response
+        if response.mimetype != 'application/json' or response.direct_passthrough or 'Content-Encoding' in response.headers:
+            return response
+
+        response.vary.add('Accept-Encoding')
+        body = response.get_data()
+        encoding = request.accept_encodings.best_match(self.encodings)
+        if encoding is None or len(body) < self.min_size:
+            return response
+
+        etag, weak = response.get_etag()
+        compressed = self._compressed.get((etag, encoding)) if etag and not weak else None
+        if compressed is None:
+            compressed = COMPRESSORS[encoding](body)
+            if etag and not weak:
+                self._compressed.set((etag, encoding), compressed)
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        if etag:
+            response.set_etag(f"{etag}-{encoding}", weak)
+        return response
+
+
+compression = Compression()
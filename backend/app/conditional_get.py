@@ -0,0 +1,91 @@
+"""
+ETags and conditional GETs for the API routes.
+
+A route's answer only changes with its arguments and the loaded data, so
+every 200 GET response carries a strong ETag that hashes the response
+cache key (endpoint, normalized args, data_version), plus a
+Last-Modified of the dataset version's ``updated_at``. Both can be
+computed before the route runs, so a request whose If-None-Match (or,
+without one, If-Modified-Since) still matches gets a 304 without any
+controller code or database query beyond the version lookup.
+
+Cache-Control is set per blueprint from the ``CACHE_CONTROL`` setting,
+falling back to ``DEFAULT_CACHE_CONTROL``: by default clients may keep
+responses but revalidate them on every use, which is cheap with the ETag.
+"""
+import hashlib
+from flask import current_app, g, request
+from .compression import ENCODINGS
+from .models.dataset_version import get_data_version_info, read_other_version
+from .response_cache import cache_key
+
+DEFAULT_CACHE_CONTROL = "public, no-cache"
+
+
+def response_etag(version):
+    return hashlib.sha256(cache_key(version).encode()).hexdigest()[:32]
+
+
+class ConditionalGet:
+    def __init__(self):
+        self.cache_control = {}
+
+    def init_app(self, app):
+        self.cache_control = app.config.get('CACHE_CONTROL', {})
+        app.before_request(self._check)
+        app.after_request(self._tag)
+
+    def _validators(self):
+        """(version, etag, last_modified) of the current request, or None when it isn't a cacheable GET"""
+        if request.method != 'GET' or request.blueprint is None:
+            return None
+
+        try:
+            version, updated_at = get_data_version_info()
+        except Exception as e:
+            current_app.logger.error(f"Error reading the dataset version, not tagging: {str(e)}")
+            return None
+        return version, response_etag(version), updated_at
+
+    def _set_headers(self, response, etag, last_modified):
+        response.set_etag(etag)
+        if last_modified is not None:
+            response.last_modified = last_modified
+        response.headers['Cache-Control'] = self.cache_control.get(request.blueprint, DEFAULT_CACHE_CONTROL)
+
+    def _check(self):
+        validators = self._validators()
+        if validators is None:
+            return None
+
+        g.response_validators = validators
+        _, etag, last_modified = validators
+        if request.if_none_match:
+            # A compressed representation's ETag carries its encoding as a suffix
+            tags = (etag, *(f"{etag}-{encoding}" for encoding in ENCODINGS))
+            matched = next((tag for tag in tags if request.if_none_match.contains_weak(tag)), None)
+        else:
+            matched = etag if (
+                last_modified is not None and request.if_modified_since is not None
+                and last_modified.replace(microsecond=0) <= request.if_modified_since.replace(tzinfo=None)
+            ) else None
+        if matched is None:
+            return None
+
+        response = current_app.response_class(status=304)
+        self._set_headers(response, matched, last_modified)
+        return response
+
+    def _tag(self, response):
+        validators = g.pop('response_validators', None)
+        if validators is None or response.status_code != 200:
+            return response
+
+        # Only tag a body built from the data the ETag's version names
+        version, etag, last_modified = validators
+        if not read_other_version(version):
+            self._set_headers(response, etag, last_modified)
+        return response
+
+
+conditional_get = ConditionalGet()
@@ -2,83 +2,105 @@ from sqlalchemy import func
 from sqlalchemy.sql import case, and_ 
 from collections import defaultdict
 from ..models.batting import BattingInfo
+from ..models.leaderboard import BattingLeaderboard
+from .leaderboard_page import leaderboard_page, windowed_leaderboard
+from .game_window import apply_window
+from ..models.plate_appearance import (
+    PlateAppearance, batting_count_columns, HIT_OUTCOMES, NON_AB_OUTCOMES
+)
+from .column_store import column_store, player_columns
+from ..analytics import (
+    RectangularGrid, zone_metrics, column_values, column_kind, typed_array, nullable, float_array,
+    field_angles, field_coordinates, hex_bins
+)
 import numpy as np
 import math
 
+PITCH_FAMILIES = {
+    '4S': 'Fastball', '2S': 'Fastball', 'CT': 'Fastball', 'SI': 'Fastball',
+    'SL': 'Breaking', 'CB': 'Breaking', 'KN': 'Breaking', 'SW': 'Breaking',
+    'SP': 'Offspeed', 'CH': 'Offspeed'
+}
+
+FAMILIES = ('Fastball', 'Breaking', 'Offspeed')
+FAMILY_INDEX = {pitch_type: FAMILIES.index(family) for pitch_type, family in PITCH_FAMILIES.items()}
+
+SPRAY_TYPES = ('SINGLE', 'DOUBLE', 'TRIPLE', 'HOME RUN')
+
+COUNT_COLUMNS = ('outcome', 'stolen_base')
+SPRAY_COLUMNS = (
+    'spray_type', 'hit_distance', 'hit_horizontal_angle', 'hit_vertical_angle', 'hit_exit_speed', 'game_date'
+)
+HEATMAP_COLUMNS = (
+    'plate_x', 'plate_z', 'swing', 'contact', 'called_strike', 'swinging_strike', 'post_strikes', 'in_play'
+)
+
 class BattingController:
     @staticmethod
-    def calculate_batting_stats(player_id):
-        """Calculate all batting statistics for a player with added debugging."""
-        at_bats = BattingInfo.query\
-            .filter_by(player_id=player_id)\
-            .with_entities(
-                BattingInfo.game_date,
-                BattingInfo.game_bam_id,
-                BattingInfo.at_bat_number,
-                BattingInfo.inning,
-                BattingInfo.event_type,
-                BattingInfo.description,
-                BattingInfo.hit_trajectory,
-                BattingInfo.pre_r1_bam_id,
-                BattingInfo.post_r1_bam_id,
-                BattingInfo.pre_r2_bam_id,
-                BattingInfo.post_r2_bam_id
-            )\
-            .order_by(
-                BattingInfo.game_date,
-                BattingInfo.game_bam_id,
-                BattingInfo.inning,
-                BattingInfo.at_bat_number
-            )\
-            .distinct()\
+    def calculate_batting_stats(player_id, window=None):
+        """Calculate all batting statistics for a player with one aggregate over their plate appearances."""
+        snapshot = column_store.snapshot()
+        if snapshot is not None:
+            columns = snapshot.player_columns(PlateAppearance, 'batting', player_id, COUNT_COLUMNS, window)
+            return BattingController.derive_rate_stats(BattingController._batting_counts(**columns))
+
+        query = PlateAppearance.query.filter_by(role='batting', player_id=player_id)
+        counts = apply_window(query, window, PlateAppearance, 'batting')\
+            .with_entities(*batting_count_columns())\
+            .one()
+
+        return BattingController.derive_rate_stats(counts._mapping)
+
+    @staticmethod
+    def calculate_batting_stats_for_players(player_ids=None, window=None):
+        """Calculate batting statistics for several players (every player when ``player_ids`` is None) with one grouped query."""
+        snapshot = column_store.snapshot()
+        if snapshot is not None:
+            if player_ids is None:
+                player_ids = snapshot.player_ids(PlateAppearance, 'batting')
+            return {
+                player_id: BattingController.derive_rate_stats(BattingController._batting_counts(
+                    **snapshot.player_columns(PlateAppearance, 'batting', player_id, COUNT_COLUMNS, window)
+                ))
+                for player_id in player_ids
+            }
+
+        query = PlateAppearance.query.filter_by(role='batting')
+        if player_ids is not None:
+            query = query.filter(PlateAppearance.player_id.in_(player_ids))
+        query = apply_window(query, window, PlateAppearance, 'batting')
+
+        rows = query\
+            .with_entities(PlateAppearance.player_id, *batting_count_columns())\
+            .group_by(PlateAppearance.player_id)\
             .all()
 
-        stats = defaultdict(int)
-        processed_abs = set()
-
-        for ab in at_bats:
-            ab_key = (ab.game_bam_id, ab.at_bat_number)
-            if ab_key in processed_abs:
-                continue
-
-            event = ab.event_type.lower().strip() if ab.event_type else ""
-            desc = ab.description.lower().strip() if ab.description else ""
-
-            if not event and not desc:
-                continue
-
-            stats['PA'] += 1
-
-            if 'home_run' in event or 'homers' in desc or 'hits a home run' in desc:
-                stats['HR'] += 1
-                stats['H'] += 1
-                stats['AB'] += 1
-            elif 'double' in event or 'doubles' in desc:
-                stats['2B'] += 1
-                stats['H'] += 1
-                stats['AB'] += 1
-            elif 'triple' in event or 'triples' in desc:
-                stats['3B'] += 1
-                stats['H'] += 1
-                stats['AB'] += 1
-            elif 'single' in event or 'singles' in desc:
-                stats['1B'] += 1
-                stats['H'] += 1
-                stats['AB'] += 1
-            elif 'walk' in event or 'walks' in desc:
-                stats['BB'] += 1
-            elif 'hit_by_pitch' in event or 'hit by pitch' in desc:
-                stats['HBP'] += 1
-            elif 'sacrifice_fly' in event or 'sacrifice fly' in desc:
-                stats['SF'] += 1
-            else:
-                stats['AB'] += 1
-
-            if ((ab.pre_r1_bam_id and ab.post_r1_bam_id and ab.pre_r1_bam_id != ab.post_r1_bam_id) or
-                (ab.pre_r2_bam_id and ab.post_r2_bam_id and ab.pre_r2_bam_id != ab.post_r2_bam_id)):
-                stats['SB'] += 1
-
-            processed_abs.add(ab_key)
+        counts_by_player = {}
+        for row in rows:
+            counts = dict(row._mapping)
+            counts_by_player[counts.pop('player_id')] = counts
+
+        requested = counts_by_player if player_ids is None else player_ids
+        return {
+            player_id: BattingController.derive_rate_stats(counts_by_player.get(player_id, {}))
+            for player_id in requested
+        }
+
+    @staticmethod
+    def _batting_counts(outcome, stolen_base):
+        """Every batting counting stat from plate appearance outcome and stolen_base columns, as batting_count_columns counts them"""
+        return {
+            'PA': outcome.size,
+            'AB': int(np.count_nonzero(~np.isin(outcome, NON_AB_OUTCOMES))),
+            'H': int(np.count_nonzero(np.isin(outcome, HIT_OUTCOMES))),
+            **{code: int(np.count_nonzero(outcome == code)) for code in HIT_OUTCOMES + NON_AB_OUTCOMES},
+            'SB': int(np.count_nonzero(stolen_base)),
+        }
+
+    @staticmethod
+    def derive_rate_stats(counts):
+        """Add AVG/SLG/OBP/OPS to a mapping of counting stats; stats that never occurred are left out"""
+        stats = defaultdict(int, {key: value for key, value in counts.items() if value})
 
         if stats['AB'] > 0:
             stats['AVG'] = round(stats['H'] / stats['AB'], 3)
@@ -99,172 +121,89 @@ class BattingController:
 
 
     @staticmethod
-    def get_spray_chart_data(player_id):
-        """Get hit location data for spray chart visualization"""
-        hits = BattingInfo.query\
-            .filter_by(player_id=player_id)\
-            .filter(BattingInfo.hit_distance.isnot(None))\
-            .filter(BattingInfo.hit_horizontal_angle.isnot(None))\
-            .with_entities(
-                BattingInfo.game_bam_id,
-                BattingInfo.at_bat_number,
-                BattingInfo.event_type,
-                BattingInfo.hit_trajectory,
-                BattingInfo.hit_distance,
-                BattingInfo.hit_horizontal_angle,
-                BattingInfo.hit_vertical_angle,
-                BattingInfo.hit_exit_speed,
-                BattingInfo.game_date
-                
-            )\
-            .distinct()\
-            .all()
-            
-        if not hits:
+    def get_spray_chart_data(player_id, window=None, hex_size=None):
+        """
+        Get hit location data for spray chart visualization: one point per
+        batted ball, or hexagonal bins of ``hex_size`` feet when given.
+        """
+        columns = player_columns(PlateAppearance, 'batting', player_id, SPRAY_COLUMNS, window)
+        hits = BattingController._batted_balls(columns)
+        if not hits['spray_type'].size:
             return None
 
-        spray_chart_data = []
-        processed_hits = set()
-        
-        for hit in hits:
-            hit_key = (hit.game_bam_id, hit.at_bat_number)
-            if hit_key in processed_hits:
-                continue
-                
-            event = hit.event_type.lower() if hit.event_type else ""
-            
-            if 'home_run' in event or 'home run' in event:
-                hit_type = 'HOME RUN'
-            elif 'triple' in event:
-                hit_type = 'TRIPLE'
-            elif 'double' in event:
-                hit_type = 'DOUBLE'
-            elif 'single' in event:
-                hit_type = 'SINGLE'
-            else:
-                continue
-            
-            angle = hit.hit_horizontal_angle
-            if angle > 180:
-                angle -= 360
-            angle = max(-45, min(45, angle))
-            
-            spray_chart_data.append({
+        return BattingController._spray_chart(hits, hex_size)
+
+    @staticmethod
+    def _batted_balls(columns):
+        batted = columns['spray_type'] != None
+        return {name: columns[name][batted] for name in SPRAY_COLUMNS}
+
+    @staticmethod
+    def _spray_chart(columns, hex_size=None):
+        """Build the spray chart payload from batted-ball plate appearance columns"""
+        angles = field_angles(columns['hit_horizontal_angle'])
+
+        if hex_size is not None:
+            return BattingController._spray_hex_bins(
+                columns['spray_type'], columns['hit_distance'], angles, columns['hit_exit_speed'], hex_size
+            )
+
+        return [
+            {
                 'type': hit_type,
-                'distance': round(hit.hit_distance, 1),
-                'exit_speed': round(hit.hit_exit_speed, 1) if hit.hit_exit_speed else 0,
+                'distance': round(distance, 1),
+                'exit_speed': round(exit_speed, 1) if exit_speed else 0,
                 'hit_angle': angle,
-                'launch_angle': round(hit.hit_vertical_angle, 1) if hit.hit_vertical_angle else 0,
-                'game_date': hit.game_date.strftime('%Y-%m-%d')
-            })
-            
-            processed_hits.add(hit_key)
-            
-        # Print debug info
-        # print("\nSpray Chart Debug:")
-        # hit_types = defaultdict(int)
-        # for hit in spray_chart_data:
-        #     hit_types[hit['type']] += 1
-        # print(f"Total hits plotted: {len(spray_chart_data)}")
-        # print("Hit distribution:", dict(hit_types))
-        
-        return spray_chart_data
+                'launch_angle': round(launch_angle, 1) if launch_angle else 0,
+                'game_date': game_date.strftime('%Y-%m-%d')
+            }
+            for hit_type, distance, angle, launch_angle, exit_speed, game_date in zip(
+                columns['spray_type'].tolist(), nullable(columns['hit_distance']), angles.tolist(),
+                nullable(columns['hit_vertical_angle']), nullable(columns['hit_exit_speed']),
+                columns['game_date'].tolist()
+            )
+        ]
+
+    @staticmethod
+    def _spray_hex_bins(types, distances, angles, exit_speeds, hex_size):
+        """Aggregate batted balls into hexagonal field bins with their count, average exit velocity and hit-type mix"""
+        x, y = field_coordinates(distances, angles)
+        center_x, center_y, inverse = hex_bins(x, y, hex_size)
+        size = center_x.size
+
+        counts = np.bincount(inverse, minlength=size)
+        has_speed = ~np.isnan(exit_speeds)
+        speed_counts = np.bincount(inverse[has_speed], minlength=size)
+        speed_sums = np.bincount(inverse[has_speed], weights=exit_speeds[has_speed], minlength=size)
+
+        types = np.array(types)
+        type_counts = {
+            hit_type: np.bincount(inverse[types == hit_type], minlength=size).tolist()
+            for hit_type in SPRAY_TYPES
+        }
+
+        center_distance = np.hypot(center_x, center_y)
+        center_angle = np.degrees(np.arctan2(center_x, center_y))
+
+        return [
+            {
+                'x': round(center_x[i], 1),
+                'y': round(center_y[i], 1),
+                'distance': round(center_distance[i], 1),
+                'hit_angle': round(center_angle[i], 1),
+                'count': int(counts[i]),
+                'avg_exit_speed': round(speed_sums[i] / speed_counts[i], 1) if speed_counts[i] else None,
+                'types': {hit_type: type_counts[hit_type][i] for hit_type in SPRAY_TYPES if type_counts[hit_type][i]}
+            }
+            for i in range(size)
+        ]
     
     @staticmethod
-    def get_zone_heatmap(player_id):
-        """Generate heatmap data for strike zone metrics."""
+    def get_zone_heatmap(player_id, grid=None, window=None):
+        """Generate heatmap data for strike zone metrics over ``grid`` (the 3x3 grid by default)."""
         try:
-            query = BattingInfo.query.filter_by(player_id=player_id).with_entities(
-                BattingInfo.plate_x,
-                BattingInfo.plate_z,
-                BattingInfo.swing,
-                BattingInfo.contact,
-                BattingInfo.called_strike,
-                BattingInfo.swinging_strike,
-                BattingInfo.ball,
-                BattingInfo.pre_strikes,
-                BattingInfo.post_strikes,
-                BattingInfo.at_bat_number,
-                BattingInfo.in_play
-            ).all()
-
-            zone_data = []
-            for x in range(3):
-                for z in range(2, -1, -1):  
-                    zone_data.append({
-                        "x": x,
-                        "z": z,
-                        "pitch_percent": 0,
-                        "total_pitches": 0,
-                        "swing_percent": 0,
-                        "swings": 0,
-                        "whiffs": 0,
-                        "strikeouts": 0,
-                        "k_percent": 0,
-                        "whiff_percent": 0,
-                        "swinging_strikes": 0,
-                        "called_strikes": 0
-                    })
-
-            at_bats = {}
-            
-            valid_pitches = [p for p in query if p.plate_x is not None and p.plate_z is not None]
-            total_pitches = len(valid_pitches)
-
-            for pitch in valid_pitches:
-                x_zone = 1  
-                z_zone = 1  
-                
-                if pitch.plate_x < -0.83:
-                    x_zone = 0
-                elif pitch.plate_x > 0.83:
-                    x_zone = 2
-                    
-                if pitch.plate_z < 1.5:
-                    z_zone = 0
-                elif pitch.plate_z > 2.5:
-                    z_zone = 2
-
-                zone_index = x_zone * 3 + z_zone
-                zone = zone_data[zone_index]
-                
-                zone["total_pitches"] += 1
-
-                if pitch.swing:
-                    zone["swings"] += 1
-                    if not pitch.contact and not pitch.in_play:
-                        zone["whiffs"] += 1
-                        zone["swinging_strikes"] += 1
-
-                if pitch.called_strike:
-                    zone["called_strikes"] += 1
-
-                if pitch.post_strikes == 3:
-                    if pitch.swinging_strike or pitch.called_strike:
-                        zone["strikeouts"] += 1
-
-            for zone in zone_data:
-                if zone["total_pitches"] > 0:
-                    zone["pitch_percent"] = round((zone["total_pitches"] / total_pitches * 100), 1)
-                    
-                    zone["swing_percent"] = round((zone["swings"] / zone["total_pitches"] * 100), 1)
-                    
-                    zone["k_percent"] = round((zone["strikeouts"] / zone["total_pitches"] * 100), 1)
-                
-                if zone["swings"] > 0:
-                    zone["whiff_percent"] = round((zone["whiffs"] / zone["swings"] * 100), 1)
-
-                # Debug info
-                # print(f"Zone ({zone['x']}, {zone['z']}): ")
-                # print(f"  Total Pitches: {zone['total_pitches']}")
-                # print(f"  Swings: {zone['swings']}")
-                # print(f"  Swing %: {zone['swing_percent']}")
-                # print(f"  Whiffs: {zone['whiffs']}")
-                # print(f"  Whiff %: {zone['whiff_percent']}")
-                # print(f"  Strikeouts: {zone['strikeouts']}")
-                # print(f"  K %: {zone['k_percent']}")
-
-            return zone_data
+            grid = grid or RectangularGrid.regular(3, 3)
+            return zone_metrics(grid, **player_columns(BattingInfo, 'batting', player_id, HEATMAP_COLUMNS, window))
 
         except Exception as e:
             import traceback
@@ -274,145 +213,207 @@ class BattingController:
         
 
     @staticmethod
-    def get_pitch_trends(player_id):
+    def get_pitch_trends(player_id, window=None):
         """Generate pitch type data grouped by date."""
         try:
-            query = (BattingInfo.query
-                    .filter_by(player_id=player_id)
+            snapshot = column_store.snapshot()
+            if snapshot is not None:
+                columns = snapshot.player_columns(BattingInfo, 'batting', player_id, ('game_date', 'pitch_type'), window)
+                return BattingController._pitch_trends(
+                    BattingController._family_counts(columns['game_date'], columns['pitch_type'])
+                )
+
+            family = case(PITCH_FAMILIES, value=BattingInfo.pitch_type)
+            query = BattingInfo.query.filter_by(player_id=player_id)
+            query = (apply_window(query, window, BattingInfo, 'batting')
                     .with_entities(
                         BattingInfo.game_date,
-                        BattingInfo.pitch_type
+                        family.label('family'),
+                        func.count().label('pitches')
                     )
+                    .group_by(BattingInfo.game_date, family)
                     .order_by(BattingInfo.game_date)
                     .all())
 
-            pitch_trends = {}
-            
-            fastball_types = ['4S', '2S', 'CT', 'SI']
-            breaking_types = ['SL', 'CB', 'KN', 'SW']
-            offspeed_types = ['SP', 'CH']
-                
-            for pitch in query:
-                date_str = pitch.game_date.strftime('%Y-%m-%d')
-                
-                if date_str not in pitch_trends:
-                    pitch_trends[date_str] = {
-                        "date": date_str,
-                        "displayDate": pitch.game_date.strftime('%B %d'),
-                        "Fastball": 0,
-                        "Breaking": 0,
-                        "Offspeed": 0,
-                        "total": 0
-                    }
-                
-                pitch_type = pitch.pitch_type
-                
-                if pitch_type in fastball_types:
-                    pitch_trends[date_str]["Fastball"] += 1
-                elif pitch_type in breaking_types:
-                    pitch_trends[date_str]["Breaking"] += 1
-                elif pitch_type in offspeed_types:
-                    pitch_trends[date_str]["Offspeed"] += 1
-                
-                pitch_trends[date_str]["total"] += 1
-
-            result = []
-            for date_data in pitch_trends.values():
-                total = date_data["total"]
-                if total > 0:
-                    fast_pct = date_data["Fastball"] / total * 100
-                    break_pct = date_data["Breaking"] / total * 100
-                    off_pct = date_data["Offspeed"] / total * 100
-                    
-                    date_data["FastballPct"] = round(fast_pct, 1)
-                    date_data["BreakingPct"] = round(break_pct, 1)
-                    
-                    date_data["OffspeedPct"] = round(100 - date_data["FastballPct"] - date_data["BreakingPct"], 1)
-                    
-                    if date_data["OffspeedPct"] < 0:
-                        max_pct = max(date_data["FastballPct"], date_data["BreakingPct"])
-                        if date_data["FastballPct"] == max_pct:
-                            date_data["FastballPct"] += date_data["OffspeedPct"]
-                        else:
-                            date_data["BreakingPct"] += date_data["OffspeedPct"]
-                        date_data["OffspeedPct"] = 0
-
-                result.append(date_data)
-
-            result.sort(key=lambda x: x["date"])
-            return result
+            return BattingController._pitch_trends(query)
 
         except Exception as e:
             import traceback
             print(f"Error in get_pitch_trends: {str(e)}")
             print(traceback.format_exc())
             return None
+
+    @staticmethod
+    def _pitch_trends(groups):
+        """Build the pitch trends payload from (game_date, family, pitches) groups"""
+        pitch_trends = {}
+
+        for game_date, family, pitches in groups:
+            date_str = game_date.strftime('%Y-%m-%d')
+
+            if date_str not in pitch_trends:
+                pitch_trends[date_str] = {
+                    "date": date_str,
+                    "displayDate": game_date.strftime('%B %d'),
+                    "Fastball": 0,
+                    "Breaking": 0,
+                    "Offspeed": 0,
+                    "total": 0
+                }
+
+            if family:
+                pitch_trends[date_str][family] += pitches
+
+            pitch_trends[date_str]["total"] += pitches
+
+        result = []
+        for date_data in pitch_trends.values():
+            total = date_data["total"]
+            if total > 0:
+                fast_pct = date_data["Fastball"] / total * 100
+                break_pct = date_data["Breaking"] / total * 100
+                off_pct = date_data["Offspeed"] / total * 100
+                
+                date_data["FastballPct"] = round(fast_pct, 1)
+                date_data["BreakingPct"] = round(break_pct, 1)
+                
+                date_data["OffspeedPct"] = round(100 - date_data["FastballPct"] - date_data["BreakingPct"], 1)
+                
+                if date_data["OffspeedPct"] < 0:
+                    max_pct = max(date_data["FastballPct"], date_data["BreakingPct"])
+                    if date_data["FastballPct"] == max_pct:
+                        date_data["FastballPct"] += date_data["OffspeedPct"]
+                    else:
+                        date_data["BreakingPct"] += date_data["OffspeedPct"]
+                    date_data["OffspeedPct"] = 0
+
+            result.append(date_data)
+
+        result.sort(key=lambda x: x["date"])
+        return result
         
 
     @staticmethod
-    def get_batting_leaderboard():
-        """Generate batting leaderboard statistics following Baseball Savant format."""
+    def get_dashboard(player_id, grid=None, hex_size=None, window=None):
+        """
+        Build every batting modal panel (stats, spray chart, zone heatmap and
+        pitch trends) from one query.
+
+        Each of the player's pitches comes back with its plate appearance
+        joined on, so the pitch-level panels read the rows directly and the
+        plate appearance panels read the first row of each appearance. With
+        the analytics store enabled, both row sets are read from the store.
+        Returns None when the player has no pitches.
+        """
         try:
-            bbe_subquery = (
-                BattingInfo.query
-                .with_entities(
-                    BattingInfo.player_id,
-                    func.count().label('bbe')
+            grid = grid or RectangularGrid.regular(3, 3)
+            pitches, appearances = BattingController._dashboard_columns(player_id, window)
+            if not pitches['game_date'].size:
+                return None
+
+            batted_balls = BattingController._batted_balls(appearances)
+
+            return {
+                'stats': BattingController.derive_rate_stats(BattingController._batting_counts(
+                    appearances['outcome'], appearances['stolen_base']
+                )),
+                'spray_chart': (
+                    BattingController._spray_chart(batted_balls, hex_size) if batted_balls['spray_type'].size else []
+                ),
+                'zone_heatmap': zone_metrics(grid, **{name: pitches[name] for name in HEATMAP_COLUMNS}),
+                'pitch_trends': BattingController._pitch_trends(
+                    BattingController._family_counts(pitches['game_date'], pitches['pitch_type'])
                 )
-                .filter(BattingInfo.in_play == True)
-                .group_by(BattingInfo.player_id)
-                .subquery()
+            }
+
+        except Exception as e:
+            import traceback
+            print(f"Error in get_dashboard: {str(e)}")
+            print(traceback.format_exc())
+            return None
+
+    @staticmethod
+    def _dashboard_columns(player_id, window=None):
+        """The player's pitch columns and plate appearance columns, from the store or from one joined query"""
+        pitch_names = ('game_date', 'pitch_type', *HEATMAP_COLUMNS)
+        appearance_names = COUNT_COLUMNS + SPRAY_COLUMNS
+
+        snapshot = column_store.snapshot()
+        if snapshot is not None:
+            return (
+                snapshot.player_columns(BattingInfo, 'batting', player_id, pitch_names, window),
+                snapshot.player_columns(PlateAppearance, 'batting', player_id, appearance_names, window)
             )
 
-            query = (
-                BattingInfo.query
-                .with_entities(
-                    BattingInfo.player_id,
-                    BattingInfo.first_name,
-                    BattingInfo.last_name,
-                    bbe_subquery.c.bbe.label('bbe'),
-                    func.avg(BattingInfo.hit_vertical_angle).label('launch_angle'),
-                    func.max(BattingInfo.hit_exit_speed).label('max_exit_velo'),
-                    func.avg(BattingInfo.hit_exit_speed).label('avg_exit_velo'),
-                    func.percentile_cont(0.5).within_group(
-                        BattingInfo.hit_exit_speed.desc()
-                    ).label('ev50'),
-                    func.max(BattingInfo.hit_distance).label('max_distance'),
-                    func.avg(BattingInfo.hit_distance).label('avg_distance'),
-                    (func.count(case(
-                        (BattingInfo.hit_exit_speed >= 95, 1)
-                    ))).label('ninety_five_plus'),
-                    (func.count(case(
-                        (BattingInfo.hit_exit_speed >= 95, 1)
-                    )) * 100.0 / func.nullif(func.count(), 0)).label('hard_hit_pct'),
-                    (func.count(case(
-                        (and_(
-                            BattingInfo.hit_vertical_angle >= 8,
-                            BattingInfo.hit_vertical_angle <= 32
-                        ), 1)
-                    )) * 100.0 / func.count()).label('la_sweet_spot_pct'),
-                    func.count(case(
-                        (and_(
-                            BattingInfo.hit_exit_speed >= 98,
-                            BattingInfo.hit_vertical_angle.between(8, 32)
-                        ), 1)
-                    )).label('barrels'),
-                    (func.count(case(
-                        (and_(
-                            BattingInfo.hit_exit_speed >= 98,
-                            BattingInfo.hit_vertical_angle.between(8, 32)
-                        ), 1)
-                    )) * 100.0 / func.nullif(func.count(), 0)).label('barrel_pct')
-                )
-                .outerjoin(bbe_subquery, BattingInfo.player_id == bbe_subquery.c.player_id)
-                .filter(BattingInfo.in_play == True)
-                .group_by(
-                    BattingInfo.player_id,
-                    BattingInfo.first_name,
-                    BattingInfo.last_name,
-                    bbe_subquery.c.bbe
-                )
-                .all()
+        query = BattingInfo.query.filter_by(player_id=player_id)
+        rows = apply_window(query, window, BattingInfo, 'batting')\
+            .outerjoin(PlateAppearance, and_(
+                PlateAppearance.role == 'batting',
+                PlateAppearance.player_id == BattingInfo.player_id,
+                PlateAppearance.game_bam_id == BattingInfo.game_bam_id,
+                PlateAppearance.at_bat_number == BattingInfo.at_bat_number
+            ))\
+            .with_entities(
+                *(getattr(BattingInfo, name) for name in pitch_names),
+                PlateAppearance.id,
+                *(getattr(PlateAppearance, name) for name in appearance_names)
+            )\
+            .order_by(
+                BattingInfo.game_date,
+                BattingInfo.game_bam_id,
+                BattingInfo.at_bat_number,
+                BattingInfo.pitch_seq
+            )\
+            .all()
+
+        values = column_values(rows, len(pitch_names) + 1 + len(appearance_names))
+        pitch_kinds = {column.key: column_kind(column.type) for column in BattingInfo.__table__.columns}
+        appearance_kinds = {column.key: column_kind(column.type) for column in PlateAppearance.__table__.columns}
+        pitches = {
+            name: typed_array(column, pitch_kinds[name])
+            for name, column in zip(pitch_names, values)
+        }
+
+        # Every pitch carries its plate appearance; keep the first row of each, in plate appearance order
+        pa_ids = float_array(values[len(pitch_names)])
+        first_rows = np.unique(pa_ids, return_index=True)[1]
+        first_rows = np.sort(first_rows[~np.isnan(pa_ids[first_rows])])
+        appearances = {
+            name: typed_array(column, appearance_kinds[name])[first_rows]
+            for name, column in zip(appearance_names, values[len(pitch_names) + 1:])
+        }
+        return pitches, appearances
+
+    @staticmethod
+    def _family_counts(dates, pitch_types):
+        """Count pitches per (game_date, pitch family) from pitch columns, as (game_date, family, pitches) groups"""
+        families = np.array([FAMILY_INDEX.get(pitch_type, len(FAMILIES)) for pitch_type in pitch_types], dtype=int)
+        days = np.array(dates, dtype='datetime64[D]')
+        dated = ~np.isnat(days)
+
+        keys, counts = np.unique(
+            np.column_stack((days[dated].astype(np.int64), families[dated])),
+            axis=0, return_counts=True
+        )
+        day_values = keys[:, 0].astype('datetime64[D]').astype(object)
+        return [
+            (day, FAMILIES[family] if family < len(FAMILIES) else None, int(count))
+            for day, family, count in zip(day_values, keys[:, 1], counts)
+        ]
+
+    @staticmethod
+    def get_batting_leaderboard(sort='avg_exit_velo', order='desc', min_bbe=None, limit=None, cursor=None, window=None):
+        """Generate batting leaderboard statistics following Baseball Savant format.
+
+        Reads the precomputed batting_leaderboard materialized view, which is
+        refreshed at the end of each ingest, or recomputes it from player_game
+        rows over ``window``. Filtering, sorting and keyset pagination happen
+        in the database; returns (rows, next_cursor).
+        """
+        try:
+            source = windowed_leaderboard(BattingLeaderboard, 'batting', window) if window else BattingLeaderboard
+            query, next_cursor = leaderboard_page(
+                source, sort, order, min_bbe=min_bbe, limit=limit, cursor=cursor
             )
 
             result = []
@@ -434,7 +435,7 @@ class BattingController:
                     'barrel_pct': round(row.barrel_pct, 1) if row.barrel_pct else 0
                 })
 
-            return sorted(result, key=lambda x: x['avg_exit_velo'], reverse=True)
+            return result, next_cursor
 
         except Exception as e:
             import traceback
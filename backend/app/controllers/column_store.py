@@ -0,0 +1,180 @@
+import threading
+import numpy as np
+from sqlalchemy import select
+from .. import db
+from ..models.batting import BattingInfo
+from ..models.pitching import PitchingInfo
+from ..models.plate_appearance import PlateAppearance
+from ..models.dataset_version import get_data_version, note_read_version
+from ..analytics import column_kind, column_values, typed_array
+from .game_window import apply_window
+
+INFO_MODELS = {'batting': BattingInfo, 'pitching': PitchingInfo}
+
+# Row order within each player, so both the store and the database hand the
+# kernels rows in the order the endpoints have always returned them
+ROW_ORDER = {
+    BattingInfo: (BattingInfo.id,),
+    PitchingInfo: (PitchingInfo.id,),
+    PlateAppearance: (PlateAppearance.game_date, PlateAppearance.game_bam_id, PlateAppearance.at_bat_number),
+}
+
+
+class PlayerTable:
+    """One table's typed column arrays, sorted by player, with each player's row offsets as the index"""
+
+    def __init__(self, columns):
+        self.columns = columns
+        player_ids = columns['player_id']
+        self.players, starts = np.unique(player_ids, return_index=True)
+        self.stops = np.append(starts[1:], player_ids.size).astype(int)
+        self.starts = starts.astype(int)
+
+    def rows(self, player_id):
+        """Slice of ``player_id``'s rows (empty when they have none)"""
+        player_id = int(player_id)
+        i = np.searchsorted(self.players, player_id)
+        if i == self.players.size or self.players[i] != player_id:
+            return slice(0, 0)
+        return slice(self.starts[i], self.stops[i])
+
+    def player_columns(self, player_id, names):
+        rows = self.rows(player_id)
+        return {name: self.columns[name][rows] for name in names}
+
+
+class Snapshot:
+    """Every store table as of one dataset version; never modified once built"""
+
+    def __init__(self, version, tables):
+        self.version = version
+        self.tables = tables
+
+    def player_ids(self, model, role):
+        return [int(player_id) for player_id in self.tables[model, role].players]
+
+    def player_columns(self, model, role, player_id, names, window=None):
+        """Column views of ``player_id``'s rows, restricted to ``window`` when given"""
+        table = self.tables[model, role]
+        if not window:
+            return table.player_columns(player_id, names)
+
+        columns = table.player_columns(player_id, set(names) | {'game_date', 'game_bam_id'})
+        games = self.tables[INFO_MODELS[role], role].player_columns(player_id, ('game_date', 'game_bam_id'))
+        keep = window.mask(columns['game_date'], columns['game_bam_id'], (games['game_date'], games['game_bam_id']))
+        return {name: columns[name][keep] for name in names}
+
+
+class ColumnStore:
+    """
+    Optional in-process copy of batting_info, pitching_info and
+    plate_appearance as typed NumPy columns, enabled with the
+    ``ANALYTICS_STORE`` setting.
+
+    The tables are loaded at startup and reloaded when the dataset version
+    changes. A reload builds a complete new snapshot and then swaps it in,
+    so readers always see one consistent version; while it runs, other
+    requests keep reading the previous snapshot.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('ANALYTICS_STORE', False)
+        if not self.enabled:
+            return
+
+        with app.app_context():
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"Error loading the analytics store, reading from the database: {str(e)}")
+
+    def snapshot(self):
+        """The current snapshot, reloaded first if the data has changed; None when the store is off or empty"""
+        if not self.enabled:
+            return None
+
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != get_data_version():
+            try:
+                snapshot = self.reload(blocking=snapshot is None) or self._snapshot
+            except Exception as e:
+                print(f"Error reloading the analytics store: {str(e)}")
+
+        if snapshot is not None:
+            note_read_version(snapshot.version)
+        return snapshot
+
+    def reload(self, blocking=True):
+        """Load a new snapshot and swap it in; returns None if another reload is already running"""
+        if not self._lock.acquire(blocking=blocking):
+            return None
+        try:
+            # Read the version before the data, so a load that lands mid-reload triggers another one
+            version = get_data_version()
+            if self._snapshot is not None and self._snapshot.version == version:
+                return self._snapshot
+
+            tables = {(model, role): load_table(model, role) for role, model in INFO_MODELS.items()}
+            for role in INFO_MODELS:
+                tables[PlateAppearance, role] = load_table(PlateAppearance, role)
+
+            self._snapshot = Snapshot(version, tables)
+            print(f"Loaded analytics store at dataset version {version}.")
+            return self._snapshot
+        finally:
+            self._lock.release()
+
+
+def _kinds(model):
+    return {column.key: column_kind(column.type) for column in model.__table__.columns}
+
+
+def load_table(model, role):
+    table = model.__table__
+    query = select(*table.columns).order_by(table.c.player_id, *ROW_ORDER[model])
+    if model is PlateAppearance:
+        query = query.where(table.c.role == role)
+
+    rows = db.session.execute(query).all()
+    kinds = _kinds(model)
+    return PlayerTable({
+        name: typed_array(values, kinds[name])
+        for name, values in zip(table.columns.keys(), column_values(rows, len(table.columns)))
+    })
+
+
+column_store = ColumnStore()
+
+
+def player_columns(model, role, player_id, names, window=None):
+    """
+    Fetch ``names`` for one player's rows of ``model`` as typed column arrays.
+
+    Reads the analytics store when it is enabled and falls back to one
+    database query otherwise; both return the same arrays in the same row
+    order. For plate_appearance, ``role`` selects batting or pitching rows;
+    for the pitch tables it only decides how ``window`` ranks games.
+    """
+    snapshot = column_store.snapshot()
+    if snapshot is not None:
+        return snapshot.player_columns(model, role, player_id, names, window)
+
+    query = model.query.filter_by(player_id=player_id)
+    if model is PlateAppearance:
+        query = query.filter_by(role=role)
+
+    rows = apply_window(query, window, model, role)\
+        .with_entities(*(getattr(model, name) for name in names))\
+        .order_by(*ROW_ORDER[model])\
+        .all()
+
+    kinds = _kinds(model)
+    return {
+        name: typed_array(values, kinds[name])
+        for name, values in zip(names, column_values(rows, len(names)))
+    }
@@ -0,0 +1,93 @@
+import numpy as np
+from sqlalchemy import func, select, tuple_
+from ..models.player_game import PlayerGame
+
+
+class GameWindow:
+    """
+    A time window for the stat endpoints: an inclusive ``start_date`` to
+    ``end_date`` range and/or each player's last ``last_n_games`` games
+    (within that range, when one is given).
+    """
+
+    def __init__(self, start_date=None, end_date=None, last_n_games=None):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.last_n_games = last_n_games
+
+    def __bool__(self):
+        return any(value is not None for value in (self.start_date, self.end_date, self.last_n_games))
+
+    def cache_key(self):
+        return (self.start_date, self.end_date, self.last_n_games)
+
+    def date_conditions(self, model):
+        conditions = []
+        if self.start_date is not None:
+            conditions.append(model.game_date >= self.start_date)
+        if self.end_date is not None:
+            conditions.append(model.game_date <= self.end_date)
+        return conditions
+
+    def recent_games(self, role):
+        """Select (player_id, game_bam_id) for each player's last ``last_n_games`` games, from player_game"""
+        rank = func.row_number().over(
+            partition_by=PlayerGame.player_id,
+            order_by=(PlayerGame.game_date.desc(), PlayerGame.game_bam_id.desc())
+        )
+        ranked = select(PlayerGame.player_id, PlayerGame.game_bam_id, rank.label('game_rank'))\
+            .where(PlayerGame.role == role, *self.date_conditions(PlayerGame))\
+            .subquery()
+        return select(ranked.c.player_id, ranked.c.game_bam_id).where(ranked.c.game_rank <= self.last_n_games)
+
+    def conditions(self, model, role):
+        """Filter conditions restricting ``model`` (any table with player_id, game_bam_id and game_date) to the window"""
+        conditions = self.date_conditions(model)
+        if self.last_n_games is not None:
+            conditions.append(tuple_(model.player_id, model.game_bam_id).in_(self.recent_games(role)))
+        return conditions
+
+
+    def mask(self, game_dates, game_ids, player_games):
+        """
+        Boolean mask of the rows of one player's column arrays inside the
+        window. ``player_games`` is the (game_dates, game_ids) of the player's
+        pitches in the role, from which their last games are ranked the same
+        way ``recent_games`` ranks player_game rows.
+        """
+        keep = self.date_mask(game_dates)
+        if self.last_n_games is not None:
+            keep &= np.isin(game_ids, self.recent_game_ids(*player_games))
+        return keep
+
+    def date_mask(self, game_dates):
+        keep = np.ones(len(game_dates), dtype=bool)
+        if self.start_date is not None:
+            keep &= game_dates >= np.datetime64(self.start_date)
+        if self.end_date is not None:
+            keep &= game_dates <= np.datetime64(self.end_date)
+        return keep
+
+    def recent_game_ids(self, game_dates, game_ids):
+        """Ids of the last ``last_n_games`` games among one player's pitch columns, within the date range"""
+        known = ~np.isnan(game_ids)
+        game_dates, game_ids = game_dates[known], game_ids[known]
+
+        # Each game's earliest date, as player_game stores it
+        order = np.lexsort((game_dates, game_ids))
+        ids, first = np.unique(game_ids[order], return_index=True)
+        dates = game_dates[order][first]
+
+        in_range = self.date_mask(dates)
+        ids, dates = ids[in_range], dates[in_range]
+
+        # game_date DESC puts NULL dates first, like the database
+        latest_first = np.lexsort((ids, dates))[::-1]
+        return ids[latest_first][:self.last_n_games]
+
+
+def apply_window(query, window, model, role):
+    """Restrict ``query`` over ``model`` to ``window``; a no-op when there is no window"""
+    if not window:
+        return query
+    return query.filter(*window.conditions(model, role))
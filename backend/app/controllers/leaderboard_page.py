@@ -0,0 +1,146 @@
+import base64
+import binascii
+import json
+from sqlalchemy import Double, Float, Numeric, asc, cast, desc, func, select, tuple_, type_coerce
+from sqlalchemy.orm import aliased
+from .. import db
+from ..models.player import Player
+from ..models.player_game import PlayerGame
+from .game_window import apply_window
+
+NAME_COLUMNS = ('first_name', 'last_name')
+ORDERS = {'asc': asc, 'desc': desc}
+MAX_LIMIT = 1000
+
+
+def sortable_columns(model):
+    """Every leaderboard column except the player's name"""
+    return tuple(column.name for column in model.__table__.columns if column.name not in NAME_COLUMNS)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor):
+    """Decode a cursor from ``encode_cursor``; raises ValueError if it was not produced by it"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("malformed cursor")
+
+    if (not isinstance(values, list) or len(values) != 4
+            or not isinstance(values[0], (int, float)) or not isinstance(values[1], int)
+            or not all(name is None or isinstance(name, str) for name in values[2:])):
+        raise ValueError("malformed cursor")
+    return values
+
+
+def sort_expression(model, sort):
+    """
+    ``model``'s ``sort`` column as the keyset sorts on it: NULL as 0, and
+    Numeric percentages as double precision, so the float a cursor carries
+    compares equal to the row it was taken from instead of just above or
+    below its exact numeric value
+    """
+    column = getattr(model, sort)
+    if isinstance(column.type, Numeric) and not isinstance(column.type, Float):
+        column = cast(column, Double)
+    return func.coalesce(column, 0)
+
+
+def _ratio(numerator, denominator):
+    return numerator / func.nullif(denominator, 0)
+
+
+def windowed_leaderboard(model, role, window):
+    """
+    Recompute a leaderboard view over ``window`` from player_game rows.
+
+    Returns ``model`` aliased onto the aggregate, with the same columns and
+    definitions as the materialized view, so ``leaderboard_page`` can read
+    it in place of the view.
+    """
+    return aliased(model, leaderboard_select(model, role, window).subquery(), adapt_on_names=True)
+
+
+def leaderboard_select(model, role, window=None):
+    """Select ``model``'s leaderboard columns aggregated from player_game rows, optionally over ``window``"""
+    games = apply_window(
+        db.session.query(PlayerGame).filter(PlayerGame.role == role),
+        window, PlayerGame, role
+    ).subquery()
+
+    exit_velos = select(games.c.player_id, func.unnest(games.c.exit_velos).label('exit_velo')).subquery()
+    ev50 = select(
+        exit_velos.c.player_id,
+        func.percentile_cont(0.5).within_group(exit_velos.c.exit_velo.desc()).label('ev50')
+    ).group_by(exit_velos.c.player_id).subquery()
+
+    bbe = func.sum(games.c.bbe)
+    hard_hits = func.sum(games.c.hard_hits)
+    barrels = func.sum(games.c.barrels)
+    columns = {
+        'player_id': games.c.player_id,
+        'first_name': Player.first_name,
+        'last_name': Player.last_name,
+        'bbe': bbe,
+        'launch_angle': _ratio(func.sum(games.c.launch_angle_sum), func.sum(games.c.launch_angle_count)),
+        'max_exit_velo': func.max(games.c.exit_velo_max),
+        'avg_exit_velo': _ratio(func.sum(games.c.exit_velo_sum), func.sum(games.c.exit_velo_count)),
+        'ev50': func.max(ev50.c.ev50),
+        'max_distance': func.max(games.c.distance_max),
+        'avg_distance': _ratio(func.sum(games.c.distance_sum), func.sum(games.c.distance_count)),
+        'ninety_five_plus': hard_hits,
+        'hard_hit_pct': _ratio(hard_hits * 100.0, bbe),
+        'la_sweet_spot_pct': _ratio(func.sum(games.c.sweet_spots) * 100.0, bbe),
+        'barrels': barrels,
+        'barrel_pct': _ratio(barrels * 100.0, bbe),
+        'avg_velocity': _ratio(func.sum(games.c.rel_speed_sum), func.sum(games.c.rel_speed_count)),
+        'max_velocity': func.max(games.c.rel_speed_max),
+        'avg_spin_rate': _ratio(func.sum(games.c.spin_rate_sum), func.sum(games.c.spin_rate_count)),
+        'hard_hits_calculated': hard_hits,
+    }
+
+    return select(*(
+        type_coerce(columns[column.name], column.type).label(column.name)
+        for column in model.__table__.columns
+    ))\
+        .select_from(games)\
+        .join(Player, Player.player_id == games.c.player_id)\
+        .outerjoin(ev50, ev50.c.player_id == games.c.player_id)\
+        .group_by(games.c.player_id, Player.first_name, Player.last_name)\
+        .having(bbe > 0)
+
+
+def leaderboard_page(model, sort, order, min_bbe=None, limit=None, cursor=None):
+    """
+    Read one page of a leaderboard view, filtered, sorted and paginated in the database.
+
+    Rows are ordered by ``sort_expression`` and then by player, so the
+    keyset ``cursor`` from one page resumes exactly after its last row.
+    Returns (rows, next_cursor), where next_cursor is None on the last page.
+    """
+    sort_key = sort_expression(model, sort)
+    keys = (sort_key, model.player_id, model.first_name, model.last_name)
+    direction = ORDERS[order]
+
+    # The cursor carries the sort key as the database computed it, not the row's attribute
+    query = db.session.query(model, sort_key)
+    if min_bbe is not None:
+        query = query.filter(func.coalesce(model.bbe, 0) >= min_bbe)
+    if cursor is not None:
+        position, after = tuple_(*keys), tuple_(*decode_cursor(cursor))
+        query = query.filter(position < after if order == 'desc' else position > after)
+
+    query = query.order_by(*(direction(key) for key in keys))
+    if limit is None:
+        return [row for row, _ in query], None
+
+    results = query.limit(limit + 1).all()
+    rows = [row for row, _ in results[:limit]]
+    if len(results) <= limit:
+        return rows, None
+
+    last, sort_value = results[limit - 1]
+    return rows, encode_cursor([sort_value, last.player_id, last.first_name, last.last_name])
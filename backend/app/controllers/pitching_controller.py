@@ -1,101 +1,79 @@
 from sqlalchemy import func
-from sqlalchemy.sql import case, and_ 
-from collections import defaultdict
+from sqlalchemy.sql import case
+from collections import Counter
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from ..models.pitching import PitchingInfo
+from ..models.leaderboard import PitchingLeaderboard
+from .leaderboard_page import leaderboard_page, windowed_leaderboard
+from .game_window import apply_window
+from .column_store import column_store, player_columns
+from ..models.plate_appearance import PlateAppearance
+from ..models.dataset_version import get_data_version, read_other_version
+from ..analytics import (
+    LRUCache, binned_kde, scott_factor, column_values, column_kind, typed_array, nullable, float_array,
+    stratified_sample, label_centroids
+)
 import numpy as np
 
+TRACKED_PITCH_TYPES = ['4S', '2S', 'SL', 'CB', 'SW', 'CH', 'CT', 'SP', 'KN']
+DISTRIBUTION_CACHE = LRUCache(maxsize=4096)
+PITCHING_TOTALS = ('games', 'outs', 'strikeouts', 'walks', 'hits', 'earned_runs')
+MOVEMENT_COLUMNS = ('horz_break', 'induced_vert_break', 'rel_speed')
+INFO_COLUMNS = ('game_date', 'pitch_type', *MOVEMENT_COLUMNS)
+INFO_KINDS = {name: column_kind(PitchingInfo.__table__.c[name].type) for name in INFO_COLUMNS}
+TOTAL_COLUMNS = ('game_bam_id', 'outs', 'is_strikeout', 'is_walk', 'is_hit', 'runs')
+
 class PitchingController:
     @staticmethod
-    def calculate_pitching_stats(player_id):
-        """Calculate all pitching statistics for a player"""
-        pitches = PitchingInfo.query.filter_by(player_id=player_id).order_by(
-            PitchingInfo.game_date,
-            PitchingInfo.game_bam_id,
-            PitchingInfo.inning,
-            PitchingInfo.at_bat_number,
-            PitchingInfo.pitch_seq
-        ).all()
-        
-        if not pitches:
-            return None
+    def _pitching_total_columns():
+        def count_if(flag):
+            return func.coalesce(func.sum(case((flag, 1), else_=0)), 0)
+
+        return [
+            func.count(func.distinct(PlateAppearance.game_bam_id)).label('games'),
+            func.coalesce(func.sum(PlateAppearance.outs), 0).label('outs'),
+            count_if(PlateAppearance.is_strikeout).label('strikeouts'),
+            count_if(PlateAppearance.is_walk).label('walks'),
+            count_if(PlateAppearance.is_hit).label('hits'),
+            func.coalesce(func.sum(PlateAppearance.runs), 0).label('earned_runs')
+        ]
+
+    @staticmethod
+    def _pitching_totals(columns):
+        """The _pitching_total_columns aggregates from one pitcher's plate appearance columns"""
+        game_ids = columns['game_bam_id']
+        return {
+            'games': int(np.unique(game_ids[~np.isnan(game_ids)]).size),
+            'outs': int(np.nansum(columns['outs'])),
+            'strikeouts': int(np.count_nonzero(columns['is_strikeout'])),
+            'walks': int(np.count_nonzero(columns['is_walk'])),
+            'hits': int(np.count_nonzero(columns['is_hit'])),
+            'earned_runs': int(np.nansum(columns['runs']))
+        }
 
-        unique_games = len(set(pitch.game_bam_id for pitch in pitches))
-
-        game_inning_outs = defaultdict(int)
-        for pitch in pitches:
-            if pitch.post_outs is not None and pitch.pre_outs is not None:
-                game_key = (pitch.game_bam_id, pitch.inning)
-                outs = pitch.post_outs - pitch.pre_outs
-                if outs > 0:
-                    game_inning_outs[game_key] += outs
-        total_outs = sum(outs for outs in game_inning_outs.values())
-        innings_pitched = total_outs / 3
-
-        strikeouts = len(set(
-            (pitch.game_bam_id, pitch.at_bat_number)
-            for pitch in pitches 
-            if pitch.event_type == 'strikeout'
-        ))
-
-        walks = len(set(
-            (pitch.game_bam_id, pitch.at_bat_number)
-            for pitch in pitches 
-            if pitch.event_type == 'walk'
-        ))
-
-        hits = len(set(
-            (pitch.game_bam_id, pitch.at_bat_number)
-            for pitch in pitches 
-            if pitch.event_type in ['single', 'double', 'triple', 'home_run']
-        ))
-
-        earned_runs = 0
-        current_game = None
-        inning_runs = defaultdict(int)
-        processed_abs = set()
-
-        for pitch in pitches:
-            if current_game != pitch.game_bam_id:
-                current_game = pitch.game_bam_id
-                inning_runs.clear()
-                processed_abs.clear()
-
-            ab_key = (pitch.game_bam_id, pitch.at_bat_number)
-            if ab_key not in processed_abs:
-                if (pitch.event_type in [
-                    'single', 'double', 'triple', 'home_run',  
-                    'sacrifice_fly', 'sacrifice_bunt',         
-                    'field_out', 'force_out', 'ground_out'    
-                ] and pitch.post_vscore is not None 
-                   and pitch.pre_vscore is not None 
-                   and pitch.post_vscore > pitch.pre_vscore):
-                    
-                    run_diff = pitch.post_vscore - pitch.pre_vscore
-                    inning_key = (pitch.game_bam_id, pitch.inning)
-                    inning_runs[inning_key] += run_diff
-                    earned_runs += run_diff
-
-                processed_abs.add(ab_key)
+    @staticmethod
+    def _pitching_stats(totals, usage_counts):
+        """Build the pitching stats dict from plate appearance totals and pitch counts by type"""
+        innings_pitched = totals.get('outs', 0) / 3
+        earned_runs = int(totals.get('earned_runs', 0))
+        walks = int(totals.get('walks', 0))
+        hits = int(totals.get('hits', 0))
 
         era = (earned_runs * 9) / innings_pitched if innings_pitched > 0 else 0
         whip = (walks + hits) / innings_pitched if innings_pitched > 0 else 0
 
-        total_pitches = len(pitches)
-        pitch_usage = defaultdict(int)
-        
-        for pitch in pitches:
-            if pitch.pitch_type:
-                pitch_usage[pitch.pitch_type] += 1
-        
+        total_pitches = sum(usage_counts.values())
         pitch_usage = {
-            pitch_type: (count / total_pitches) * 100 
-            for pitch_type, count in pitch_usage.items()
+            pitch_type: (count / total_pitches) * 100
+            for pitch_type, count in usage_counts.items()
+            if pitch_type
         }
 
         return {
-            'games': unique_games,
+            'games': totals.get('games', 0),
             'innings_pitched': round(innings_pitched, 1),
-            'strikeouts': strikeouts,
+            'strikeouts': int(totals.get('strikeouts', 0)),
             'earned_runs': earned_runs,
             'walks': walks,
             'hits': hits,
@@ -105,190 +83,356 @@ class PitchingController:
         }
 
     @staticmethod
-    def get_pitch_movement_data(player_id):
-        """Get individual pitch movement data"""
-        return PitchingInfo.query.filter_by(player_id=player_id).all()
+    def get_pitching_info(player_id, max_points=None, window=None):
+        """Get movement data and stats for one pitcher, or None when they have no pitches"""
+        return PitchingController.get_pitching_info_for_players([player_id], max_points, window).get(player_id)
+
+    @staticmethod
+    def get_pitching_info_for_players(player_ids=None, max_points=None, window=None):
+        """
+        Get movement data and stats keyed by player (every player when ``player_ids`` is None).
+
+        Pitch columns and the plate appearance totals come back in one query,
+        the totals joined onto every pitch row; each player's rows are then
+        walked once to count pitch types and once to build the payload.
+
+        With ``max_points``, each player's pitch_data is downsampled to at most
+        that many pitches, stratified by pitch type, and the payload gains
+        per-type ``centroids`` computed over every pitch.
+        """
+        snapshot = column_store.snapshot()
+        if snapshot is not None:
+            if player_ids is None:
+                player_ids = snapshot.player_ids(PitchingInfo, 'pitching')
+
+            result = {}
+            for player_id in player_ids:
+                columns, totals = PitchingController._stored_info_columns(snapshot, player_id, window)
+                if columns['pitch_type'].size:
+                    result[player_id] = PitchingController._pitching_info(columns, totals, max_points)
+            return result
+
+        rows = PitchingController._pitch_rows_with_totals(player_ids, window)
+
+        return {
+            player_id: PitchingController._pitching_info(
+                *PitchingController._info_columns(list(player_rows)), max_points
+            )
+            for player_id, player_rows in groupby(rows, key=attrgetter('player_id'))
+        }
+
+    @staticmethod
+    def _stored_info_columns(snapshot, player_id, window=None):
+        """One pitcher's pitch columns and plate appearance totals from the analytics store"""
+        columns = snapshot.player_columns(PitchingInfo, 'pitching', player_id, INFO_COLUMNS, window)
+        totals = PitchingController._pitching_totals(
+            snapshot.player_columns(PlateAppearance, 'pitching', player_id, TOTAL_COLUMNS, window)
+        )
+        return columns, totals
+
+    @staticmethod
+    def _info_columns(player_rows):
+        """Split one pitcher's rows from _pitch_rows_with_totals into typed pitch columns and their totals"""
+        values = column_values(player_rows, 1 + len(INFO_COLUMNS))[1:]
+        columns = {
+            name: typed_array(column, INFO_KINDS[name])
+            for name, column in zip(INFO_COLUMNS, values)
+        }
+        totals = {name: getattr(player_rows[0], name) or 0 for name in PITCHING_TOTALS} if player_rows else {}
+        return columns, totals
+
+    @staticmethod
+    def _pitch_rows_with_totals(player_ids=None, window=None):
+        """Pitch rows for ``player_ids`` with each player's plate appearance totals joined on, in one query"""
+        pitches = PitchingInfo.query
+        totals = PlateAppearance.query.filter_by(role='pitching')
+        if player_ids is not None:
+            pitches = pitches.filter(PitchingInfo.player_id.in_(player_ids))
+            totals = totals.filter(PlateAppearance.player_id.in_(player_ids))
+        pitches = apply_window(pitches, window, PitchingInfo, 'pitching')
+        totals = apply_window(totals, window, PlateAppearance, 'pitching')
+
+        totals = totals\
+            .with_entities(PlateAppearance.player_id, *PitchingController._pitching_total_columns())\
+            .group_by(PlateAppearance.player_id)\
+            .subquery()
+
+        return pitches\
+            .outerjoin(totals, totals.c.player_id == PitchingInfo.player_id)\
+            .with_entities(
+                PitchingInfo.player_id,
+                PitchingInfo.game_date,
+                PitchingInfo.pitch_type,
+                PitchingInfo.horz_break,
+                PitchingInfo.induced_vert_break,
+                PitchingInfo.rel_speed,
+                *(totals.c[name] for name in PITCHING_TOTALS)
+            )\
+            .order_by(PitchingInfo.player_id, PitchingInfo.id)\
+            .all()
+
+    @staticmethod
+    def _pitching_info(columns, totals, max_points=None):
+        """Build one pitcher's /pitching/info payload from their pitch columns and plate appearance totals"""
+        pitch_types = columns['pitch_type'].tolist()
+        stats = PitchingController._pitching_stats(totals, Counter(pitch_types))
+        pitch_usage = stats['pitch_usage']
+        payload = {}
+        rows = slice(None)
+
+        if max_points is not None:
+            payload["centroids"] = label_centroids(pitch_types, {name: columns[name] for name in MOVEMENT_COLUMNS})
+            payload["total_pitches"] = len(pitch_types)
+            rows = stratified_sample(pitch_types, max_points)
+
+        return {
+            "pitch_data": [
+                {
+                    "game_date": game_date.strftime('%Y-%m-%d') if game_date else None,
+                    "pitch_type": pitch_type,
+                    "horz_break": horz_break,
+                    "induced_vert_break": induced_vert_break,
+                    "rel_speed": rel_speed,
+                    "usage": pitch_usage.get(pitch_type, 0)
+                }
+                for game_date, pitch_type, horz_break, induced_vert_break, rel_speed in zip(
+                    columns['game_date'][rows].tolist(), columns['pitch_type'][rows].tolist(),
+                    *(nullable(columns[name][rows]) for name in MOVEMENT_COLUMNS)
+                )
+            ],
+            "stats": stats,
+            **payload
+        }
     
     @staticmethod
-    def get_pitch_usage_by_date(player_id):
+    def get_pitch_usage_by_date(player_id, window=None):
         """Get pitch usage (percentage and quantity) grouped by date and pitch type"""
-        pitches = PitchingInfo.query.filter_by(player_id=player_id)\
-            .order_by(PitchingInfo.game_date)\
+        snapshot = column_store.snapshot()
+        if snapshot is not None:
+            columns = snapshot.player_columns(PitchingInfo, 'pitching', player_id, ('game_date', 'pitch_type'), window)
+            tracked = np.isin(columns['pitch_type'], TRACKED_PITCH_TYPES)
+            counts = PitchingController._date_type_counts(columns['game_date'], columns['pitch_type'], tracked)
+            return PitchingController._usage_by_date(counts) if counts else None
+
+        query = PitchingInfo.query.filter_by(player_id=player_id)
+        counts = apply_window(query, window, PitchingInfo, 'pitching')\
+            .filter(PitchingInfo.game_date.isnot(None))\
+            .filter(PitchingInfo.pitch_type.in_(TRACKED_PITCH_TYPES))\
+            .with_entities(PitchingInfo.game_date, PitchingInfo.pitch_type, func.count().label('quantity'))\
+            .group_by(PitchingInfo.game_date, PitchingInfo.pitch_type)\
+            .order_by(PitchingInfo.game_date, PitchingInfo.pitch_type)\
             .all()
         
-        if not pitches:
+        if not counts:
             return None
 
-        usage_data = defaultdict(lambda: defaultdict(int))
-        total_pitches_by_date = defaultdict(int)
-
-        for pitch in pitches:
-            if pitch.game_date and pitch.pitch_type:
-                if pitch.pitch_type not in ['4S', '2S', 'SL', 'CB', 'SW', 'CH', 'CT', 'SP', 'KN']:
-                    continue
-                    
-                usage_data[pitch.game_date][pitch.pitch_type] += 1
-                total_pitches_by_date[pitch.game_date] += 1
+        return PitchingController._usage_by_date(counts)
 
+    @staticmethod
+    def _usage_by_date(counts):
+        """Build the usage-by-date payload from (game_date, pitch_type, quantity) groups ordered by date"""
         usage_statistics = []
-        for date, pitch_counts in sorted(usage_data.items()):
-            total_pitches = total_pitches_by_date[date]
-            if total_pitches > 0:  
-                for pitch_type, count in pitch_counts.items():
-                    usage_statistics.append({
-                        "date": date.strftime('%Y-%m-%d'),
-                        "pitch_type": pitch_type,
-                        "quantity": count,
-                        "percentage": round((count / total_pitches) * 100, 1)
-                    })
+        for date, date_counts in groupby(counts, key=itemgetter(0)):
+            date_counts = list(date_counts)
+            total_pitches = sum(quantity for _, _, quantity in date_counts)
+            for _, pitch_type, quantity in date_counts:
+                usage_statistics.append({
+                    "date": date.strftime('%Y-%m-%d'),
+                    "pitch_type": pitch_type,
+                    "quantity": quantity,
+                    "percentage": round((quantity / total_pitches) * 100, 1)
+                })
 
         return usage_statistics
     
     @staticmethod
-    def get_pitch_distribution(player_id):
-        """Get pitch distribution data for velocity chart"""
+    def get_pitch_distribution(player_id, window=None):
+        """Get pitch distribution data for velocity chart, cached per (player_id, pitch_type, data_version)"""
         try:
-            pitches = PitchingInfo.query.filter_by(player_id=player_id)\
-                .filter(PitchingInfo.rel_speed.isnot(None))\
-                .filter(PitchingInfo.pitch_type.isnot(None))\
-                .all()
-            
-            if not pitches:
-                return None
+            player_id = int(player_id)
+            version = (get_data_version(), window.cache_key() if window else None)
 
-            pitch_groups = defaultdict(list)
-            for pitch in pitches:
-                if pitch.pitch_type not in ['4S', '2S', 'SL', 'CB', 'SW', 'CH', 'CT', 'SP', 'KN']:
-                    continue
-                pitch_groups[pitch.pitch_type].append(pitch.rel_speed)
-
-            from scipy import stats
-
-            distribution_data = []
-            for pitch_type, speeds in pitch_groups.items():
-                if len(speeds) < 2:
-                    continue
-
-                speeds_array = np.array(speeds)
-                
-                scott_factor = len(speeds) ** (-1./5)  
-                adjusted_bw = scott_factor * 0.8  
-                
-                kde = stats.gaussian_kde(speeds_array, bw_method=adjusted_bw)
-                
-                x_range = np.linspace(70, 100, 62) 
-                density = kde(x_range)
-                
-                raw_peak_idx = np.argmax(density)
-                raw_peak = density[raw_peak_idx]
-
-                scale_factors = {
-                    '4S': 29.7 / 100,  
-                    'SL': 27.3 / 100,  
-                    'SP': 35.0 / 100, 
-                    'SW': 28.6 / 100   
-                }
-                
-                scale_factor = scale_factors.get(pitch_type, 0.3)  
-                density_normalized = (density / raw_peak) * 100 * scale_factor
-                
-                peak_idx = np.argmax(density_normalized)
-                peak = {
-                    'speed': float(x_range[peak_idx]),
-                    'frequency': float(density_normalized[peak_idx])
-                }
+            cached = PitchingController._cached_distribution(player_id, version)
+            if cached is not None:
+                return cached
 
-                points = []
-                for i in range(len(x_range)):
-                    points.append({
-                        'speed': float(x_range[i]),
-                        'frequency': float(density_normalized[i])
-                    })
-
-                distribution_data.append({
-                    'pitch_type': pitch_type,
-                    'distribution': points,
-                    'peak': peak,
-                    'total_count': len(speeds)
-                })
+            columns = player_columns(PitchingInfo, 'pitching', player_id, ('pitch_type', 'rel_speed'), window)
+            pitch_types, speeds = PitchingController._tracked_speeds(columns)
+            if not pitch_types.size:
+                return None
 
-            return distribution_data
+            return PitchingController._distribution(player_id, version, pitch_types, speeds)
 
         except Exception as e:
             print(f"Error in get_pitch_distribution: {str(e)}")
             return None
-        
 
+    @staticmethod
+    def _tracked_speeds(columns):
+        """Pitch types and release speeds of the tracked pitch types with a recorded speed"""
+        keep = np.isin(columns['pitch_type'], TRACKED_PITCH_TYPES) & ~np.isnan(columns['rel_speed'])
+        return columns['pitch_type'][keep], columns['rel_speed'][keep]
+
+    @staticmethod
+    def _cached_distribution(player_id, version):
+        """The cached velocity curves for ``player_id`` at ``version``, or None when any is missing"""
+        pitch_types = DISTRIBUTION_CACHE.get((player_id, None, version))
+        if pitch_types is None:
+            return None
+
+        curves = [DISTRIBUTION_CACHE.get((player_id, pitch_type, version)) for pitch_type in pitch_types]
+        return curves if all(curve is not None for curve in curves) else None
 
     @staticmethod
-    def get_pitching_leaderboard():
-        """Generate pitching leaderboard statistics following Baseball Savant format."""
+    def _distribution(player_id, version, pitch_type_column, speed_column):
+        """
+        Velocity curves per pitch type from tracked-type pitch columns, stored
+        in the cache under ``version`` (data version, window key) unless they
+        were built from an analytics store snapshot of another data version
+        """
+        cacheable = not read_other_version(version[0])
+        pitch_type_array = np.asarray(pitch_type_column, dtype=object)
+        speed_array = float_array(speed_column)
+
+        distribution_data = []
+        for pitch_type in sorted(set(pitch_type_array.tolist())):
+            speeds_array = speed_array[pitch_type_array == pitch_type]
+            curve = PitchingController._velocity_curve(pitch_type, speeds_array)
+            if curve is None:
+                continue
+
+            if cacheable:
+                DISTRIBUTION_CACHE.set((player_id, pitch_type, version), curve)
+            distribution_data.append(curve)
+
+        if cacheable:
+            DISTRIBUTION_CACHE.set((player_id, None, version), tuple(curve['pitch_type'] for curve in distribution_data))
+        return distribution_data
+
+    @staticmethod
+    def _velocity_curve(pitch_type, speeds_array):
+        """Binned KDE of one pitch type's velocities, scaled to that type's peak frequency"""
+        if len(speeds_array) < 2:
+            return None
+
+        adjusted_bw = scott_factor(len(speeds_array)) * 0.8
+
+        x_range = np.linspace(70, 100, 62)
+        density = binned_kde(speeds_array, x_range, adjusted_bw)
+        if density is None:
+            return None
+
+        raw_peak_idx = np.argmax(density)
+        raw_peak = density[raw_peak_idx]
+
+        scale_factors = {
+            '4S': 29.7 / 100,
+            'SL': 27.3 / 100,
+            'SP': 35.0 / 100,
+            'SW': 28.6 / 100
+        }
+
+        scale_factor = scale_factors.get(pitch_type, 0.3)
+        density_normalized = (density / raw_peak) * 100 * scale_factor
+
+        peak_idx = np.argmax(density_normalized)
+        peak = {
+            'speed': float(x_range[peak_idx]),
+            'frequency': float(density_normalized[peak_idx])
+        }
+
+        points = [
+            {'speed': float(speed), 'frequency': float(frequency)}
+            for speed, frequency in zip(x_range, density_normalized)
+        ]
+
+        return {
+            'pitch_type': pitch_type,
+            'distribution': points,
+            'peak': peak,
+            'total_count': len(speeds_array)
+        }
+        
+
+    @staticmethod
+    def get_dashboard(player_id, max_points=None, window=None):
+        """
+        Build every pitching modal panel (movement and stats, usage by date
+        and velocity distribution) from one query.
+
+        The player's pitch rows come back once, with their plate appearance
+        totals joined on, and each panel is computed from those rows; with
+        the analytics store enabled they are read from the store instead.
+        Returns None when the player has no pitches.
+        """
         try:
-            bbe_subquery = (
-                PitchingInfo.query
-                .with_entities(
-                    PitchingInfo.player_id,
-                    func.count().label('bbe')
+            player_id = int(player_id)
+            snapshot = column_store.snapshot()
+            if snapshot is not None:
+                columns, totals = PitchingController._stored_info_columns(snapshot, player_id, window)
+            else:
+                columns, totals = PitchingController._info_columns(
+                    PitchingController._pitch_rows_with_totals([player_id], window)
                 )
-                .filter(PitchingInfo.in_play == True)
-                .group_by(PitchingInfo.player_id)
-                .subquery()
-            )
+            if not columns['pitch_type'].size:
+                return None
 
-            query = (
-                PitchingInfo.query
-                .with_entities(
-                    PitchingInfo.player_id,
-                    PitchingInfo.first_name,
-                    PitchingInfo.last_name,
-                    bbe_subquery.c.bbe.label('bbe'),
-                    func.avg(PitchingInfo.hit_vertical_angle).label('launch_angle'),
-                    (func.count(case(
-                        (and_(
-                            PitchingInfo.hit_vertical_angle >= 8,
-                            PitchingInfo.hit_vertical_angle <= 32
-                        ), 1)
-                    )) * 100.0 / func.count()).label('la_sweet_spot_pct'),
-                    func.avg(PitchingInfo.hit_exit_speed).label('avg_exit_velo'),
-                    func.max(PitchingInfo.hit_exit_speed).label('max_exit_velo'),
-                    func.percentile_cont(0.5).within_group(
-                        PitchingInfo.hit_exit_speed.desc()
-                    ).label('ev50'),
-                    (func.count(case(
-                        (PitchingInfo.hit_exit_speed >= 95, 1)
-                    )) * 100.0 / func.nullif(func.count(), 0)).label('hard_hit_pct'),
-                    func.avg(PitchingInfo.hit_distance).label('avg_distance'),
-                    func.max(PitchingInfo.hit_distance).label('max_distance'),
-                    func.count(case(
-                        (and_(
-                            PitchingInfo.hit_exit_speed >= 98,
-                            PitchingInfo.hit_vertical_angle.between(8, 32)
-                        ), 1)
-                    )).label('barrels'),
-                    (func.count(case(
-                        (and_(
-                            PitchingInfo.hit_exit_speed >= 98,
-                            PitchingInfo.hit_vertical_angle.between(8, 32)
-                        ), 1)
-                    )) * 100.0 / func.nullif(func.count(), 0)).label('barrel_pct'),
-                    func.avg(PitchingInfo.rel_speed).label('avg_velocity'),
-                    func.max(PitchingInfo.rel_speed).label('max_velocity'),
-                    func.avg(PitchingInfo.spin_rate).label('avg_spin_rate'),
-                    func.coalesce(
-                        func.count(case(
-                            (PitchingInfo.hit_exit_speed >= 95, 1)
-                        )), 0
-                    ).label('hard_hits_calculated')
-                )
-                .outerjoin(bbe_subquery, PitchingInfo.player_id == bbe_subquery.c.player_id)
-                .filter(PitchingInfo.in_play == True)
-                .group_by(
-                    PitchingInfo.player_id,
-                    PitchingInfo.first_name,
-                    PitchingInfo.last_name,
-                    bbe_subquery.c.bbe
+            tracked = np.isin(columns['pitch_type'], TRACKED_PITCH_TYPES)
+
+            version = (get_data_version(), window.cache_key() if window else None)
+            distribution = PitchingController._cached_distribution(player_id, version)
+            if distribution is None:
+                distribution = PitchingController._distribution(
+                    player_id, version, *PitchingController._tracked_speeds(columns)
                 )
-                .all()
+
+            return {
+                "info": PitchingController._pitching_info(columns, totals, max_points),
+                "usage_by_date": PitchingController._usage_by_date(
+                    PitchingController._date_type_counts(columns['game_date'], columns['pitch_type'], tracked)
+                ),
+                "distribution": distribution
+            }
+
+        except Exception as e:
+            import traceback
+            print(f"Error in get_dashboard: {str(e)}")
+            print(traceback.format_exc())
+            return None
+
+    @staticmethod
+    def _date_type_counts(dates, pitch_types, tracked):
+        """Count tracked pitches per (game_date, pitch_type), ordered by date and type, as (game_date, pitch_type, quantity) groups"""
+        days = np.array(dates, dtype='datetime64[D]')
+        keep = tracked & ~np.isnat(days)
+        if not keep.any():
+            return []
+
+        labels = np.array(pitch_types, dtype=object)[keep].astype(str)
+        type_keys, type_index = np.unique(labels, return_inverse=True)
+        keys, counts = np.unique(
+            np.column_stack((days[keep].astype(np.int64), type_index.reshape(-1))),
+            axis=0, return_counts=True
+        )
+        day_values = keys[:, 0].astype('datetime64[D]').astype(object)
+        return [
+            (day, str(type_keys[type_id]), int(count))
+            for day, type_id, count in zip(day_values, keys[:, 1], counts)
+        ]
+
+    @staticmethod
+    def get_pitching_leaderboard(sort='avg_exit_velo', order='asc', min_bbe=None, limit=None, cursor=None, window=None):
+        """Generate pitching leaderboard statistics following Baseball Savant format.
+
+        Reads the precomputed pitching_leaderboard materialized view, which is
+        refreshed at the end of each ingest, or recomputes it from player_game
+        rows over ``window``. Filtering, sorting and keyset pagination happen
+        in the database; returns (rows, next_cursor).
+        """
+        try:
+            source = windowed_leaderboard(PitchingLeaderboard, 'pitching', window) if window else PitchingLeaderboard
+            query, next_cursor = leaderboard_page(
+                source, sort, order, min_bbe=min_bbe, limit=limit, cursor=cursor
             )
 
             result = []
@@ -313,7 +457,7 @@ class PitchingController:
                     'hard_hits_calculated': row.hard_hits_calculated or 0
                 })
 
-            return sorted(result, key=lambda x: x['avg_exit_velo'])
+            return result, next_cursor
 
         except Exception as e:
             import traceback
@@ -0,0 +1,75 @@
+"""
+Embedded DuckDB query backend over Parquet exports.
+
+With ``QUERY_BACKEND=duckdb``, create_app points SQLAlchemy at an in-memory
+DuckDB database instead of PostgreSQL. Every new connection creates one
+view per exported table over ``read_parquet`` in ``PARQUET_DIR`` (written
+by ``utils/export_parquet.py``), plus the batting and pitching leaderboard
+views, so the controllers run their usual SQL unchanged. The leaderboards
+are aggregated from player_game with the same definitions the windowed
+leaderboards use, ``percentile_cont`` included.
+
+The backend is read-only: load data into PostgreSQL and re-export it.
+"""
+import os
+from pathlib import Path
+from sqlalchemy import event
+
+# Tables exported to Parquet, in dependency order
+EXPORTED_TABLES = (
+    'player_bio', 'batting_info', 'pitching_info', 'plate_appearance', 'player_game', 'dataset_version'
+)
+DEFAULT_PARQUET_DIR = Path(__file__).resolve().parent.parent / "data" / "parquet"
+
+
+def configure_duckdb(app):
+    """Point the app at an in-memory DuckDB database; call before ``db.init_app``"""
+    app.config['PARQUET_DIR'] = os.getenv('PARQUET_DIR', str(DEFAULT_PARQUET_DIR))
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'duckdb:///:memory:'
+
+
+def parquet_path(parquet_dir, table):
+    return Path(parquet_dir) / f"{table}.parquet"
+
+
+def _view_statements(app):
+    from . import db
+    from .models.leaderboard import BattingLeaderboard, PitchingLeaderboard
+    from .controllers.leaderboard_page import leaderboard_select
+
+    statements = []
+    for table in EXPORTED_TABLES:
+        path = parquet_path(app.config['PARQUET_DIR'], table).as_posix().replace("'", "''")
+        statements.append(f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{path}')")
+
+    for model, role in ((BattingLeaderboard, 'batting'), (PitchingLeaderboard, 'pitching')):
+        query = leaderboard_select(model, role).compile(
+            dialect=db.engine.dialect, compile_kwargs={"literal_binds": True}
+        )
+        statements.append(f"CREATE VIEW {model.__tablename__} AS {query}")
+    return statements
+
+
+def attach_parquet_views(app):
+    """Create the Parquet and leaderboard views on every new DuckDB connection; call after ``db.init_app``"""
+    from . import db
+
+    missing = [
+        table for table in EXPORTED_TABLES
+        if not parquet_path(app.config['PARQUET_DIR'], table).exists()
+    ]
+    if missing:
+        print(f"Missing Parquet exports in {app.config['PARQUET_DIR']}: {', '.join(missing)}. "
+              "Run utils/export_parquet.py against PostgreSQL first.")
+
+    with app.app_context():
+        statements = _view_statements(app)
+
+        @event.listens_for(db.engine, "connect")
+        def create_views(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
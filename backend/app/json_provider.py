@@ -0,0 +1,55 @@
+"""
+orjson-backed JSON provider, installed by create_app when JSON_PROVIDER is
+``orjson`` (the default).
+
+Serializes the same payloads as Flask's default provider, several times
+faster, writing bytes straight into the response. NumPy arrays and
+scalars and dates are handled natively: dates and datetime64 values as
+ISO 8601, NaN as null. Decimal is still written as a string, as Flask
+writes it, so the leaderboard percentages keep their wire format.
+"""
+import decimal
+import numpy as np
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        # Arrays orjson can't serialize natively (object dtype, non-contiguous views)
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    def _options(self, sort_keys, indent):
+        option = OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumpb(self, obj, sort_keys=None, indent=None):
+        """Serialize ``obj`` to UTF-8 bytes"""
+        sort_keys = self.sort_keys if sort_keys is None else sort_keys
+        return orjson.dumps(obj, default=_default, option=self._options(sort_keys, indent))
+
+    def dumps(self, obj, **kwargs):
+        return self.dumpb(obj, kwargs.get('sort_keys'), kwargs.get('indent')).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self.dumpb(obj, indent=indent) + b"\n", mimetype=self.mimetype)
@@ -1,5 +1,14 @@
 from .player import Player
 from .pitching import PitchingInfo
 from .batting import BattingInfo
+from .ingest_manifest import IngestManifest
+from .leaderboard import BattingLeaderboard, PitchingLeaderboard, refresh_leaderboards
+from .plate_appearance import PlateAppearance, rebuild_plate_appearances
+from .player_game import PlayerGame, rebuild_player_games
+from .dataset_version import DatasetVersion, get_data_version, get_data_version_info, bump_data_version
 
-__all__ = ['Player', 'PitchingInfo', 'BattingInfo']
+__all__ = ['Player', 'PitchingInfo', 'BattingInfo', 'IngestManifest',
+           'BattingLeaderboard', 'PitchingLeaderboard', 'refresh_leaderboards',
+           'PlateAppearance', 'rebuild_plate_appearances',
+           'PlayerGame', 'rebuild_player_games',
+           'DatasetVersion', 'get_data_version', 'get_data_version_info', 'bump_data_version']
@@ -2,6 +2,15 @@ from .. import db
 
 class BattingInfo(db.Model):
     __tablename__ = "batting_info"
+    __table_args__ = (
+        db.UniqueConstraint("game_bam_id", "at_bat_number", "pitch_seq", "player_id", name="uq_batting_info_pitch"),
+        db.Index("ix_batting_info_player_game", "player_id", "game_date", "game_bam_id", "inning", "at_bat_number"),
+        db.Index(
+            "ix_batting_info_in_play", "player_id",
+            postgresql_where=db.text("in_play"),
+            postgresql_include=["first_name", "last_name", "hit_exit_speed", "hit_vertical_angle", "hit_distance"]
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey("player_bio.player_id"), nullable=False)
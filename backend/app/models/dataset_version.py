@@ -0,0 +1,55 @@
+import time
+from datetime import datetime
+from flask import g, has_app_context
+from .. import db
+
+VERSION_TTL_SECONDS = 2.0
+_cached_version = (None, None, 0.0)
+
+class DatasetVersion(db.Model):
+    """Single-row counter bumped by every load, so caches can key on the data they were built from"""
+    __tablename__ = 'dataset_version'
+
+    id = db.Column(db.Integer, primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+def get_data_version_info():
+    """Return (version, updated_at) of the current dataset, re-reading them from the database at most every VERSION_TTL_SECONDS"""
+    global _cached_version
+    version, updated_at, read_at = _cached_version
+    now = time.monotonic()
+
+    if version is None or now - read_at > VERSION_TTL_SECONDS:
+        row = db.session.query(DatasetVersion.version, DatasetVersion.updated_at).filter_by(id=1).first()
+        version, updated_at = row if row else (0, None)
+        _cached_version = (version, updated_at, now)
+    return version, updated_at
+
+def get_data_version():
+    """Return the current dataset version, re-reading it from the database at most every VERSION_TTL_SECONDS"""
+    return get_data_version_info()[0]
+
+def note_read_version(version):
+    """Record that the current request read a snapshot of the data taken at ``version``"""
+    if has_app_context():
+        g.read_versions = g.get('read_versions', frozenset()) | {version}
+
+def read_other_version(version):
+    """
+    Whether the current request read a snapshot from a version other than
+    ``version``, e.g. the analytics store's previous snapshot while it reloads;
+    anything built from it must not be cached or tagged as ``version``
+    """
+    return has_app_context() and bool(g.get('read_versions', frozenset()) - {version})
+
+def bump_data_version():
+    """Increment the dataset version inside the current transaction; call it before committing a load"""
+    global _cached_version
+    table = DatasetVersion.__table__
+    values = {'version': table.c.version + 1, 'updated_at': datetime.utcnow()}
+
+    result = db.session.execute(table.update().where(table.c.id == 1).values(**values))
+    if result.rowcount == 0:
+        db.session.execute(table.insert().values(id=1, version=1, updated_at=values['updated_at']))
+    _cached_version = (None, None, 0.0)
@@ -0,0 +1,14 @@
+from .. import db
+from datetime import datetime
+
+class IngestManifest(db.Model):
+    __tablename__ = 'ingest_manifest'
+
+    id = db.Column(db.Integer, primary_key=True)
+    game_bam_id = db.Column(db.Integer, nullable=False, unique=True)
+    source_file = db.Column(db.String(255), nullable=False)
+    file_hash = db.Column(db.String(64), nullable=False)
+    game_hash = db.Column(db.String(64), nullable=False)
+    batting_rows = db.Column(db.Integer, default=0)
+    pitching_rows = db.Column(db.Integer, default=0)
+    ingested_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,68 @@
+from .. import db
+from .dataset_version import bump_data_version
+
+LEADERBOARD_VIEWS = ('batting_leaderboard', 'pitching_leaderboard')
+
+class BattingLeaderboard(db.Model):
+    """Read-only mapping of the batting_leaderboard materialized view"""
+    __tablename__ = "batting_leaderboard"
+    __table_args__ = {"info": {"is_view": True}}
+
+    player_id = db.Column(db.Integer, primary_key=True)
+    first_name = db.Column(db.String(100), primary_key=True)
+    last_name = db.Column(db.String(100), primary_key=True)
+    bbe = db.Column(db.Integer)
+    launch_angle = db.Column(db.Float)
+    max_exit_velo = db.Column(db.Float)
+    avg_exit_velo = db.Column(db.Float)
+    ev50 = db.Column(db.Float)
+    max_distance = db.Column(db.Float)
+    avg_distance = db.Column(db.Float)
+    ninety_five_plus = db.Column(db.Integer)
+    hard_hit_pct = db.Column(db.Numeric)
+    la_sweet_spot_pct = db.Column(db.Numeric)
+    barrels = db.Column(db.Integer)
+    barrel_pct = db.Column(db.Numeric)
+
+class PitchingLeaderboard(db.Model):
+    """Read-only mapping of the pitching_leaderboard materialized view"""
+    __tablename__ = "pitching_leaderboard"
+    __table_args__ = {"info": {"is_view": True}}
+
+    player_id = db.Column(db.Integer, primary_key=True)
+    first_name = db.Column(db.String(100), primary_key=True)
+    last_name = db.Column(db.String(100), primary_key=True)
+    bbe = db.Column(db.Integer)
+    launch_angle = db.Column(db.Float)
+    la_sweet_spot_pct = db.Column(db.Numeric)
+    avg_exit_velo = db.Column(db.Float)
+    max_exit_velo = db.Column(db.Float)
+    ev50 = db.Column(db.Float)
+    hard_hit_pct = db.Column(db.Numeric)
+    avg_distance = db.Column(db.Float)
+    max_distance = db.Column(db.Float)
+    barrels = db.Column(db.Integer)
+    barrel_pct = db.Column(db.Numeric)
+    avg_velocity = db.Column(db.Float)
+    max_velocity = db.Column(db.Float)
+    avg_spin_rate = db.Column(db.Float)
+    hard_hits_calculated = db.Column(db.Integer)
+
+def refresh_leaderboards(concurrently=True):
+    """
+    Recompute the leaderboard materialized views; a no-op on non-PostgreSQL databases.
+
+    Loaders refresh the views after committing their load, so the dataset
+    version is bumped again here: anything cached from the old views between
+    the two commits is keyed on the version in between and never served again.
+    """
+    if db.session.connection().dialect.name != 'postgresql':
+        return
+
+    for view in LEADERBOARD_VIEWS:
+        db.session.execute(db.text(
+            f"REFRESH MATERIALIZED VIEW {'CONCURRENTLY ' if concurrently else ''}{view}"
+        ))
+    bump_data_version()
+    db.session.commit()
+    print(f"Refreshed {', '.join(LEADERBOARD_VIEWS)}.")
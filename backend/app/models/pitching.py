@@ -2,6 +2,16 @@ from .. import db
 
 class PitchingInfo(db.Model):
     __tablename__ = "pitching_info"
+    __table_args__ = (
+        db.UniqueConstraint("game_bam_id", "at_bat_number", "pitch_seq", "player_id", name="uq_pitching_info_pitch"),
+        db.Index("ix_pitching_info_player_game", "player_id", "game_date", "game_bam_id", "inning", "at_bat_number", "pitch_seq"),
+        db.Index(
+            "ix_pitching_info_in_play", "player_id",
+            postgresql_where=db.text("in_play"),
+            postgresql_include=["first_name", "last_name", "hit_exit_speed", "hit_vertical_angle",
+                                "hit_distance", "rel_speed", "spin_rate"]
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     player_id = db.Column(db.Integer, db.ForeignKey("player_bio.player_id"), nullable=False)
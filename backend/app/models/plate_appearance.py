@@ -0,0 +1,271 @@
+from sqlalchemy import and_, or_, case, func, select
+from .. import db
+from .batting import BattingInfo
+from .pitching import PitchingInfo
+
+HIT_OUTCOMES = ('1B', '2B', '3B', 'HR')
+NON_AB_OUTCOMES = ('BB', 'HBP', 'SF')
+PITCHING_HIT_EVENTS = ('single', 'double', 'triple', 'home_run')
+PITCHING_RUN_EVENTS = (
+    'single', 'double', 'triple', 'home_run',
+    'sacrifice_fly', 'sacrifice_bunt',
+    'field_out', 'force_out', 'ground_out'
+)
+
+class PlateAppearance(db.Model):
+    """One row per plate appearance, derived from batting_info/pitching_info at ingest.
+
+    ``role`` is 'batting' for Padres batters and 'pitching' for Padres
+    pitchers. Batting rows carry the canonical ``outcome`` code, total
+    ``bases`` and the batted-ball fields the spray chart needs; pitching
+    rows carry strikeout/walk/hit flags, ``outs`` recorded and ``runs``.
+    """
+    __tablename__ = "plate_appearance"
+    __table_args__ = (
+        db.Index("ix_plate_appearance_player", "role", "player_id", "game_date", "game_bam_id", "at_bat_number"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    role = db.Column(db.String(10), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey("player_bio.player_id"), nullable=False)
+    game_date = db.Column(db.Date)
+    game_bam_id = db.Column(db.Integer)
+    at_bat_number = db.Column(db.Integer)
+    inning = db.Column(db.Integer)
+    outcome = db.Column(db.String(10))
+    bases = db.Column(db.Integer)
+    stolen_base = db.Column(db.Boolean)
+    is_strikeout = db.Column(db.Boolean)
+    is_walk = db.Column(db.Boolean)
+    is_hit = db.Column(db.Boolean)
+    outs = db.Column(db.Integer)
+    runs = db.Column(db.Integer)
+    spray_type = db.Column(db.String(10))
+    hit_distance = db.Column(db.Float)
+    hit_horizontal_angle = db.Column(db.Float)
+    hit_vertical_angle = db.Column(db.Float)
+    hit_exit_speed = db.Column(db.Float)
+
+def _contains(expression, *needles):
+    return or_(*(expression.contains(needle, autoescape=True) for needle in needles))
+
+def batting_outcome(event_type, description):
+    """SQL CASE classifying a batting row into its outcome code, in the order the stats have always used"""
+    event = func.lower(func.trim(func.coalesce(event_type, '')))
+    desc = func.lower(func.trim(func.coalesce(description, '')))
+    return case(
+        (or_(_contains(event, 'home_run'), _contains(desc, 'homers', 'hits a home run')), 'HR'),
+        (or_(_contains(event, 'double'), _contains(desc, 'doubles')), '2B'),
+        (or_(_contains(event, 'triple'), _contains(desc, 'triples')), '3B'),
+        (or_(_contains(event, 'single'), _contains(desc, 'singles')), '1B'),
+        (or_(_contains(event, 'walk'), _contains(desc, 'walks')), 'BB'),
+        (or_(_contains(event, 'hit_by_pitch'), _contains(desc, 'hit by pitch')), 'HBP'),
+        (or_(_contains(event, 'sacrifice_fly'), _contains(desc, 'sacrifice fly')), 'SF'),
+        else_='OUT'
+    )
+
+def has_event(event_type, description):
+    """True for rows that describe a plate appearance result"""
+    return or_(
+        func.trim(func.coalesce(event_type, '')) != '',
+        func.trim(func.coalesce(description, '')) != ''
+    )
+
+def spray_type(event_type):
+    """SQL CASE mapping a batted ball's event to its spray chart hit type (NULL for outs)"""
+    event = func.lower(func.coalesce(event_type, ''))
+    return case(
+        (_contains(event, 'home_run', 'home run'), 'HOME RUN'),
+        (_contains(event, 'triple'), 'TRIPLE'),
+        (_contains(event, 'double'), 'DOUBLE'),
+        (_contains(event, 'single'), 'SINGLE'),
+        else_=None
+    )
+
+def stolen_base(info):
+    return or_(
+        and_(info.pre_r1_bam_id.isnot(None), info.post_r1_bam_id.isnot(None),
+             info.pre_r1_bam_id != info.post_r1_bam_id),
+        and_(info.pre_r2_bam_id.isnot(None), info.post_r2_bam_id.isnot(None),
+             info.pre_r2_bam_id != info.post_r2_bam_id)
+    )
+
+def _pa_partition(info):
+    return (info.player_id, info.game_bam_id, info.at_bat_number)
+
+def batting_plate_appearances(games=None):
+    """Select one row per batting plate appearance: its result row joined to its batted ball, if any"""
+    outcome = batting_outcome(BattingInfo.event_type, BattingInfo.description)
+    result_rows = (
+        select(
+            BattingInfo.player_id,
+            BattingInfo.game_date,
+            BattingInfo.game_bam_id,
+            BattingInfo.at_bat_number,
+            BattingInfo.inning,
+            outcome.label('outcome'),
+            stolen_base(BattingInfo).label('stolen_base'),
+            func.row_number().over(
+                partition_by=_pa_partition(BattingInfo),
+                order_by=(BattingInfo.inning, BattingInfo.pitch_seq.desc())
+            ).label('rn')
+        )
+        .where(has_event(BattingInfo.event_type, BattingInfo.description))
+    )
+
+    hit_type = spray_type(BattingInfo.event_type)
+    batted_balls = (
+        select(
+            BattingInfo.player_id,
+            BattingInfo.game_bam_id,
+            BattingInfo.at_bat_number,
+            hit_type.label('spray_type'),
+            BattingInfo.hit_distance,
+            BattingInfo.hit_horizontal_angle,
+            BattingInfo.hit_vertical_angle,
+            BattingInfo.hit_exit_speed,
+            func.row_number().over(
+                partition_by=_pa_partition(BattingInfo),
+                order_by=BattingInfo.pitch_seq.desc()
+            ).label('rn')
+        )
+        .where(BattingInfo.hit_distance.isnot(None))
+        .where(BattingInfo.hit_horizontal_angle.isnot(None))
+        .where(hit_type.isnot(None))
+    )
+
+    if games is not None:
+        result_rows = result_rows.where(BattingInfo.game_bam_id.in_(games))
+        batted_balls = batted_balls.where(BattingInfo.game_bam_id.in_(games))
+
+    pa = result_rows.subquery()
+    bb = batted_balls.subquery()
+    return (
+        select(
+            db.literal('batting').label('role'),
+            pa.c.player_id,
+            pa.c.game_date,
+            pa.c.game_bam_id,
+            pa.c.at_bat_number,
+            pa.c.inning,
+            pa.c.outcome,
+            case(
+                (pa.c.outcome == '1B', 1), (pa.c.outcome == '2B', 2),
+                (pa.c.outcome == '3B', 3), (pa.c.outcome == 'HR', 4),
+                else_=0
+            ).label('bases'),
+            pa.c.stolen_base,
+            bb.c.spray_type,
+            bb.c.hit_distance,
+            bb.c.hit_horizontal_angle,
+            bb.c.hit_vertical_angle,
+            bb.c.hit_exit_speed
+        )
+        .select_from(pa)
+        .outerjoin(bb, and_(
+            bb.c.player_id == pa.c.player_id,
+            bb.c.game_bam_id == pa.c.game_bam_id,
+            bb.c.at_bat_number == pa.c.at_bat_number,
+            bb.c.rn == 1
+        ))
+        .where(pa.c.rn == 1)
+    )
+
+def pitching_plate_appearances(games=None):
+    """Select one row per pitching plate appearance with its outs, runs and K/BB/H flags"""
+    first_pitch = func.row_number().over(
+        partition_by=_pa_partition(PitchingInfo),
+        order_by=(PitchingInfo.inning, PitchingInfo.pitch_seq)
+    )
+    pitches = select(
+        PitchingInfo.player_id,
+        PitchingInfo.game_date,
+        PitchingInfo.game_bam_id,
+        PitchingInfo.at_bat_number,
+        PitchingInfo.inning,
+        PitchingInfo.event_type,
+        case(
+            (and_(PitchingInfo.post_outs.isnot(None), PitchingInfo.pre_outs.isnot(None),
+                  PitchingInfo.post_outs > PitchingInfo.pre_outs),
+             PitchingInfo.post_outs - PitchingInfo.pre_outs),
+            else_=0
+        ).label('outs'),
+        case(
+            (and_(PitchingInfo.event_type.in_(PITCHING_RUN_EVENTS),
+                  PitchingInfo.post_vscore.isnot(None), PitchingInfo.pre_vscore.isnot(None),
+                  PitchingInfo.post_vscore > PitchingInfo.pre_vscore),
+             PitchingInfo.post_vscore - PitchingInfo.pre_vscore),
+            else_=0
+        ).label('runs'),
+        first_pitch.label('rn')
+    )
+    if games is not None:
+        pitches = pitches.where(PitchingInfo.game_bam_id.in_(games))
+
+    p = pitches.subquery()
+
+    def any_event(*events):
+        return func.max(case((p.c.event_type.in_(events), 1), else_=0)) == 1
+
+    return (
+        select(
+            db.literal('pitching').label('role'),
+            p.c.player_id,
+            func.min(p.c.game_date).label('game_date'),
+            p.c.game_bam_id,
+            p.c.at_bat_number,
+            func.min(p.c.inning).label('inning'),
+            any_event('strikeout').label('is_strikeout'),
+            any_event('walk').label('is_walk'),
+            any_event(*PITCHING_HIT_EVENTS).label('is_hit'),
+            func.sum(p.c.outs).label('outs'),
+            func.sum(case((p.c.rn == 1, p.c.runs), else_=0)).label('runs')
+        )
+        .group_by(p.c.player_id, p.c.game_bam_id, p.c.at_bat_number)
+    )
+
+BATTING_PA_COLUMNS = (
+    'role', 'player_id', 'game_date', 'game_bam_id', 'at_bat_number', 'inning',
+    'outcome', 'bases', 'stolen_base', 'spray_type', 'hit_distance',
+    'hit_horizontal_angle', 'hit_vertical_angle', 'hit_exit_speed'
+)
+PITCHING_PA_COLUMNS = (
+    'role', 'player_id', 'game_date', 'game_bam_id', 'at_bat_number', 'inning',
+    'is_strikeout', 'is_walk', 'is_hit', 'outs', 'runs'
+)
+
+def batting_count_columns():
+    """Conditional counts of every batting counting stat over plate_appearance, labelled with its stat key"""
+    outcome = PlateAppearance.outcome
+
+    def count_where(condition):
+        return func.count().filter(condition)
+
+    return [
+        func.count().label('PA'),
+        count_where(outcome.notin_(NON_AB_OUTCOMES)).label('AB'),
+        count_where(outcome.in_(HIT_OUTCOMES)).label('H'),
+        *(count_where(outcome == code).label(code) for code in HIT_OUTCOMES + NON_AB_OUTCOMES),
+        count_where(PlateAppearance.stolen_base).label('SB'),
+    ]
+
+def rebuild_plate_appearances(roles=('batting', 'pitching'), games=None):
+    """Re-derive plate_appearance rows for ``roles`` (optionally only ``games``) inside the current transaction"""
+    # Core statements don't autoflush: pitch rows still pending in the session must reach the database first
+    db.session.flush()
+    table = PlateAppearance.__table__
+    sources = {
+        'batting': (BATTING_PA_COLUMNS, batting_plate_appearances),
+        'pitching': (PITCHING_PA_COLUMNS, pitching_plate_appearances),
+    }
+
+    for role in roles:
+        delete = table.delete().where(table.c.role == role)
+        if games is not None:
+            delete = delete.where(table.c.game_bam_id.in_(games))
+        db.session.execute(delete)
+
+        columns, build_select = sources[role]
+        db.session.execute(table.insert().from_select(columns, build_select(games)))
+
+    print(f"Rebuilt plate_appearance for {', '.join(roles)}.")
@@ -5,7 +5,7 @@ class Player(db.Model):
     __tablename__ = 'player_bio'
 
     player_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
-    bam_id = db.Column(db.Integer)
+    bam_id = db.Column(db.Integer, unique=True, index=True)
     first_name = db.Column(db.String(100), nullable=False)
     last_name = db.Column(db.String(100), nullable=False)
     age = db.Column(db.Integer, nullable=True)  
@@ -0,0 +1,124 @@
+from sqlalchemy import and_, case, func, select
+from .. import db
+from .batting import BattingInfo
+from .pitching import PitchingInfo
+
+class PlayerGame(db.Model):
+    """Per-player, per-game aggregates derived at ingest, so windowed leaderboards never rescan pitches.
+
+    ``role`` is 'batting' or 'pitching'. Batted-ball columns aggregate the
+    game's in-play pitches as sums and counts that combine across games;
+    ``exit_velos`` keeps the raw exit speeds so the EV50 median can be
+    taken over any set of games.
+    """
+    __tablename__ = "player_game"
+    __table_args__ = (
+        db.UniqueConstraint("role", "player_id", "game_bam_id", name="uq_player_game"),
+        db.Index("ix_player_game_player_date", "role", "player_id", "game_date"),
+        db.Index("ix_player_game_date", "role", "game_date"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    role = db.Column(db.String(10), nullable=False)
+    player_id = db.Column(db.Integer, db.ForeignKey("player_bio.player_id"), nullable=False)
+    game_bam_id = db.Column(db.Integer)
+    game_date = db.Column(db.Date)
+    pitches = db.Column(db.Integer)
+    bbe = db.Column(db.Integer)
+    launch_angle_sum = db.Column(db.Float)
+    launch_angle_count = db.Column(db.Integer)
+    exit_velo_sum = db.Column(db.Float)
+    exit_velo_count = db.Column(db.Integer)
+    exit_velo_max = db.Column(db.Float)
+    exit_velos = db.Column(db.ARRAY(db.Float))
+    distance_sum = db.Column(db.Float)
+    distance_count = db.Column(db.Integer)
+    distance_max = db.Column(db.Float)
+    hard_hits = db.Column(db.Integer)
+    sweet_spots = db.Column(db.Integer)
+    barrels = db.Column(db.Integer)
+    rel_speed_sum = db.Column(db.Float)
+    rel_speed_count = db.Column(db.Integer)
+    rel_speed_max = db.Column(db.Float)
+    spin_rate_sum = db.Column(db.Float)
+    spin_rate_count = db.Column(db.Integer)
+
+def _in_play_aggregates(info):
+    """Aggregates over a game's in-play pitches, matching the leaderboard view definitions"""
+    in_play = info.in_play.is_(True)
+
+    def in_play_value(column):
+        return case((in_play, column), else_=None)
+
+    def count_in_play(condition=None):
+        condition = in_play if condition is None else and_(in_play, condition)
+        return func.sum(case((condition, 1), else_=0))
+
+    sweet_spot = info.hit_vertical_angle.between(8, 32)
+    return {
+        'pitches': func.count(),
+        'bbe': count_in_play(),
+        'launch_angle_sum': func.sum(in_play_value(info.hit_vertical_angle)),
+        'launch_angle_count': func.count(in_play_value(info.hit_vertical_angle)),
+        'exit_velo_sum': func.sum(in_play_value(info.hit_exit_speed)),
+        'exit_velo_count': func.count(in_play_value(info.hit_exit_speed)),
+        'exit_velo_max': func.max(in_play_value(info.hit_exit_speed)),
+        'exit_velos': func.array_agg(info.hit_exit_speed).filter(and_(in_play, info.hit_exit_speed.isnot(None))),
+        'distance_sum': func.sum(in_play_value(info.hit_distance)),
+        'distance_count': func.count(in_play_value(info.hit_distance)),
+        'distance_max': func.max(in_play_value(info.hit_distance)),
+        'hard_hits': count_in_play(info.hit_exit_speed >= 95),
+        'sweet_spots': count_in_play(sweet_spot),
+        'barrels': count_in_play(and_(info.hit_exit_speed >= 98, sweet_spot)),
+    }
+
+def _pitching_aggregates(info):
+    in_play = info.in_play.is_(True)
+
+    def in_play_value(column):
+        return case((in_play, column), else_=None)
+
+    return {
+        'rel_speed_sum': func.sum(in_play_value(info.rel_speed)),
+        'rel_speed_count': func.count(in_play_value(info.rel_speed)),
+        'rel_speed_max': func.max(in_play_value(info.rel_speed)),
+        'spin_rate_sum': func.sum(in_play_value(info.spin_rate)),
+        'spin_rate_count': func.count(in_play_value(info.spin_rate)),
+    }
+
+def player_games(role, games=None):
+    """Select one aggregate row per player and game for ``role``, returning (columns, select)"""
+    info = BattingInfo if role == 'batting' else PitchingInfo
+    aggregates = _in_play_aggregates(info)
+    if role == 'pitching':
+        aggregates.update(_pitching_aggregates(info))
+
+    query = select(
+        db.literal(role).label('role'),
+        info.player_id,
+        info.game_bam_id,
+        func.min(info.game_date).label('game_date'),
+        *(expression.label(name) for name, expression in aggregates.items())
+    ).group_by(info.player_id, info.game_bam_id)
+
+    if games is not None:
+        query = query.where(info.game_bam_id.in_(games))
+
+    return ('role', 'player_id', 'game_bam_id', 'game_date', *aggregates), query
+
+def rebuild_player_games(roles=('batting', 'pitching'), games=None):
+    """Re-derive player_game rows for ``roles`` (optionally only ``games``) inside the current transaction"""
+    # Core statements don't autoflush: pitch rows still pending in the session must reach the database first
+    db.session.flush()
+    table = PlayerGame.__table__
+
+    for role in roles:
+        delete = table.delete().where(table.c.role == role)
+        if games is not None:
+            delete = delete.where(table.c.game_bam_id.in_(games))
+        db.session.execute(delete)
+
+        columns, query = player_games(role, games)
+        db.session.execute(table.insert().from_select(columns, query))
+
+    print(f"Rebuilt player_game for {', '.join(roles)}.")
@@ -0,0 +1,164 @@
+"""
+Response cache for the GET API routes.
+
+Every API response is a pure function of the route, its arguments and
+the loaded data, so a 200 JSON body is cached under
+``(endpoint, normalized args, data_version)`` and served again without
+running the controller until a loader bumps the dataset version. Entries
+from older versions are never read again; the in-process backend drops
+them as soon as it sees a new version, and the shared backend lets them
+expire.
+
+``RESPONSE_CACHE`` selects the backend:
+    memory  an in-process LRU bounded by RESPONSE_CACHE_MAX_ENTRIES and
+            RESPONSE_CACHE_MAX_MB (the default)
+    shared  a cache shared by every API process at RESPONSE_CACHE_URL
+            (Redis; requires the ``redis`` package), whose entries expire
+            after RESPONSE_CACHE_TTL seconds
+    off     no caching
+"""
+import hashlib
+from operator import itemgetter
+from urllib.parse import urlencode
+from flask import current_app, g, request
+from .analytics import LRUCache
+from .models.dataset_version import get_data_version, read_other_version
+
+
+class MemoryBackend:
+    """Response bodies in this process, evicted least recently used first"""
+
+    def __init__(self, max_entries, max_bytes):
+        self._entries = LRUCache(maxsize=max_entries, maxbytes=max_bytes)
+
+    def get(self, key):
+        return self._entries.get(key)
+
+    def set(self, key, body):
+        self._entries.set(key, body)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class SharedBackend:
+    """
+    Response bodies in a cache shared by every API process.
+
+    ``client`` is anything with redis-py's ``get(key)`` and
+    ``set(key, value, ex=seconds)``: a Redis client in production, or a
+    dict-backed stand-in in tests.
+    """
+
+    def __init__(self, client, ttl, prefix="response:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url, ttl):
+        import redis
+        return cls(redis.Redis.from_url(url), ttl)
+
+    def _key(self, key):
+        return self.prefix + hashlib.sha256(key.encode()).hexdigest()
+
+    def get(self, key):
+        return self.client.get(self._key(key))
+
+    def set(self, key, body):
+        self.client.set(self._key(key), body, ex=self.ttl)
+
+    def clear(self):
+        # Other processes may still be on the previous version; old entries expire on their own
+        pass
+
+
+def cache_key(version):
+    """``endpoint|path args|query args|version``, with the query args in key order and repeated values in request order"""
+    view_args = urlencode(sorted((request.view_args or {}).items()))
+    args = urlencode(sorted(request.args.items(multi=True), key=itemgetter(0)))
+    return f"{request.endpoint}|{view_args}|{args}|{version}"
+
+
+class ResponseCache:
+    def __init__(self):
+        self.backend = None
+        self._version = None
+
+    def init_app(self, app, backend=None):
+        """Install the cache on ``app``, with ``backend`` or the one RESPONSE_CACHE selects"""
+        self.backend = backend or self._configured_backend(app)
+        if self.backend is None:
+            return
+
+        app.before_request(self._lookup)
+        app.after_request(self._store)
+
+    @staticmethod
+    def _configured_backend(app):
+        mode = app.config.get('RESPONSE_CACHE', 'memory')
+        if mode == 'off':
+            return None
+
+        if mode == 'shared':
+            try:
+                return SharedBackend.from_url(app.config['RESPONSE_CACHE_URL'], app.config['RESPONSE_CACHE_TTL'])
+            except Exception as e:
+                print(f"Error connecting to the shared response cache, caching in-process: {str(e)}")
+
+        return MemoryBackend(
+            app.config['RESPONSE_CACHE_MAX_ENTRIES'],
+            app.config['RESPONSE_CACHE_MAX_MB'] * 1024 * 1024
+        )
+
+    def _lookup(self):
+        if request.method != 'GET' or request.blueprint is None:
+            return None
+
+        try:
+            version = get_data_version()
+        except Exception as e:
+            current_app.logger.error(f"Error reading the dataset version, not caching: {str(e)}")
+            return None
+
+        if version != self._version:
+            self.backend.clear()
+            self._version = version
+
+        key = cache_key(version)
+        try:
+            body = self.backend.get(key)
+        except Exception as e:
+            current_app.logger.error(f"Error reading the response cache: {str(e)}")
+            return None
+
+        if body is None:
+            g.response_cache_entry = (key, version)
+            return None
+
+        response = current_app.response_class(body, mimetype='application/json')
+        response.headers['X-Cache'] = 'HIT'
+        return response
+
+    def _store(self, response):
+        entry = g.pop('response_cache_entry', None)
+        if entry is None or response.status_code != 200 or response.mimetype != 'application/json':
+            return response
+
+        # Built from an older snapshot while the store reloads: not the data the key's version names
+        key, version = entry
+        if read_other_version(version):
+            return response
+
+        try:
+            self.backend.set(key, response.get_data())
+        except Exception as e:
+            current_app.logger.error(f"Error writing the response cache: {str(e)}")
+            return response
+
+        response.headers['X-Cache'] = 'MISS'
+        return response
+
+
+response_cache = ResponseCache()
@@ -1,11 +1,29 @@
 from flask import Blueprint, jsonify, request
 from ..controllers.batting_controller import BattingController
+from .params import parse_player_ids, parse_leaderboard_args, parse_window, parse_hex_size
+from ..controllers.leaderboard_page import sortable_columns
+from ..models.leaderboard import BattingLeaderboard
+from ..analytics import parse_grid
 
 batting_bp = Blueprint("batting", __name__)
 
 @batting_bp.route("/stats")
 def get_batting_stats():
-    """Get basic batting statistics for a player"""
+    """Get basic batting statistics for a player, or for several with player_ids=1,2,3 or player_ids=all"""
+    try:
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    player_ids = request.args.get("player_ids")
+    if player_ids:
+        try:
+            player_ids = parse_player_ids(player_ids)
+        except ValueError:
+            return jsonify({"error": "Invalid player IDs format"}), 400
+
+        return jsonify(BattingController.calculate_batting_stats_for_players(player_ids, window)), 200
+
     player_id = request.args.get("player_id")
     
     if not player_id:
@@ -16,7 +34,7 @@ def get_batting_stats():
     except ValueError:
         return jsonify({"error": "Invalid player ID format"}), 400
 
-    stats = BattingController.calculate_batting_stats(player_id)
+    stats = BattingController.calculate_batting_stats(player_id, window)
     if not stats:
         return jsonify({"error": "No batting data found for this player"}), 404
 
@@ -24,7 +42,7 @@ def get_batting_stats():
 
 @batting_bp.route("/spray-chart")
 def get_spray_chart():
-    """Get spray chart data for a player"""
+    """Get spray chart data for a player, as points or with bin=hex&size=<feet> as hexagonal bins"""
     player_id = request.args.get("player_id")
     
     if not player_id:
@@ -35,7 +53,13 @@ def get_spray_chart():
     except ValueError:
         return jsonify({"error": "Invalid player ID format"}), 400
 
-    spray_data = BattingController.get_spray_chart_data(player_id)
+    try:
+        window = parse_window(request.args)
+        hex_size = parse_hex_size(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    spray_data = BattingController.get_spray_chart_data(player_id, window, hex_size)
 
     return jsonify(spray_data if spray_data else []), 200
 
@@ -52,7 +76,21 @@ def get_zone_heatmap():
     except ValueError:
         return jsonify({"error": "Invalid player ID format"}), 400
 
-    heatmap_data = BattingController.get_zone_heatmap(player_id)
+    try:
+        grid = parse_grid(
+            request.args.get("grid"),
+            request.args.get("x_edges"),
+            request.args.get("z_edges")
+        )
+    except ValueError as e:
+        return jsonify({"error": f"Invalid grid: {str(e)}"}), 400
+
+    try:
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    heatmap_data = BattingController.get_zone_heatmap(player_id, grid, window)
     
     if heatmap_data is None:
         return jsonify({"error": "Error processing zone heatmap data"}), 500
@@ -77,7 +115,12 @@ def get_pitch_trends():
     except ValueError:
         return jsonify({"error": "Invalid player ID format"}), 400
 
-    trends_data = BattingController.get_pitch_trends(player_id)
+    try:
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    trends_data = BattingController.get_pitch_trends(player_id, window)
     
     if trends_data is None:
         return jsonify({"error": "Error processing pitch trends data"}), 500
@@ -89,13 +132,57 @@ def get_pitch_trends():
 
 @batting_bp.route("/leaderboard")
 def get_leaderboard():
-    """Get batting leaderboard statistics"""
-    leaderboard = BattingController.get_batting_leaderboard()
+    """Get batting leaderboard statistics, optionally filtered, sorted and paginated"""
+    try:
+        params = parse_leaderboard_args(
+            request.args, sortable_columns(BattingLeaderboard), 'avg_exit_velo', 'desc'
+        )
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    page = BattingController.get_batting_leaderboard(**params, window=window)
     
-    if not leaderboard:
+    if page is None:
         return jsonify({"error": "Unable to generate leaderboard"}), 500
 
+    leaderboard, next_cursor = page
     return jsonify({
         "success": True,
-        "data": leaderboard
-    }), 200
\ No newline at end of file
+        "data": leaderboard,
+        "next_cursor": next_cursor
+    }), 200
+
+@batting_bp.route("/dashboard")
+def get_dashboard():
+    """Get every batting modal panel for a player from one query"""
+    player_id = request.args.get("player_id")
+
+    if not player_id:
+        return jsonify({"error": "Player ID is required"}), 400
+
+    try:
+        player_id = int(player_id)
+    except ValueError:
+        return jsonify({"error": "Invalid player ID format"}), 400
+
+    try:
+        grid = parse_grid(
+            request.args.get("grid"),
+            request.args.get("x_edges"),
+            request.args.get("z_edges")
+        )
+    except ValueError as e:
+        return jsonify({"error": f"Invalid grid: {str(e)}"}), 400
+
+    try:
+        window = parse_window(request.args)
+        hex_size = parse_hex_size(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    dashboard = BattingController.get_dashboard(player_id, grid, hex_size, window)
+    if not dashboard:
+        return jsonify({"error": "No batting data found for this player"}), 404
+
+    return jsonify(dashboard), 200
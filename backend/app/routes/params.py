@@ -0,0 +1,122 @@
+from datetime import datetime
+from ..controllers.leaderboard_page import MAX_LIMIT, ORDERS, decode_cursor
+from ..controllers.game_window import GameWindow
+
+# Hexagon circumradius in feet for bin=hex spray charts
+DEFAULT_HEX_SIZE = 10.0
+
+
+def parse_player_ids(raw):
+    """
+    Parse a ``player_ids`` query argument.
+
+    Returns None for ``all`` (every player) or the de-duplicated list of ids
+    from a comma-separated string. Raises ValueError on anything else.
+    """
+    if raw.strip().lower() == 'all':
+        return None
+
+    player_ids = [int(part) for part in raw.split(',') if part.strip()]
+    if not player_ids:
+        raise ValueError("no player ids given")
+    return list(dict.fromkeys(player_ids))
+
+
+def parse_max_points(args):
+    """Parse an optional positive ``max_points`` argument. Raises ValueError with a message for the client."""
+    max_points = args.get("max_points")
+    if max_points is None:
+        return None
+
+    try:
+        max_points = int(max_points)
+    except ValueError:
+        raise ValueError("Invalid max_points format")
+    if max_points < 1:
+        raise ValueError("max_points must be positive")
+    return max_points
+
+
+def parse_hex_size(args):
+    """
+    Parse the spray chart ``bin`` and ``size`` arguments into a hexagon size
+    in feet, or None for one point per batted ball.
+    Raises ValueError with a message suitable for the client.
+    """
+    spray_bin = args.get("bin")
+    if spray_bin is None:
+        return None
+    if spray_bin != "hex":
+        raise ValueError("bin must be 'hex'")
+
+    try:
+        hex_size = float(args.get("size", DEFAULT_HEX_SIZE))
+    except ValueError:
+        raise ValueError("Invalid size format")
+    if not 0 < hex_size < float('inf'):
+        raise ValueError("size must be positive")
+    return hex_size
+
+
+def parse_leaderboard_args(args, sortable, default_sort, default_order):
+    """
+    Parse the leaderboard ``sort``, ``order``, ``min_bbe``, ``limit`` and
+    ``cursor`` arguments into keyword arguments for the controller.
+    Raises ValueError with a message suitable for the client.
+    """
+    sort = args.get("sort", default_sort)
+    if sort not in sortable:
+        raise ValueError(f"sort must be one of: {', '.join(sortable)}")
+
+    order = args.get("order", default_order).lower()
+    if order not in ORDERS:
+        raise ValueError("order must be 'asc' or 'desc'")
+
+    min_bbe = args.get("min_bbe")
+    if min_bbe is not None:
+        min_bbe = int(min_bbe)
+
+    limit = args.get("limit")
+    if limit is not None:
+        limit = int(limit)
+        if not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+
+    cursor = args.get("cursor")
+    if cursor is not None:
+        decode_cursor(cursor)
+
+    return {'sort': sort, 'order': order, 'min_bbe': min_bbe, 'limit': limit, 'cursor': cursor}
+
+
+def parse_window(args):
+    """
+    Parse the ``start_date``, ``end_date`` (YYYY-MM-DD) and ``last_n_games``
+    arguments into a GameWindow, or None when none are given.
+    Raises ValueError with a message suitable for the client.
+    """
+    dates = {}
+    for name in ('start_date', 'end_date'):
+        raw = args.get(name)
+        if raw is None:
+            dates[name] = None
+            continue
+        try:
+            dates[name] = datetime.strptime(raw, '%Y-%m-%d').date()
+        except ValueError:
+            raise ValueError(f"{name} must be a date in YYYY-MM-DD format")
+
+    if dates['start_date'] and dates['end_date'] and dates['start_date'] > dates['end_date']:
+        raise ValueError("start_date must not be after end_date")
+
+    last_n_games = args.get("last_n_games")
+    if last_n_games is not None:
+        try:
+            last_n_games = int(last_n_games)
+        except ValueError:
+            raise ValueError("last_n_games must be a positive integer")
+        if last_n_games < 1:
+            raise ValueError("last_n_games must be a positive integer")
+
+    window = GameWindow(dates['start_date'], dates['end_date'], last_n_games)
+    return window if window else None
@@ -1,36 +1,40 @@
 from flask import Blueprint, jsonify, request
 from ..controllers.pitching_controller import PitchingController
+from .params import parse_player_ids, parse_leaderboard_args, parse_window, parse_max_points
+from ..controllers.leaderboard_page import sortable_columns
+from ..models.leaderboard import PitchingLeaderboard
 
 pitching_bp = Blueprint("pitching", __name__)
 
 @pitching_bp.route("/info")
 def get_pitching_data():
+    try:
+        max_points = parse_max_points(request.args)
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    player_ids = request.args.get("player_ids")
+    if player_ids:
+        try:
+            player_ids = parse_player_ids(player_ids)
+        except ValueError:
+            return jsonify({"error": "Invalid player IDs format"}), 400
+
+        return jsonify(PitchingController.get_pitching_info_for_players(player_ids, max_points, window)), 200
+
     player_id = request.args.get("player_id")
     if not player_id:
         return jsonify({"error": "Player ID is required"}), 400
 
-    pitch_data = PitchingController.get_pitch_movement_data(player_id)
-    if not pitch_data:
-        return jsonify({"error": "No pitching data found for this player"}), 404
+    try:
+        player_id = int(player_id)
+    except ValueError:
+        return jsonify({"error": "Invalid player ID format"}), 400
 
-    stats = PitchingController.calculate_pitching_stats(player_id)
-    
-    pitches = [
-        {
-            "game_date": pitch.game_date.strftime('%Y-%m-%d') if pitch.game_date else None,
-            "pitch_type": pitch.pitch_type,
-            "horz_break": pitch.horz_break,
-            "induced_vert_break": pitch.induced_vert_break,
-            "rel_speed": pitch.rel_speed,
-            "usage": stats['pitch_usage'].get(pitch.pitch_type, 0) if stats else 0
-        }
-        for pitch in pitch_data
-    ]
-
-    result = {
-        "pitch_data": pitches,
-        "stats": stats
-    }
+    result = PitchingController.get_pitching_info(player_id, max_points, window)
+    if not result:
+        return jsonify({"error": "No pitching data found for this player"}), 404
 
     return jsonify(result), 200
 
@@ -40,7 +44,12 @@ def get_pitch_usage_by_date():
     if not player_id:
         return jsonify({"error": "Player ID is required"}), 400
 
-    usage_data = PitchingController.get_pitch_usage_by_date(player_id)
+    try:
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    usage_data = PitchingController.get_pitch_usage_by_date(player_id, window)
     if not usage_data:
         return jsonify({"error": "No data found for this player"}), 404
 
@@ -53,21 +62,60 @@ def get_pitch_distribution():
     if not player_id:
         return jsonify({"error": "Player ID is required"}), 400
 
-    distribution_data = PitchingController.get_pitch_distribution(player_id)
+    try:
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    distribution_data = PitchingController.get_pitch_distribution(player_id, window)
     if not distribution_data:
         return jsonify({"error": "No data found for this player"}), 404
 
     return jsonify(distribution_data), 200
 
+@pitching_bp.route("/dashboard")
+def get_dashboard():
+    """Get every pitching modal panel for a player from one query"""
+    player_id = request.args.get("player_id")
+    if not player_id:
+        return jsonify({"error": "Player ID is required"}), 400
+
+    try:
+        player_id = int(player_id)
+    except ValueError:
+        return jsonify({"error": "Invalid player ID format"}), 400
+
+    try:
+        max_points = parse_max_points(request.args)
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    dashboard = PitchingController.get_dashboard(player_id, max_points, window)
+    if not dashboard:
+        return jsonify({"error": "No pitching data found for this player"}), 404
+
+    return jsonify(dashboard), 200
+
 @pitching_bp.route("/leaderboard")
 def get_leaderboard():
-    """Get pitching leaderboard statistics"""
-    leaderboard = PitchingController.get_pitching_leaderboard()
+    """Get pitching leaderboard statistics, optionally filtered, sorted and paginated"""
+    try:
+        params = parse_leaderboard_args(
+            request.args, sortable_columns(PitchingLeaderboard), 'avg_exit_velo', 'asc'
+        )
+        window = parse_window(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    page = PitchingController.get_pitching_leaderboard(**params, window=window)
     
-    if not leaderboard:
+    if page is None:
         return jsonify({"error": "Unable to generate leaderboard"}), 500
 
+    leaderboard, next_cursor = page
     return jsonify({
         "success": True,
-        "data": leaderboard
-    }), 200
\ No newline at end of file
+        "data": leaderboard,
+        "next_cursor": next_cursor
+    }), 200
@@ -0,0 +1,151 @@
+"""baseline schema
+
+Creates the tables previously set up by hand from the README DDL. Databases
+that already have them should run ``flask db stamp 0001_baseline_schema``
+instead of upgrading through this revision.
+
+Revision ID: 0001_baseline_schema
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_baseline_schema'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'player_bio',
+        sa.Column('player_id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('bam_id', sa.Integer(), nullable=True),
+        sa.Column('first_name', sa.String(length=100), nullable=False),
+        sa.Column('last_name', sa.String(length=100), nullable=False),
+        sa.Column('age', sa.Integer(), nullable=True),
+        sa.Column('height', sa.Float(), nullable=True),
+        sa.Column('weight', sa.Float(), nullable=True),
+        sa.Column('position', sa.String(length=50), nullable=True),
+        sa.Column('birth_place', sa.String(length=100), nullable=True),
+        sa.Column('image_url', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.PrimaryKeyConstraint('player_id')
+    )
+
+    op.create_table(
+        'pitching_info',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.Column('first_name', sa.String(length=100), nullable=False),
+        sa.Column('last_name', sa.String(length=100), nullable=False),
+        sa.Column('game_date', sa.Date(), nullable=True),
+        sa.Column('game_bam_id', sa.Integer(), nullable=True),
+        sa.Column('at_bat_number', sa.Integer(), nullable=True),
+        sa.Column('inning', sa.Integer(), nullable=True),
+        sa.Column('pitch_seq', sa.Integer(), nullable=True),
+        sa.Column('pitch_type', sa.String(length=50), nullable=True),
+        sa.Column('horz_break', sa.Float(), nullable=True),
+        sa.Column('induced_vert_break', sa.Float(), nullable=True),
+        sa.Column('rel_speed', sa.Float(), nullable=True),
+        sa.Column('pre_outs', sa.Integer(), nullable=True),
+        sa.Column('post_outs', sa.Integer(), nullable=True),
+        sa.Column('pre_vscore', sa.Integer(), nullable=True),
+        sa.Column('post_vscore', sa.Integer(), nullable=True),
+        sa.Column('pre_balls', sa.Integer(), nullable=True),
+        sa.Column('pre_strikes', sa.Integer(), nullable=True),
+        sa.Column('post_balls', sa.Integer(), nullable=True),
+        sa.Column('post_strikes', sa.Integer(), nullable=True),
+        sa.Column('event_type', sa.String(length=100), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('spin_rate', sa.Float(), nullable=True),
+        sa.Column('spin_axis', sa.Float(), nullable=True),
+        sa.Column('zone_speed', sa.Float(), nullable=True),
+        sa.Column('plate_x', sa.Float(), nullable=True),
+        sa.Column('plate_z', sa.Float(), nullable=True),
+        sa.Column('extension', sa.Float(), nullable=True),
+        sa.Column('tilt', sa.String(length=50), nullable=True),
+        sa.Column('hit_exit_speed', sa.Float(), nullable=True),
+        sa.Column('hit_distance', sa.Float(), nullable=True),
+        sa.Column('hit_vertical_angle', sa.Float(), nullable=True),
+        sa.Column('hit_horizontal_angle', sa.Float(), nullable=True),
+        sa.Column('in_play', sa.Boolean(), nullable=True),
+        sa.Column('hit_trajectory', sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(['player_id'], ['player_bio.player_id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('game_bam_id', 'at_bat_number', 'pitch_seq', 'player_id', name='uq_pitching_info_pitch')
+    )
+
+    op.create_table(
+        'batting_info',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.Column('first_name', sa.String(length=100), nullable=False),
+        sa.Column('last_name', sa.String(length=100), nullable=False),
+        sa.Column('game_date', sa.Date(), nullable=True),
+        sa.Column('game_bam_id', sa.Integer(), nullable=True),
+        sa.Column('at_bat_number', sa.Integer(), nullable=True),
+        sa.Column('inning', sa.Integer(), nullable=True),
+        sa.Column('pitch_seq', sa.Integer(), nullable=True),
+        sa.Column('event_type', sa.String(length=100), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('hit_trajectory', sa.String(length=50), nullable=True),
+        sa.Column('hit_exit_speed', sa.Float(), nullable=True),
+        sa.Column('hit_vertical_angle', sa.Float(), nullable=True),
+        sa.Column('hit_horizontal_angle', sa.Float(), nullable=True),
+        sa.Column('hit_distance', sa.Float(), nullable=True),
+        sa.Column('hit_bearing', sa.Float(), nullable=True),
+        sa.Column('pre_balls', sa.Integer(), nullable=True),
+        sa.Column('pre_strikes', sa.Integer(), nullable=True),
+        sa.Column('post_balls', sa.Integer(), nullable=True),
+        sa.Column('post_strikes', sa.Integer(), nullable=True),
+        sa.Column('pre_vscore', sa.Integer(), nullable=True),
+        sa.Column('post_vscore', sa.Integer(), nullable=True),
+        sa.Column('pre_basecode', sa.Integer(), nullable=True),
+        sa.Column('post_basecode', sa.Integer(), nullable=True),
+        sa.Column('pre_r1_bam_id', sa.Integer(), nullable=True),
+        sa.Column('pre_r2_bam_id', sa.Integer(), nullable=True),
+        sa.Column('pre_r3_bam_id', sa.Integer(), nullable=True),
+        sa.Column('post_r1_bam_id', sa.Integer(), nullable=True),
+        sa.Column('post_r2_bam_id', sa.Integer(), nullable=True),
+        sa.Column('post_r3_bam_id', sa.Integer(), nullable=True),
+        sa.Column('swing', sa.Boolean(), nullable=True),
+        sa.Column('contact', sa.Boolean(), nullable=True),
+        sa.Column('in_play', sa.Boolean(), nullable=True),
+        sa.Column('pitch_type', sa.String(length=50), nullable=True),
+        sa.Column('plate_x', sa.Float(), nullable=True),
+        sa.Column('plate_z', sa.Float(), nullable=True),
+        sa.Column('called_strike', sa.Boolean(), nullable=True),
+        sa.Column('swinging_strike', sa.Boolean(), nullable=True),
+        sa.Column('chase', sa.Boolean(), nullable=True),
+        sa.Column('ball', sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(['player_id'], ['player_bio.player_id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('game_bam_id', 'at_bat_number', 'pitch_seq', 'player_id', name='uq_batting_info_pitch')
+    )
+
+    op.create_table(
+        'ingest_manifest',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('game_bam_id', sa.Integer(), nullable=False),
+        sa.Column('source_file', sa.String(length=255), nullable=False),
+        sa.Column('file_hash', sa.String(length=64), nullable=False),
+        sa.Column('game_hash', sa.String(length=64), nullable=False),
+        sa.Column('batting_rows', sa.Integer(), nullable=True),
+        sa.Column('pitching_rows', sa.Integer(), nullable=True),
+        sa.Column('ingested_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('game_bam_id')
+    )
+
+
+def downgrade():
+    op.drop_table('ingest_manifest')
+    op.drop_table('batting_info')
+    op.drop_table('pitching_info')
+    op.drop_table('player_bio')
@@ -0,0 +1,54 @@
+"""indexes for the controller query patterns
+
+Every controller query filters batting_info/pitching_info by player_id and
+most order by game_date, game_bam_id, inning, at_bat_number(, pitch_seq);
+the leaderboards aggregate only in_play rows per player. The composite
+indexes serve the per-player scans in sort order, and the partial in_play
+indexes carry the batted-ball columns so the leaderboards can be answered
+with index-only scans.
+
+Revision ID: 0002_hot_query_indexes
+Revises: 0001_baseline_schema
+Create Date: 2026-10-18 09:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_hot_query_indexes'
+down_revision = '0001_baseline_schema'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_batting_info_player_game', 'batting_info',
+        ['player_id', 'game_date', 'game_bam_id', 'inning', 'at_bat_number']
+    )
+    op.create_index(
+        'ix_batting_info_in_play', 'batting_info', ['player_id'],
+        postgresql_where=sa.text('in_play'),
+        postgresql_include=['first_name', 'last_name', 'hit_exit_speed', 'hit_vertical_angle', 'hit_distance']
+    )
+    op.create_index(
+        'ix_pitching_info_player_game', 'pitching_info',
+        ['player_id', 'game_date', 'game_bam_id', 'inning', 'at_bat_number', 'pitch_seq']
+    )
+    op.create_index(
+        'ix_pitching_info_in_play', 'pitching_info', ['player_id'],
+        postgresql_where=sa.text('in_play'),
+        postgresql_include=['first_name', 'last_name', 'hit_exit_speed', 'hit_vertical_angle',
+                            'hit_distance', 'rel_speed', 'spin_rate']
+    )
+    op.create_index('ix_player_bio_bam_id', 'player_bio', ['bam_id'], unique=True)
+
+
+def downgrade():
+    op.drop_index('ix_player_bio_bam_id', table_name='player_bio')
+    op.drop_index('ix_pitching_info_in_play', table_name='pitching_info')
+    op.drop_index('ix_pitching_info_player_game', table_name='pitching_info')
+    op.drop_index('ix_batting_info_in_play', table_name='batting_info')
+    op.drop_index('ix_batting_info_player_game', table_name='batting_info')
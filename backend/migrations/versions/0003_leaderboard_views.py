@@ -0,0 +1,102 @@
+"""materialized leaderboard views
+
+Precomputes the batting and pitching leaderboards that the controllers used
+to aggregate on every request. The views are refreshed concurrently at the
+end of each ingest, which needs a unique index on each.
+
+Revision ID: 0003_leaderboard_views
+Revises: 0002_hot_query_indexes
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_leaderboard_views'
+down_revision = '0002_hot_query_indexes'
+branch_labels = None
+depends_on = None
+
+
+BATTING_LEADERBOARD = """
+CREATE MATERIALIZED VIEW batting_leaderboard AS
+SELECT
+    b.player_id,
+    b.first_name,
+    b.last_name,
+    bbe.bbe,
+    avg(b.hit_vertical_angle) AS launch_angle,
+    max(b.hit_exit_speed) AS max_exit_velo,
+    avg(b.hit_exit_speed) AS avg_exit_velo,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY b.hit_exit_speed DESC) AS ev50,
+    max(b.hit_distance) AS max_distance,
+    avg(b.hit_distance) AS avg_distance,
+    count(CASE WHEN b.hit_exit_speed >= 95 THEN 1 END) AS ninety_five_plus,
+    count(CASE WHEN b.hit_exit_speed >= 95 THEN 1 END) * 100.0
+        / nullif(count(*), 0) AS hard_hit_pct,
+    count(CASE WHEN b.hit_vertical_angle >= 8 AND b.hit_vertical_angle <= 32 THEN 1 END) * 100.0
+        / count(*) AS la_sweet_spot_pct,
+    count(CASE WHEN b.hit_exit_speed >= 98 AND b.hit_vertical_angle BETWEEN 8 AND 32 THEN 1 END) AS barrels,
+    count(CASE WHEN b.hit_exit_speed >= 98 AND b.hit_vertical_angle BETWEEN 8 AND 32 THEN 1 END) * 100.0
+        / nullif(count(*), 0) AS barrel_pct
+FROM batting_info b
+LEFT OUTER JOIN (
+    SELECT player_id, count(*) AS bbe
+    FROM batting_info
+    WHERE in_play = true
+    GROUP BY player_id
+) bbe ON b.player_id = bbe.player_id
+WHERE b.in_play = true
+GROUP BY b.player_id, b.first_name, b.last_name, bbe.bbe
+"""
+
+PITCHING_LEADERBOARD = """
+CREATE MATERIALIZED VIEW pitching_leaderboard AS
+SELECT
+    p.player_id,
+    p.first_name,
+    p.last_name,
+    bbe.bbe,
+    avg(p.hit_vertical_angle) AS launch_angle,
+    count(CASE WHEN p.hit_vertical_angle >= 8 AND p.hit_vertical_angle <= 32 THEN 1 END) * 100.0
+        / count(*) AS la_sweet_spot_pct,
+    avg(p.hit_exit_speed) AS avg_exit_velo,
+    max(p.hit_exit_speed) AS max_exit_velo,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY p.hit_exit_speed DESC) AS ev50,
+    count(CASE WHEN p.hit_exit_speed >= 95 THEN 1 END) * 100.0
+        / nullif(count(*), 0) AS hard_hit_pct,
+    avg(p.hit_distance) AS avg_distance,
+    max(p.hit_distance) AS max_distance,
+    count(CASE WHEN p.hit_exit_speed >= 98 AND p.hit_vertical_angle BETWEEN 8 AND 32 THEN 1 END) AS barrels,
+    count(CASE WHEN p.hit_exit_speed >= 98 AND p.hit_vertical_angle BETWEEN 8 AND 32 THEN 1 END) * 100.0
+        / nullif(count(*), 0) AS barrel_pct,
+    avg(p.rel_speed) AS avg_velocity,
+    max(p.rel_speed) AS max_velocity,
+    avg(p.spin_rate) AS avg_spin_rate,
+    coalesce(count(CASE WHEN p.hit_exit_speed >= 95 THEN 1 END), 0) AS hard_hits_calculated
+FROM pitching_info p
+LEFT OUTER JOIN (
+    SELECT player_id, count(*) AS bbe
+    FROM pitching_info
+    WHERE in_play = true
+    GROUP BY player_id
+) bbe ON p.player_id = bbe.player_id
+WHERE p.in_play = true
+GROUP BY p.player_id, p.first_name, p.last_name, bbe.bbe
+"""
+
+
+def upgrade():
+    op.execute(BATTING_LEADERBOARD)
+    op.create_index('ux_batting_leaderboard_player', 'batting_leaderboard',
+                    ['player_id', 'first_name', 'last_name'], unique=True)
+    op.execute(PITCHING_LEADERBOARD)
+    op.create_index('ux_pitching_leaderboard_player', 'pitching_leaderboard',
+                    ['player_id', 'first_name', 'last_name'], unique=True)
+
+
+def downgrade():
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS pitching_leaderboard')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS batting_leaderboard')
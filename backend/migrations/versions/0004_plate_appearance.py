@@ -0,0 +1,57 @@
+"""plate_appearance fact table
+
+One row per plate appearance, derived from batting_info/pitching_info at
+ingest, so the stats endpoints aggregate plate appearances directly instead
+of deduplicating pitch-level rows on every request.
+
+Revision ID: 0004_plate_appearance
+Revises: 0003_leaderboard_views
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_plate_appearance'
+down_revision = '0003_leaderboard_views'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'plate_appearance',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(length=10), nullable=False),
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.Column('game_date', sa.Date(), nullable=True),
+        sa.Column('game_bam_id', sa.Integer(), nullable=True),
+        sa.Column('at_bat_number', sa.Integer(), nullable=True),
+        sa.Column('inning', sa.Integer(), nullable=True),
+        sa.Column('outcome', sa.String(length=10), nullable=True),
+        sa.Column('bases', sa.Integer(), nullable=True),
+        sa.Column('stolen_base', sa.Boolean(), nullable=True),
+        sa.Column('is_strikeout', sa.Boolean(), nullable=True),
+        sa.Column('is_walk', sa.Boolean(), nullable=True),
+        sa.Column('is_hit', sa.Boolean(), nullable=True),
+        sa.Column('outs', sa.Integer(), nullable=True),
+        sa.Column('runs', sa.Integer(), nullable=True),
+        sa.Column('spray_type', sa.String(length=10), nullable=True),
+        sa.Column('hit_distance', sa.Float(), nullable=True),
+        sa.Column('hit_horizontal_angle', sa.Float(), nullable=True),
+        sa.Column('hit_vertical_angle', sa.Float(), nullable=True),
+        sa.Column('hit_exit_speed', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['player_id'], ['player_bio.player_id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_plate_appearance_player', 'plate_appearance',
+        ['role', 'player_id', 'game_date', 'game_bam_id', 'at_bat_number']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_plate_appearance_player', table_name='plate_appearance')
+    op.drop_table('plate_appearance')
@@ -0,0 +1,35 @@
+"""dataset_version counter
+
+A single-row counter that every loader bumps in the same transaction as
+the data it loads. Caches key their entries on it, so a new load
+invalidates them without any explicit purge.
+
+Revision ID: 0005_dataset_version
+Revises: 0004_plate_appearance
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_dataset_version'
+down_revision = '0004_plate_appearance'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'dataset_version',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("INSERT INTO dataset_version (id, version, updated_at) VALUES (1, 1, CURRENT_TIMESTAMP)")
+
+
+def downgrade():
+    op.drop_table('dataset_version')
@@ -0,0 +1,62 @@
+"""player_game aggregates for date windows
+
+Per-player, per-game batted-ball and velocity aggregates derived at ingest.
+Date-range and last-N-games leaderboards sum these rows instead of
+rescanning pitches; the game_date indexes serve the range filters.
+
+Revision ID: 0006_player_game
+Revises: 0005_dataset_version
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_player_game'
+down_revision = '0005_dataset_version'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'player_game',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(length=10), nullable=False),
+        sa.Column('player_id', sa.Integer(), nullable=False),
+        sa.Column('game_bam_id', sa.Integer(), nullable=True),
+        sa.Column('game_date', sa.Date(), nullable=True),
+        sa.Column('pitches', sa.Integer(), nullable=True),
+        sa.Column('bbe', sa.Integer(), nullable=True),
+        sa.Column('launch_angle_sum', sa.Float(), nullable=True),
+        sa.Column('launch_angle_count', sa.Integer(), nullable=True),
+        sa.Column('exit_velo_sum', sa.Float(), nullable=True),
+        sa.Column('exit_velo_count', sa.Integer(), nullable=True),
+        sa.Column('exit_velo_max', sa.Float(), nullable=True),
+        sa.Column('exit_velos', postgresql.ARRAY(sa.Float()), nullable=True),
+        sa.Column('distance_sum', sa.Float(), nullable=True),
+        sa.Column('distance_count', sa.Integer(), nullable=True),
+        sa.Column('distance_max', sa.Float(), nullable=True),
+        sa.Column('hard_hits', sa.Integer(), nullable=True),
+        sa.Column('sweet_spots', sa.Integer(), nullable=True),
+        sa.Column('barrels', sa.Integer(), nullable=True),
+        sa.Column('rel_speed_sum', sa.Float(), nullable=True),
+        sa.Column('rel_speed_count', sa.Integer(), nullable=True),
+        sa.Column('rel_speed_max', sa.Float(), nullable=True),
+        sa.Column('spin_rate_sum', sa.Float(), nullable=True),
+        sa.Column('spin_rate_count', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['player_id'], ['player_bio.player_id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('role', 'player_id', 'game_bam_id', name='uq_player_game')
+    )
+    op.create_index('ix_player_game_player_date', 'player_game', ['role', 'player_id', 'game_date'])
+    op.create_index('ix_player_game_date', 'player_game', ['role', 'game_date'])
+
+
+def downgrade():
+    op.drop_index('ix_player_game_date', table_name='player_game')
+    op.drop_index('ix_player_game_player_date', table_name='player_game')
+    op.drop_table('player_game')
@@ -0,0 +1,36 @@
+import os
+import sys
+from pathlib import Path
+import pytest
+from dotenv import dotenv_values
+
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(backend_dir))
+sys.path.append(str(backend_dir / "utils"))
+
+
+def database_url():
+    return os.getenv('DATABASE_URL') or dotenv_values(backend_dir / ".env").get('DATABASE_URL') or ''
+
+
+@pytest.fixture(scope="module")
+def postgres_app():
+    """
+    An app on DATABASE_URL (or backend/.env) with the analytics store and the
+    response cache off, so every call reaches the database; skips the tests
+    using it unless that is PostgreSQL. The settings are only patched while
+    the app is created.
+    """
+    if not database_url().startswith('postgresql'):
+        pytest.skip("needs a PostgreSQL DATABASE_URL")
+
+    from app import create_app
+    from explain_queries import APP_ENV
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, value in {**APP_ENV, 'RESPONSE_CACHE': 'off'}.items():
+            monkeypatch.setenv(name, value)
+        app = create_app()
+
+    with app.app_context():
+        yield app
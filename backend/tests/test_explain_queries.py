@@ -0,0 +1,32 @@
+"""
+Every controller query must be served by an index, per EXPLAIN.
+
+Runs utils/explain_queries.py's checks against the PostgreSQL database in
+DATABASE_URL (or backend/.env); skipped when there is none, or when its
+pitch tables are too small for the planner to prefer an index to a scan.
+"""
+import pytest
+from explain_queries import SAMPLE_WINDOWS, analyze_tables, capture_statements, controller_calls, sample_player, sequential_scans
+from app.models import BattingInfo, PitchingInfo
+
+MIN_ROWS = 10_000
+
+
+@pytest.fixture(scope="module")
+def players(postgres_app):
+    if min(BattingInfo.query.count(), PitchingInfo.query.count()) < MIN_ROWS:
+        pytest.skip(f"batting_info/pitching_info need {MIN_ROWS} rows for index plans")
+    batter_id, pitcher_id = sample_player(BattingInfo), sample_player(PitchingInfo)
+
+    analyze_tables()
+    return batter_id, pitcher_id
+
+
+@pytest.mark.parametrize("label", SAMPLE_WINDOWS)
+@pytest.mark.parametrize("name", controller_calls(None, None))
+def test_controller_queries_use_indexes(players, name, label):
+    call = controller_calls(*players, SAMPLE_WINDOWS[label])[name]
+    statements = capture_statements(call)
+
+    scans = {statement: sequential_scans(statement, parameters)[1] for statement, parameters in statements}
+    assert not any(scans.values()), {statement: tables for statement, tables in scans.items() if tables}
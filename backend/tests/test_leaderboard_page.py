@@ -0,0 +1,49 @@
+"""
+Keyset pagination must visit every leaderboard row exactly once, including
+rows tied on a Numeric percentage whose decimal expansion doesn't terminate.
+
+Runs against the PostgreSQL database in DATABASE_URL (or backend/.env), on
+a temporary batting_leaderboard that shadows the view inside a transaction
+which is rolled back; skipped when there is no PostgreSQL database.
+"""
+import pytest
+from app import db
+from app.controllers.leaderboard_page import leaderboard_page
+from app.models import BattingLeaderboard
+
+# (player_id, hits of 3 batted balls): four players tied at 33.33...%, two at 66.66...%
+PLAYERS = [(1, 1), (2, 2), (3, 1), (4, 0), (5, 1), (6, 2), (7, 1), (8, 3)]
+
+
+@pytest.fixture
+def leaderboard(postgres_app):
+    db.session.execute(db.text(
+        "CREATE TEMP TABLE batting_leaderboard ON COMMIT DROP AS "
+        "SELECT * FROM public.batting_leaderboard WITH NO DATA"
+    ))
+    for player_id, hits in PLAYERS:
+        db.session.execute(db.text(
+            "INSERT INTO batting_leaderboard (player_id, first_name, last_name, bbe, hard_hit_pct) "
+            "VALUES (:player_id, 'F', 'L', 3, :hits * 100.0 / 3)"
+        ), {'player_id': player_id, 'hits': hits})
+    try:
+        yield
+    finally:
+        db.session.rollback()
+
+
+def pages(order, limit):
+    player_ids, cursor = [], None
+    while True:
+        rows, cursor = leaderboard_page(BattingLeaderboard, 'hard_hit_pct', order, limit=limit, cursor=cursor)
+        player_ids += [row.player_id for row in rows]
+        if cursor is None or len(player_ids) > len(PLAYERS):
+            return player_ids
+
+
+@pytest.mark.parametrize("order", ['asc', 'desc'])
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_pages_visit_tied_percentages_once(leaderboard, order, limit):
+    expected = [row.player_id for row in leaderboard_page(BattingLeaderboard, 'hard_hit_pct', order)[0]]
+    assert sorted(expected) == [player_id for player_id, _ in PLAYERS]
+    assert pages(order, limit) == expected
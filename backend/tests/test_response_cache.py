@@ -0,0 +1,96 @@
+"""
+The response cache on a SharedBackend: bodies are stored in and served from
+the shared client under the current data_version, a version bump makes
+every route miss again, and a response built from an older snapshot is
+neither stored nor tagged with the current version's ETag.
+
+Runs on an in-memory SQLite database with a dict standing in for Redis.
+"""
+import pytest
+from flask import Blueprint, jsonify
+from app import create_app, db
+from app.models.dataset_version import DatasetVersion, bump_data_version, get_data_version, note_read_version
+from app.models.player import Player
+from app.response_cache import SharedBackend, response_cache
+
+APP_ENV = {
+    'DATABASE_URL': 'sqlite://',
+    'ANALYTICS_STORE': '0',
+    'QUERY_BACKEND': 'postgresql',
+    'RESPONSE_CACHE': 'memory',
+}
+
+
+class DictClient(dict):
+    """The part of redis-py's client SharedBackend uses"""
+
+    def set(self, key, value, ex=None):
+        self[key] = value
+
+
+probe_bp = Blueprint('probe', __name__)
+
+
+@probe_bp.route('/stale')
+def stale():
+    # What a route sees while the analytics store is still on the previous snapshot
+    note_read_version(get_data_version() - 1)
+    return jsonify({'success': True})
+
+
+@pytest.fixture
+def client():
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name, value in APP_ENV.items():
+            monkeypatch.setenv(name, value)
+        app = create_app()
+    app.register_blueprint(probe_bp, url_prefix='/probe')
+
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[Player.__table__, DatasetVersion.__table__])
+        db.session.add(Player(first_name='Fernando', last_name='Tatis'))
+        bump_data_version()
+        db.session.commit()
+
+    # Requests run outside this app context, so each one gets its own g
+    previous, response_cache.backend = response_cache.backend, SharedBackend(DictClient(), ttl=60)
+    try:
+        yield app.test_client()
+    finally:
+        response_cache.backend = previous
+
+
+def test_miss_then_hit_from_shared_client(client):
+    first = client.get('/player/bio')
+    assert first.status_code == 200
+    assert first.headers['X-Cache'] == 'MISS'
+    assert len(response_cache.backend.client) == 1
+
+    second = client.get('/player/bio')
+    assert second.headers['X-Cache'] == 'HIT'
+    assert second.get_data() == first.get_data()
+    assert second.headers['ETag'] == first.headers['ETag']
+
+
+def test_version_bump_invalidates(client):
+    before = client.get('/player/bio')
+    assert client.get('/player/bio').headers['X-Cache'] == 'HIT'
+
+    with client.application.app_context():
+        bump_data_version()
+        db.session.commit()
+
+    after = client.get('/player/bio')
+    assert after.headers['X-Cache'] == 'MISS'
+    assert after.headers['ETag'] != before.headers['ETag']
+    assert client.get('/player/bio').headers['X-Cache'] == 'HIT'
+    assert len(response_cache.backend.client) == 2
+
+
+def test_other_snapshot_is_not_stored_or_tagged(client):
+    for _ in range(2):
+        response = client.get('/probe/stale')
+        assert response.status_code == 200
+        assert 'X-Cache' not in response.headers
+        assert 'ETag' not in response.headers
+    assert len(response_cache.backend.client) == 0
@@ -0,0 +1,150 @@
+import io
+import time
+from itertools import islice
+
+from app import db
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _copy_value(value):
+    """Format a Python value for PostgreSQL's COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, float):
+        return repr(value)
+    return (str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r'))
+
+
+def _copy_chunk(cursor, table, columns, rows):
+    buffer = io.StringIO()
+    for values in rows:
+        buffer.write('\t'.join(_copy_value(value) for value in values))
+        buffer.write('\n')
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table.name} ({', '.join(columns)}) FROM STDIN",
+        buffer
+    )
+
+
+class BulkWriter:
+    """
+    Writes chunks of column-value dicts into ``table``.
+
+    PostgreSQL connections use ``COPY FROM STDIN``; any other dialect falls
+    back to a batched ``executemany`` insert. Rows are written inside the
+    current session transaction, so the caller still owns the commit.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.columns = [column.name for column in table.columns if not column.primary_key]
+        self.connection = db.session.connection()
+        self.use_copy = self.connection.dialect.name == 'postgresql'
+        self.total = 0
+        self.started = time.perf_counter()
+
+    @property
+    def rate(self):
+        elapsed = time.perf_counter() - self.started
+        return self.total / elapsed if elapsed > 0 else 0
+
+    def write(self, chunk):
+        """Write a list of column-value dicts"""
+        if not chunk:
+            return
+
+        if self.use_copy:
+            self._copy([tuple(values[column] for column in self.columns) for values in chunk])
+        else:
+            self._execute(chunk)
+        self._advance(len(chunk))
+
+    def write_columns(self, batch):
+        """Write a column batch: a dict mapping every column to an equal-length list"""
+        rows = list(zip(*(batch[column] for column in self.columns)))
+        if not rows:
+            return
+
+        if self.use_copy:
+            self._copy(rows)
+        else:
+            self._execute([dict(zip(self.columns, values)) for values in rows])
+        self._advance(len(rows))
+
+    def _copy(self, rows):
+        cursor = self.connection.connection.cursor()
+        try:
+            _copy_chunk(cursor, self.table, self.columns, rows)
+        finally:
+            cursor.close()
+
+    def _execute(self, chunk):
+        self.connection.execute(self.table.insert(), chunk)
+
+    def _advance(self, count):
+        self.total += count
+        print(f"  {self.table.name}: {self.total} rows ({self.rate:,.0f} rows/s)")
+
+    def close(self):
+        elapsed = time.perf_counter() - self.started
+        print(f"Copied {self.total} rows into {self.table.name} in {elapsed:.2f}s ({self.rate:,.0f} rows/s)")
+        return self.total
+
+
+def copy_rows(table, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream dicts of column values into ``table`` in bounded chunks and return the row count"""
+    writer = BulkWriter(table)
+    rows = iter(rows)
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        writer.write(chunk)
+
+    return writer.close()
+
+
+NATURAL_KEY = ('game_bam_id', 'at_bat_number', 'pitch_seq', 'player_id')
+
+
+def _dialect_insert(dialect_name):
+    if dialect_name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Upserts are not supported on {dialect_name}")
+    return insert
+
+
+class UpsertWriter(BulkWriter):
+    """
+    BulkWriter variant that upserts each chunk with ``INSERT ... ON CONFLICT``
+    on ``key_columns``, updating every other column of an existing row.
+    """
+
+    def __init__(self, table, key_columns=NATURAL_KEY):
+        super().__init__(table)
+        insert = _dialect_insert(self.connection.dialect.name)
+        statement = insert(table)
+        self.statement = statement.on_conflict_do_update(
+            index_elements=list(key_columns),
+            set_={
+                column: statement.excluded[column]
+                for column in self.columns
+                if column not in key_columns
+            }
+        )
+        self.use_copy = False
+
+    def _execute(self, chunk):
+        self.connection.execute(self.statement, chunk)
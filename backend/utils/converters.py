@@ -0,0 +1,42 @@
+from datetime import datetime
+
+
+def safe_float(value):
+    try:
+        return float(value) if value != '' else None
+    except (ValueError, TypeError):
+        return None
+
+
+def safe_int(value):
+    try:
+        return int(value) if value != '' else None
+    except (ValueError, TypeError):
+        return None
+
+
+def safe_bool(value):
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        value = value.upper()
+        if value == 'TRUE':
+            return True
+        if value == 'FALSE':
+            return False
+    return None
+
+
+def safe_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+    except (ValueError, TypeError):
+        return None
+
+
+def bool_or_false(value):
+    return value.lower() == 'true' if value else False
+
+
+def raw_text(value):
+    return value
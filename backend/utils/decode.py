@@ -0,0 +1,176 @@
+"""
+Declarative column schemas and a parallel decoder for the raw play-by-play CSV.
+
+A schema is a tuple of (column, csv_field, coerce) entries derived from a
+model's column types, so adding a column to BattingInfo or PitchingInfo is
+enough for the loaders to pick it up. ``decode_parallel`` splits the CSV
+into newline-aligned byte ranges and coerces them in a process pool,
+yielding typed column batches in file order.
+"""
+import csv
+import hashlib
+import io
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from app import db
+from app.models import BattingInfo, PitchingInfo
+from converters import safe_float, safe_int, safe_bool, safe_date, bool_or_false, raw_text
+from load_players_info import padres_players_in_row
+
+PADRES = "San Diego Padres"
+DEFAULT_CHUNK_BYTES = 8 << 20
+
+
+def _coercer(column_type):
+    if isinstance(column_type, db.Boolean):
+        return safe_bool
+    if isinstance(column_type, db.Integer):
+        return safe_int
+    if isinstance(column_type, db.Float):
+        return safe_float
+    if isinstance(column_type, db.Date):
+        return safe_date
+    return raw_text
+
+
+def column_schema(model, role, overrides=None):
+    """
+    Build the (column, csv_field, coerce) schema for ``model``.
+
+    ``player_id`` is left out because it is resolved from the ``{role}_bam_id``
+    field; the name columns read the ``{role}_name_*`` fields.
+    """
+    overrides = overrides or {}
+    fields = {
+        'first_name': f"{role}_name_first",
+        'last_name': f"{role}_name_last",
+    }
+    return tuple(
+        (
+            column.name,
+            fields.get(column.name, column.name),
+            overrides.get(column.name, _coercer(column.type))
+        )
+        for column in model.__table__.columns
+        if not column.primary_key and column.name != 'player_id'
+    )
+
+
+BATTING_SCHEMA = column_schema(BattingInfo, "batter")
+PITCHING_SCHEMA = column_schema(PitchingInfo, "pitcher", overrides={'in_play': bool_or_false})
+
+# (name, role, schema) for every info table fed from the raw CSV
+TARGETS = (
+    ('pitching', "pitcher", PITCHING_SCHEMA),
+    ('batting', "batter", BATTING_SCHEMA),
+)
+
+
+def decode_row(schema, row):
+    """Coerce one raw CSV row into a dict of column values"""
+    return {column: coerce(row[field]) for column, field, coerce in schema}
+
+
+def row_digest(row):
+    return hashlib.sha256("\x1f".join(row.values()).encode()).digest()
+
+
+def byte_ranges(file_path, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Return the header line and newline-aligned (start, end) byte ranges
+    covering the body of the CSV. Fields must not contain embedded newlines.
+    """
+    size = os.path.getsize(file_path)
+    ranges = []
+    with open(file_path, "rb") as file:
+        header = file.readline()
+        start = file.tell()
+        while start < size:
+            file.seek(min(start + chunk_bytes, size))
+            file.readline()
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return header.decode(), ranges
+
+
+def decode_range(file_path, fieldnames, start, end, targets=TARGETS):
+    """
+    Decode one byte range into typed column batches.
+
+    Returns a dict with the number of rows read, the Padres players in
+    first-seen order, per-game row digests for the ingest manifest and, for
+    every target, a column batch holding the resolved ``bam_id`` and the
+    chunk-relative ``row_index`` alongside each schema column.
+    """
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        text = file.read(end - start).decode()
+
+    players = {}
+    digests = {}
+    batches = {
+        name: {'row_index': [], 'bam_id': [], **{column: [] for column, _, _ in schema}}
+        for name, _, schema in targets
+    }
+
+    rows = 0
+    for row_index, values in enumerate(csv.reader(io.StringIO(text))):
+        row = dict(zip(fieldnames, values))
+        rows += 1
+
+        game_bam_id = safe_int(row["game_bam_id"])
+        if game_bam_id is not None:
+            digests.setdefault(game_bam_id, []).append(row_digest(row))
+
+        for bam_id, player in padres_players_in_row(row):
+            players.setdefault(bam_id, player)
+
+        for name, role, schema in targets:
+            if row[f"{role}_team"] != PADRES:
+                continue
+            batch = batches[name]
+            batch['row_index'].append(row_index)
+            batch['bam_id'].append(row[f"{role}_bam_id"])
+            for column, field, coerce in schema:
+                batch[column].append(coerce(row[field]))
+
+    return {
+        'rows': rows,
+        'players': list(players.items()),
+        'digests': digests,
+        'batches': batches,
+    }
+
+
+def decode_parallel(file_path, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES, targets=TARGETS):
+    """
+    Yield decoded chunks of ``file_path`` in file order.
+
+    At most two chunks per worker are in flight at once, so a slow consumer
+    holds back decoding instead of letting results pile up in memory.
+    """
+    header, ranges = byte_ranges(file_path, chunk_bytes)
+    fieldnames = next(csv.reader([header]))
+    workers = workers or os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        ranges = iter(ranges)
+
+        def submit():
+            for start, end in ranges:
+                pending.append(executor.submit(decode_range, file_path, fieldnames, start, end, targets))
+                return True
+            return False
+
+        for _ in range(workers * 2):
+            if not submit():
+                break
+
+        while pending:
+            result = pending.popleft().result()
+            submit()
+            yield result
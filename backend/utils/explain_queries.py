@@ -0,0 +1,137 @@
+"""
+Check that every controller query is served by an index.
+
+Each controller method is called for a sample batter and pitcher while the
+SQL it sends is captured; every captured statement is then run through
+``EXPLAIN (FORMAT JSON)`` and the plan is searched for sequential scans on
+batting_info/pitching_info. Run ``ANALYZE`` first (done here) so the
+planner sees realistic table sizes. Exits non-zero if any query falls back
+to a sequential scan.
+
+Usage (from backend/utils):
+    python explain_queries.py [--verbose]
+
+tests/test_explain_queries.py runs the same check under pytest.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+from sqlalchemy import event, func, text
+
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent
+sys.path.append(str(project_root))
+
+from app import create_app
+from app import db
+from app.models import BattingInfo, PitchingInfo
+from app.controllers.batting_controller import BattingController
+from app.controllers.pitching_controller import PitchingController
+from app.controllers.game_window import GameWindow
+
+WATCHED_TABLES = {'batting_info', 'pitching_info'}
+# Explain the SQL the controllers send to PostgreSQL, not reads served from the analytics store
+APP_ENV = {'ANALYTICS_STORE': '0', 'QUERY_BACKEND': 'postgresql'}
+# Every controller path is explained unwindowed and with a last-N-games window
+SAMPLE_WINDOWS = {'': None, ' [last 10 games]': GameWindow(last_n_games=10)}
+
+
+def capture_statements(call):
+    """Run ``call`` and return the (statement, parameters) pairs it executed"""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        call()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+
+def plan_nodes(plan):
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+def sequential_scans(statement, parameters):
+    cursor = db.session.connection().connection.cursor()
+    try:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + statement, parameters)
+        plan = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    root = plan[0]['Plan']
+    return root, [
+        node['Relation Name']
+        for node in plan_nodes(root)
+        if node.get('Node Type') == 'Seq Scan' and node.get('Relation Name') in WATCHED_TABLES
+    ]
+
+
+def sample_player(model):
+    return db.session.query(model.player_id, func.count())\
+        .group_by(model.player_id)\
+        .order_by(func.count().desc())\
+        .limit(1)\
+        .scalar()
+
+
+def controller_calls(batter_id, pitcher_id, window=None):
+    """Every controller path the routes run, for one batter and pitcher, restricted to ``window``"""
+    return {
+        'BattingController.calculate_batting_stats': lambda: BattingController.calculate_batting_stats(batter_id, window),
+        'BattingController.calculate_batting_stats_for_players': lambda: BattingController.calculate_batting_stats_for_players([batter_id], window),
+        'BattingController.get_spray_chart_data': lambda: BattingController.get_spray_chart_data(batter_id, window),
+        'BattingController.get_zone_heatmap': lambda: BattingController.get_zone_heatmap(batter_id, window=window),
+        'BattingController.get_pitch_trends': lambda: BattingController.get_pitch_trends(batter_id, window),
+        'BattingController.get_dashboard': lambda: BattingController.get_dashboard(batter_id, window=window),
+        'BattingController.get_batting_leaderboard': lambda: BattingController.get_batting_leaderboard(window=window),
+        'PitchingController.get_pitching_info': lambda: PitchingController.get_pitching_info(pitcher_id, window=window),
+        'PitchingController.get_pitching_info_for_players': lambda: PitchingController.get_pitching_info_for_players([pitcher_id], window=window),
+        'PitchingController.get_pitch_usage_by_date': lambda: PitchingController.get_pitch_usage_by_date(pitcher_id, window),
+        'PitchingController.get_pitch_distribution': lambda: PitchingController.get_pitch_distribution(pitcher_id, window),
+        'PitchingController.get_dashboard': lambda: PitchingController.get_dashboard(pitcher_id, window=window),
+        'PitchingController.get_pitching_leaderboard': lambda: PitchingController.get_pitching_leaderboard(window=window),
+    }
+
+
+def analyze_tables():
+    for table in WATCHED_TABLES:
+        db.session.execute(text(f'ANALYZE {table};'))
+
+
+def explain_controllers(verbose=False):
+    analyze_tables()
+
+    batter_id = sample_player(BattingInfo)
+    pitcher_id = sample_player(PitchingInfo)
+    failures = 0
+
+    for label, window in SAMPLE_WINDOWS.items():
+        for name, call in controller_calls(batter_id, pitcher_id, window).items():
+            for statement, parameters in capture_statements(call):
+                root, scans = sequential_scans(statement, parameters)
+                status = "SEQ SCAN on " + ", ".join(scans) if scans else "index"
+                print(f"{name}{label}: {root['Node Type']} ({status})")
+                if verbose:
+                    print(json.dumps(root, indent=2))
+                failures += bool(scans)
+
+    print(f"\n{failures} controller queries use a sequential scan.")
+    return failures
+
+
+if __name__ == "__main__":
+    os.environ.update(APP_ENV)
+    app = create_app()
+    with app.app_context():
+        sys.exit(1 if explain_controllers("--verbose" in sys.argv) else 0)
@@ -0,0 +1,99 @@
+"""
+Export the tables the API reads to Parquet for the DuckDB query backend.
+
+Each table in ``EXPORTED_TABLES`` is streamed out of PostgreSQL in row
+groups and written as one zstd-compressed Parquet file under PARQUET_DIR
+(data/parquet by default), typed from the SQLAlchemy column types. Files
+are written to a temporary path and renamed into place, so a DuckDB
+server reading the directory never sees a half-written export. The
+derived plate_appearance, player_game and dataset_version tables are
+exported as well, so the DuckDB backend serves exactly what PostgreSQL
+serves, down to the data version its caches key on.
+
+Usage (from backend/utils), after loading data:
+    python export_parquet.py [--out DIR]
+"""
+import argparse
+import os
+import sys
+from pathlib import Path
+from sqlalchemy import select
+
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent
+sys.path.append(str(project_root))
+
+from app import create_app
+from app import db
+from app.duckdb_backend import EXPORTED_TABLES, DEFAULT_PARQUET_DIR, parquet_path
+
+ROW_GROUP_ROWS = 64 * 1024
+
+
+def _arrow_type(column_type):
+    import pyarrow as pa
+    import sqlalchemy as sa
+
+    if isinstance(column_type, sa.ARRAY):
+        return pa.list_(_arrow_type(column_type.item_type))
+    if isinstance(column_type, sa.Boolean):
+        return pa.bool_()
+    if isinstance(column_type, sa.Integer):
+        return pa.int64()
+    if isinstance(column_type, (sa.Float, sa.Numeric)):
+        return pa.float64()
+    if isinstance(column_type, sa.DateTime):
+        return pa.timestamp('us')
+    if isinstance(column_type, sa.Date):
+        return pa.date32()
+    return pa.string()
+
+
+def export_table(table, out_dir):
+    """Write ``table`` to ``out_dir``/<name>.parquet, ordered by player where it has one; returns the row count"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([pa.field(column.name, _arrow_type(column.type)) for column in table.columns])
+    order = [table.c.player_id] if 'player_id' in table.c else []
+    query = select(*table.columns).order_by(*order, *table.primary_key.columns)
+
+    path = parquet_path(out_dir, table.name)
+    tmp_path = path.with_suffix(".parquet.tmp")
+    rows = 0
+    with db.engine.connect() as connection, pq.ParquetWriter(tmp_path, schema, compression="zstd") as writer:
+        result = connection.execution_options(stream_results=True).execute(query)
+        for chunk in result.partitions(ROW_GROUP_ROWS):
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(values, type=field.type) for values, field in zip(zip(*chunk), schema)],
+                schema=schema
+            ))
+            rows += len(chunk)
+
+        if not rows:
+            writer.write_table(schema.empty_table())
+
+    os.replace(tmp_path, path)
+    return rows
+
+
+def export_parquet(out_dir):
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    for name in EXPORTED_TABLES:
+        rows = export_table(db.metadata.tables[name], out_dir)
+        print(f"Exported {rows} rows of {name} to {parquet_path(out_dir, name)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the API tables to Parquet for the DuckDB backend")
+    parser.add_argument("--out", default=os.getenv('PARQUET_DIR', str(DEFAULT_PARQUET_DIR)),
+                        help="directory to write the Parquet files to")
+    args = parser.parse_args()
+
+    # Always export from the loaded PostgreSQL database, whatever backend the API is set to
+    os.environ['QUERY_BACKEND'] = 'postgresql'
+    app = create_app()
+    with app.app_context():
+        export_parquet(args.out)
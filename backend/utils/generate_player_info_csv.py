@@ -283,26 +283,32 @@ def generate_player_info_csv(game_data_path, output_path):
         reader = csv.DictReader(file)
         
         for row in reader:
-            if row["batter_team"] == "San Diego Padres":
-                bam_id = int(row["batter_bam_id"]) if row["batter_bam_id"] else None
-                if bam_id:
-                    padres_players[bam_id] = {
-                        'first_name': row["batter_name_first"],
-                        'last_name': row["batter_name_last"],
-                        'position': str(row["batter_position"]) if row["batter_position"] else None,
-                        'bam_id': bam_id
-                    }
-            
-            if row["pitcher_team"] == "San Diego Padres":
-                bam_id = int(row["pitcher_bam_id"]) if row["pitcher_bam_id"] else None
-                if bam_id:
-                    padres_players[bam_id] = {
-                        'first_name': row["pitcher_name_first"],
-                        'last_name': row["pitcher_name_last"],
-                        'position': "P",
-                        'bam_id': bam_id
-                    }
+            collect_padres_players(row, padres_players)
 
+    write_player_info_csv(padres_players, output_path)
+
+def collect_padres_players(row, padres_players):
+    if row["batter_team"] == "San Diego Padres":
+        bam_id = int(row["batter_bam_id"]) if row["batter_bam_id"] else None
+        if bam_id:
+            padres_players[bam_id] = {
+                'first_name': row["batter_name_first"],
+                'last_name': row["batter_name_last"],
+                'position': str(row["batter_position"]) if row["batter_position"] else None,
+                'bam_id': bam_id
+            }
+    
+    if row["pitcher_team"] == "San Diego Padres":
+        bam_id = int(row["pitcher_bam_id"]) if row["pitcher_bam_id"] else None
+        if bam_id:
+            padres_players[bam_id] = {
+                'first_name': row["pitcher_name_first"],
+                'last_name': row["pitcher_name_last"],
+                'position': "P",
+                'bam_id': bam_id
+            }
+
+def write_player_info_csv(padres_players, output_path):
     player_info = []
     now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
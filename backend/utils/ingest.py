@@ -0,0 +1,373 @@
+"""
+Single-pass ingest of padres_project_data.csv.
+
+The raw CSV is read exactly once by a reader thread that hands bounded
+chunks of rows to the main thread through a size-limited queue, so a slow
+database write stalls the reader instead of buffering the whole file. Each
+chunk is fanned out to the player, pitching and batting sinks, which write
+through the bulk loader in fixed-size batches. With --workers, the CSV is
+instead split into byte ranges that a process pool coerces into typed
+column batches, which are handed to the same sinks in file order. With
+--staged, those batches come from the Parquet staging cache (staging.py).
+
+With --incremental, nothing is truncated. Games whose content hash matches
+ingest_manifest are skipped; new or changed games are upserted on the
+(game_bam_id, at_bat_number, pitch_seq, player_id) natural key and their
+manifest entries refreshed, so a nightly refresh only pays for new data.
+
+Either way, the plate_appearance fact table is re-derived for the loaded
+games in the same transaction, as is the per-player, per-game player_game
+aggregate table, before the leaderboards are refreshed.
+
+Usage (from backend/utils):
+    python ingest.py [--incremental] [--chunk-size N] [--workers N | --staged] [--write-player-info]
+"""
+import argparse
+import csv
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from collections import defaultdict
+from sqlalchemy import text, tuple_
+
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent
+sys.path.append(str(project_root))
+
+from app import create_app
+from app import db
+from app.models import (
+    BattingInfo, PitchingInfo, bump_data_version, rebuild_plate_appearances, rebuild_player_games, refresh_leaderboards
+)
+from bulk_load import BulkWriter, UpsertWriter, DEFAULT_CHUNK_SIZE
+from player_index import build_player_index, lookup_player, resolve_player, RejectReport
+from converters import safe_int
+from decode import decode_parallel
+from staging import staged_chunks
+from manifest import GameHasher, file_sha256, scan_game_hashes, file_is_ingested, changed_games, record_games
+from load_players_info import read_player_info, padres_players_in_row, build_player
+from load_batting_info import batting_values
+from load_pitching_info import pitching_values
+from generate_player_info_csv import collect_padres_players, write_player_info_csv
+
+PADRES = "San Diego Padres"
+QUEUE_CHUNKS = 4
+_DONE = object()
+
+
+def read_chunks(file_path, chunk_size):
+    """Yield lists of (line_number, row) from the raw CSV without loading it whole"""
+    with open(file_path, "r") as file:
+        reader = csv.DictReader(file)
+        chunk = []
+        for row in reader:
+            chunk.append((reader.line_num, row))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _produce(chunks, out_queue, errors):
+    try:
+        for chunk in chunks:
+            out_queue.put(chunk)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        out_queue.put(_DONE)
+
+
+def bounded_stream(chunks, maxsize=QUEUE_CHUNKS):
+    """
+    Run a chunk generator on a reader thread, yielding its chunks through a
+    bounded queue so the producer blocks whenever the consumer falls behind.
+    """
+    out_queue = queue.Queue(maxsize=maxsize)
+    errors = []
+    producer = threading.Thread(target=_produce, args=(chunks, out_queue, errors), daemon=True)
+    producer.start()
+
+    while True:
+        chunk = out_queue.get()
+        if chunk is _DONE:
+            break
+        yield chunk
+
+    producer.join()
+    if errors:
+        raise errors[0]
+
+
+class PlayerSink:
+    """Creates player_bio rows on first sight and maintains the bam_id index"""
+
+    def __init__(self, player_info_path, player_index=None):
+        self.player_info_dict = read_player_info(player_info_path) if Path(player_info_path).exists() else {}
+        self.player_index = player_index if player_index is not None else {}
+        self.existing = len(self.player_index)
+        self.generated_players = {}
+
+    def consume(self, line_number, row):
+        self.consume_players(padres_players_in_row(row))
+        collect_padres_players(row, self.generated_players)
+
+    def consume_players(self, players):
+        for bam_id, player in players:
+            if bam_id not in self.player_index:
+                new_player = build_player(bam_id, player, self.player_info_dict)
+                db.session.add(new_player)
+                db.session.flush()
+                self.player_index[bam_id] = new_player.player_id
+                self.generated_players.setdefault(bam_id, player)
+
+    def close(self):
+        print(f"Loaded {len(self.player_index) - self.existing} new players into player_bio.")
+
+
+class InfoSink:
+    """
+    Buffers one Padres role's rows and writes them in fixed-size batches.
+
+    When ``games`` is given, only rows of those games are kept and they are
+    upserted on the natural key; rows of those games that are no longer in
+    the source are removed on close.
+    """
+
+    def __init__(self, model, role, build_values, player_index, chunk_size, games=None):
+        self.table = model.__table__
+        self.role = role
+        self.team_column = f"{role}_team"
+        self.build_values = build_values
+        self.player_index = player_index
+        self.chunk_size = chunk_size
+        self.games = games
+        self.writer = BulkWriter(self.table) if games is None else UpsertWriter(self.table)
+        self.rejects = RejectReport(model.__tablename__.replace('_info', ''))
+        self.rows_by_game = defaultdict(int)
+        self.keys_by_game = defaultdict(set)
+        self.buffer = []
+
+        if games:
+            # Rows with a NULL key part can never match on conflict, so replace them outright
+            db.session.execute(
+                self.table.delete()
+                .where(self.table.c.game_bam_id.in_(games))
+                .where(self.table.c.at_bat_number.is_(None) | self.table.c.pitch_seq.is_(None))
+            )
+
+    def consume(self, line_number, row):
+        if row[self.team_column] != PADRES:
+            return
+
+        game_bam_id = safe_int(row["game_bam_id"])
+        if self.games is not None and game_bam_id not in self.games:
+            return
+
+        player_id = resolve_player(row, self.role, self.player_index, self.rejects, line_number)
+        if player_id is None:
+            return
+
+        values = self.build_values(row, player_id)
+        key = (values['at_bat_number'], values['pitch_seq'], player_id)
+        if self.games is not None and None not in key:
+            self.keys_by_game[game_bam_id].add(key)
+
+        self.rows_by_game[game_bam_id] += 1
+        self.buffer.append(values)
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def consume_batch(self, batch, first_line):
+        """Resolve and write a typed column batch from the parallel decoder"""
+        keep = []
+        player_ids = []
+        for i, raw_bam_id in enumerate(batch['bam_id']):
+            player_id, reason = lookup_player(raw_bam_id, self.player_index)
+            if player_id is None:
+                self.rejects.add(first_line + batch['row_index'][i], raw_bam_id,
+                                 batch['first_name'][i], batch['last_name'][i],
+                                 batch['game_bam_id'][i], reason)
+                continue
+            keep.append(i)
+            player_ids.append(player_id)
+
+        columns = {
+            column: [batch[column][i] for i in keep]
+            for column in self.writer.columns
+            if column != 'player_id'
+        }
+        columns['player_id'] = player_ids
+        for game_bam_id in columns['game_bam_id']:
+            self.rows_by_game[game_bam_id] += 1
+
+        self.writer.write_columns(columns)
+
+    def flush(self):
+        self.writer.write(self.buffer)
+        self.buffer = []
+
+    def _delete_stale_rows(self):
+        columns = self.table.c
+        for game_bam_id in self.games:
+            statement = self.table.delete().where(columns.game_bam_id == game_bam_id)
+            keys = self.keys_by_game.get(game_bam_id)
+            if keys:
+                statement = statement.where(
+                    tuple_(columns.at_bat_number, columns.pitch_seq, columns.player_id).notin_(list(keys))
+                )
+            db.session.execute(statement)
+
+    def close(self):
+        self.flush()
+        if self.games:
+            self._delete_stale_rows()
+        self.writer.close()
+        self.rejects.write()
+
+
+def _stream(game_data_path, chunk_size, sinks, hasher=None):
+    with db.session.no_autoflush:
+        for chunk in bounded_stream(read_chunks(game_data_path, chunk_size)):
+            for line_number, row in chunk:
+                if hasher is not None:
+                    hasher.update(row)
+                for sink in sinks:
+                    sink.consume(line_number, row)
+
+        for sink in sinks:
+            sink.close()
+
+
+def _stream_chunks(chunks, players, sinks, hasher):
+    """Feed the sinks from pre-decoded column chunks (process pool or Parquet staging)"""
+    rows_before = 0
+    with db.session.no_autoflush:
+        for chunk in chunks:
+            players.consume_players(chunk['players'])
+            for game_bam_id, digests in chunk['digests'].items():
+                for digest in digests:
+                    hasher.update_digest(game_bam_id, digest)
+
+            # Body rows start on line 2, after the header
+            first_line = rows_before + 2
+            for name, sink in sinks.items():
+                sink.consume_batch(chunk['batches'][name], first_line)
+            rows_before += chunk['rows']
+
+        players.close()
+        for sink in sinks.values():
+            sink.close()
+
+
+def ingest(game_data_path, player_info_path, chunk_size=DEFAULT_CHUNK_SIZE, write_player_info=False,
+           workers=None, staged=False):
+    """
+    Load player_bio, pitching_info and batting_info in one pass over the raw CSV.
+
+    With ``workers``, rows are decoded in a process pool instead of on the
+    reader thread; with ``staged``, typed columns are read from the Parquet
+    staging cache instead of parsing the CSV.
+    """
+    started = time.perf_counter()
+    source_file = Path(game_data_path).name
+    file_hash = file_sha256(game_data_path)
+
+    db.session.execute(text('TRUNCATE TABLE player_bio RESTART IDENTITY CASCADE;'))
+    db.session.execute(text('TRUNCATE TABLE ingest_manifest RESTART IDENTITY;'))
+
+    players = PlayerSink(player_info_path)
+    pitching = InfoSink(PitchingInfo, "pitcher", pitching_values, players.player_index, chunk_size)
+    batting = InfoSink(BattingInfo, "batter", batting_values, players.player_index, chunk_size)
+    hasher = GameHasher()
+
+    try:
+        info_sinks = {'pitching': pitching, 'batting': batting}
+        if staged:
+            _stream_chunks(staged_chunks(game_data_path), players, info_sinks, hasher)
+        elif workers:
+            _stream_chunks(decode_parallel(game_data_path, workers=workers), players, info_sinks, hasher)
+        else:
+            _stream(game_data_path, chunk_size, [players, pitching, batting], hasher)
+        game_hashes = hasher.hexdigests()
+        record_games(source_file, file_hash, game_hashes, set(game_hashes),
+                     batting.rows_by_game, pitching.rows_by_game)
+        rebuild_plate_appearances()
+        rebuild_player_games()
+        bump_data_version()
+        db.session.commit()
+        refresh_leaderboards()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error during ingest: {str(e)}")
+        raise e
+
+    if write_player_info:
+        write_player_info_csv(players.generated_players, player_info_path)
+
+    print(f"Ingest finished in {time.perf_counter() - started:.2f}s")
+
+
+def ingest_incremental(game_data_path, player_info_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Upsert only the games that are new or changed since they were last recorded in ingest_manifest"""
+    started = time.perf_counter()
+    source_file = Path(game_data_path).name
+    file_hash = file_sha256(game_data_path)
+
+    if file_is_ingested(source_file, file_hash):
+        print(f"{source_file} is unchanged since the last ingest; nothing to do.")
+        return
+
+    game_hashes = scan_game_hashes(game_data_path)
+    games = changed_games(game_hashes)
+    if not games:
+        print(f"No new or changed games in {source_file}.")
+        return
+    print(f"{len(games)} of {len(game_hashes)} games in {source_file} are new or changed.")
+
+    try:
+        players = PlayerSink(player_info_path, build_player_index())
+        pitching = InfoSink(PitchingInfo, "pitcher", pitching_values, players.player_index, chunk_size, games)
+        batting = InfoSink(BattingInfo, "batter", batting_values, players.player_index, chunk_size, games)
+
+        _stream(game_data_path, chunk_size, [players, pitching, batting])
+        record_games(source_file, file_hash, game_hashes, games,
+                     batting.rows_by_game, pitching.rows_by_game)
+        rebuild_plate_appearances(games=games)
+        rebuild_player_games(games=games)
+        bump_data_version()
+        db.session.commit()
+        refresh_leaderboards()
+    except Exception as e:
+        db.session.rollback()
+        print(f"Error during incremental ingest: {str(e)}")
+        raise e
+
+    print(f"Incremental ingest finished in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load players, pitching and batting data in a single pass")
+    parser.add_argument("--incremental", action="store_true",
+                        help="upsert only new or changed games instead of reloading everything")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=0,
+                        help="decode the CSV in a pool of this many processes (full ingest only)")
+    parser.add_argument("--staged", action="store_true",
+                        help="read typed columns from the Parquet staging cache (full ingest only)")
+    parser.add_argument("--write-player-info", action="store_true",
+                        help="also regenerate data/player_info.csv from the rows seen")
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        game_data_path = project_root / "data" / "padres_project_data.csv"
+        player_info_path = project_root / "data" / "player_info.csv"
+        if args.incremental:
+            ingest_incremental(game_data_path, player_info_path, args.chunk_size)
+        else:
+            ingest(game_data_path, player_info_path, args.chunk_size, args.write_player_info,
+                   args.workers, args.staged)
@@ -13,11 +13,11 @@ sys.path.append(str(project_root))
 
 from app import create_app 
 from app import db
-from app.models import Player
+from app.models import Player, bump_data_version, refresh_leaderboards
 
-def load_players_from_csvs(game_data_path, player_info_path):
+def read_player_info(player_info_path):
     """
-    Load player data from both game data CSV and player info CSV
+    Read the supplementary player info CSV keyed by bam_id
     """
     player_info_df = pd.read_csv(player_info_path)
     
@@ -33,6 +33,57 @@ def load_players_from_csvs(game_data_path, player_info_path):
             'birth_place': row['birth_place'],
             'image_url': row['image_url']
         }
+    return player_info_dict
+
+def padres_players_in_row(row):
+    """
+    Yield (bam_id, player) for the Padres batter and pitcher of a play-by-play row
+    """
+    if row["batter_team"] == "San Diego Padres":
+        bam_id = int(row["batter_bam_id"]) if row["batter_bam_id"] else None
+        if bam_id:
+            yield bam_id, {
+                'first_name': row["batter_name_first"],
+                'last_name': row["batter_name_last"],
+                'bam_id': bam_id,
+                'position': str(row["batter_position"]) if row["batter_position"] else None
+            }
+    
+    if row["pitcher_team"] == "San Diego Padres":
+        bam_id = int(row["pitcher_bam_id"]) if row["pitcher_bam_id"] else None
+        if bam_id:
+            yield bam_id, {
+                'first_name': row["pitcher_name_first"],
+                'last_name': row["pitcher_name_last"],
+                'bam_id': bam_id,
+                'position': "P"
+            }
+
+def build_player(bam_id, player, player_info_dict):
+    """
+    Build a Player from its first game data appearance and the player info CSV
+    """
+    player_info = player_info_dict.get(bam_id, {})
+    
+    return Player(
+        first_name=player['first_name'],
+        last_name=player['last_name'],
+        bam_id=bam_id,
+        position=player_info.get('position', player['position']),  
+        age=player_info.get('age'),
+        height=player_info.get('height'),
+        weight=player_info.get('weight'),
+        birth_place=player_info.get('birth_place'),
+        image_url=player_info.get('image_url'),
+        created_at=datetime.now(),
+        updated_at=datetime.now()
+    )
+
+def load_players_from_csvs(game_data_path, player_info_path):
+    """
+    Load player data from both game data CSV and player info CSV
+    """
+    player_info_dict = read_player_info(player_info_path)
 
     padres_players = {}
     
@@ -40,49 +91,22 @@ def load_players_from_csvs(game_data_path, player_info_path):
         reader = csv.DictReader(file)
         
         db.session.execute(text('TRUNCATE TABLE player_bio RESTART IDENTITY CASCADE;'))
+        # CASCADE empties every pitch table, so clear the manifest too or an incremental ingest skips every game
+        db.session.execute(text('TRUNCATE TABLE ingest_manifest RESTART IDENTITY;'))
         db.session.commit()
         
         for row in reader:
-            if row["batter_team"] == "San Diego Padres":
-                bam_id = int(row["batter_bam_id"]) if row["batter_bam_id"] else None
-                if bam_id and bam_id not in padres_players:
-                    padres_players[bam_id] = {
-                        'first_name': row["batter_name_first"],
-                        'last_name': row["batter_name_last"],
-                        'bam_id': bam_id,
-                        'position': str(row["batter_position"]) if row["batter_position"] else None
-                    }
-            
-            if row["pitcher_team"] == "San Diego Padres":
-                bam_id = int(row["pitcher_bam_id"]) if row["pitcher_bam_id"] else None
-                if bam_id and bam_id not in padres_players:
-                    padres_players[bam_id] = {
-                        'first_name': row["pitcher_name_first"],
-                        'last_name': row["pitcher_name_last"],
-                        'bam_id': bam_id,
-                        'position': "P"
-                    }
+            for bam_id, player in padres_players_in_row(row):
+                if bam_id not in padres_players:
+                    padres_players[bam_id] = player
         
         for bam_id, player in padres_players.items():
-            player_info = player_info_dict.get(bam_id, {})
-            
-            new_player = Player(
-                first_name=player['first_name'],
-                last_name=player['last_name'],
-                bam_id=bam_id,
-                position=player_info.get('position', player['position']),  
-                age=player_info.get('age'),
-                height=player_info.get('height'),
-                weight=player_info.get('weight'),
-                birth_place=player_info.get('birth_place'),
-                image_url=player_info.get('image_url'),
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            db.session.add(new_player)
+            db.session.add(build_player(bam_id, player, player_info_dict))
 
         try:
+            bump_data_version()
             db.session.commit()
+            refresh_leaderboards()
             print(f"Successfully loaded {len(padres_players)} players into the player_bio table.")
             
             print("\nLoaded Players:")
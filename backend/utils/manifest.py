@@ -0,0 +1,105 @@
+import csv
+import hashlib
+from datetime import datetime
+
+from app import db
+from app.models import IngestManifest
+from converters import safe_int
+from decode import row_digest
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class GameHasher:
+    """
+    Accumulates a content hash per game from the digests of its raw rows, so
+    the serial stream and the parallel decoder produce identical hashes.
+    """
+
+    def __init__(self):
+        self.hashers = {}
+
+    def update(self, row):
+        game_bam_id = safe_int(row["game_bam_id"])
+        if game_bam_id is not None:
+            self.update_digest(game_bam_id, row_digest(row))
+
+    def update_digest(self, game_bam_id, digest):
+        hasher = self.hashers.get(game_bam_id)
+        if hasher is None:
+            hasher = self.hashers[game_bam_id] = hashlib.sha256()
+        hasher.update(digest)
+
+    def hexdigests(self):
+        return {game_bam_id: hasher.hexdigest() for game_bam_id, hasher in self.hashers.items()}
+
+
+def scan_game_hashes(file_path):
+    """Hash every game in the raw CSV without touching the database"""
+    hasher = GameHasher()
+    with open(file_path, "r") as file:
+        for row in csv.DictReader(file):
+            hasher.update(row)
+    return hasher.hexdigests()
+
+
+def file_is_ingested(source_file, file_hash):
+    """True when every manifest entry for ``source_file`` was recorded from this exact file"""
+    hashes = {
+        recorded_hash
+        for (recorded_hash,) in db.session.query(IngestManifest.file_hash)
+        .filter_by(source_file=source_file)
+        .distinct()
+    }
+    return hashes == {file_hash}
+
+
+def changed_games(game_hashes):
+    """Return the games whose content hash is new or differs from the manifest"""
+    recorded = dict(db.session.query(IngestManifest.game_bam_id, IngestManifest.game_hash))
+    return {
+        game_bam_id
+        for game_bam_id, game_hash in game_hashes.items()
+        if recorded.get(game_bam_id) != game_hash
+    }
+
+
+def record_games(source_file, file_hash, game_hashes, games, batting_rows, pitching_rows):
+    """
+    Insert or refresh the manifest entries for ``games``, and stamp every other
+    game of ``game_hashes`` with ``file_hash`` as well: its rows are unchanged
+    but now come from this file, and file_is_ingested needs every entry to agree
+    """
+    existing = {
+        entry.game_bam_id: entry
+        for entry in IngestManifest.query.filter(IngestManifest.game_bam_id.in_(games))
+    } if games else {}
+    now = datetime.utcnow()
+
+    for game_bam_id in games:
+        entry = existing.get(game_bam_id)
+        if entry is None:
+            entry = IngestManifest(game_bam_id=game_bam_id)
+            db.session.add(entry)
+
+        entry.source_file = source_file
+        entry.file_hash = file_hash
+        entry.game_hash = game_hashes[game_bam_id]
+        entry.batting_rows = batting_rows.get(game_bam_id, 0)
+        entry.pitching_rows = pitching_rows.get(game_bam_id, 0)
+        entry.ingested_at = now
+
+    unchanged = set(game_hashes) - set(games)
+    if unchanged:
+        IngestManifest.query.filter(IngestManifest.game_bam_id.in_(unchanged)).update(
+            {'source_file': source_file, 'file_hash': file_hash}, synchronize_session=False
+        )
+
+    print(f"Recorded {len(games)} games from {source_file} in ingest_manifest.")
+
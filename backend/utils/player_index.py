@@ -0,0 +1,92 @@
+import csv
+from pathlib import Path
+
+from app import db
+from app.models import Player
+from converters import safe_int
+
+REJECTS_DIR = Path(__file__).resolve().parent.parent / "data" / "rejects"
+
+
+def build_player_index():
+    """Map every player_bio bam_id to its player_id with a single query"""
+    return {
+        bam_id: player_id
+        for bam_id, player_id in db.session.query(Player.bam_id, Player.player_id)
+        if bam_id is not None
+    }
+
+
+class RejectReport:
+    """Collects play-by-play rows that could not be matched to a player"""
+
+    FIELDS = ['line_number', 'bam_id', 'first_name', 'last_name', 'game_bam_id', 'reason']
+
+    def __init__(self, name):
+        self.name = name
+        self.rejects = []
+
+    def __len__(self):
+        return len(self.rejects)
+
+    def add(self, line_number, bam_id, first_name, last_name, game_bam_id, reason):
+        self.rejects.append({
+            'line_number': line_number,
+            'bam_id': bam_id,
+            'first_name': first_name,
+            'last_name': last_name,
+            'game_bam_id': game_bam_id,
+            'reason': reason
+        })
+
+    def write(self, directory=REJECTS_DIR):
+        """Write the report as CSV and return its path, or None when nothing was rejected"""
+        if not self.rejects:
+            print(f"{self.name}: no rejected rows.")
+            return None
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"{self.name}_rejects.csv"
+
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=self.FIELDS)
+            writer.writeheader()
+            writer.writerows(self.rejects)
+
+        print(f"{self.name}: {len(self.rejects)} rejected rows written to {path}")
+        return path
+
+
+def lookup_player(raw_bam_id, player_index):
+    """Return (player_id, None) for a raw bam_id, or (None, reason) when it does not resolve"""
+    bam_id = safe_int(raw_bam_id)
+    if bam_id is None:
+        return None, "missing bam_id"
+
+    player_id = player_index.get(bam_id)
+    if player_id is None:
+        return None, "bam_id not in player_bio"
+    return player_id, None
+
+
+def resolve_player(row, role, player_index, rejects, line_number):
+    """
+    Resolve a row's ``batter``/``pitcher`` bam_id against the player index.
+
+    Returns the player_id, or None after recording the row in ``rejects``.
+    """
+    raw_bam_id = row[f"{role}_bam_id"]
+    player_id, reason = lookup_player(raw_bam_id, player_index)
+
+    if player_id is None:
+        rejects.add(
+            line_number,
+            raw_bam_id,
+            row[f"{role}_name_first"],
+            row[f"{role}_name_last"],
+            row["game_bam_id"],
+            reason
+        )
+
+    return player_id
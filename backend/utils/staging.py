@@ -0,0 +1,209 @@
+"""
+Columnar Parquet staging cache for the raw play-by-play CSV.
+
+``stage_csv`` converts the CSV once into a typed, zstd-compressed Parquet
+file under data/.staging, typed with the same coercers the loaders use.
+The cache is keyed on the source file's mtime and size and falls back to
+its SHA-256 when only the mtime moved, so touching the CSV does not force
+a rebuild. ``read_staged`` and ``staged_chunks`` then read just the
+columns they need through a memory map, with no CSV parsing at all.
+
+Usage (from backend/utils):
+    python staging.py            # build or refresh the cache
+"""
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+
+current_dir = Path(__file__).resolve().parent
+project_root = current_dir.parent
+sys.path.append(str(project_root))
+
+from converters import safe_int, safe_float, safe_bool, safe_date, bool_or_false
+from decode import TARGETS, PADRES, row_digest
+from load_players_info import padres_players_in_row
+from manifest import file_sha256
+
+STAGING_DIR = project_root / "data" / ".staging"
+STAGING_VERSION = 1
+ROW_GROUP_ROWS = 64 * 1024
+DIGEST_COLUMN = "_row_digest"
+PLAYER_FIELDS = (
+    "batter_team", "batter_bam_id", "batter_name_first", "batter_name_last", "batter_position",
+    "pitcher_team", "pitcher_bam_id", "pitcher_name_first", "pitcher_name_last",
+)
+
+
+def _staged_coercers():
+    """Map raw CSV fields to the coercer the loaders apply to them"""
+    coercers = {
+        "game_bam_id": safe_int,
+        "batter_bam_id": safe_int,
+        "pitcher_bam_id": safe_int,
+    }
+    for _, _, schema in TARGETS:
+        for _, field, coerce in schema:
+            # pitching's in_play treats NULL as False; stage the nullable form for both
+            coercers[field] = safe_bool if coerce is bool_or_false else coerce
+    return coercers
+
+
+def _arrow_type(coerce):
+    import pyarrow as pa
+
+    return {
+        safe_int: pa.int64(),
+        safe_float: pa.float64(),
+        safe_bool: pa.bool_(),
+        safe_date: pa.date32(),
+    }.get(coerce, pa.string())
+
+
+def staging_paths(csv_path):
+    csv_path = Path(csv_path)
+    return (
+        STAGING_DIR / f"{csv_path.stem}.parquet",
+        STAGING_DIR / f"{csv_path.stem}.meta.json",
+    )
+
+
+def _source_meta(csv_path):
+    stat = os.stat(csv_path)
+    return {'version': STAGING_VERSION, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def is_fresh(csv_path):
+    """True when the staged Parquet file still matches ``csv_path``"""
+    parquet_path, meta_path = staging_paths(csv_path)
+    if not parquet_path.exists() or not meta_path.exists():
+        return False
+
+    recorded = json.loads(meta_path.read_text())
+    current = _source_meta(csv_path)
+    if recorded.get('version') != STAGING_VERSION or recorded.get('size') != current['size']:
+        return False
+    if recorded.get('mtime_ns') == current['mtime_ns']:
+        return True
+
+    # Same size but a new mtime: only rebuild when the content really changed
+    if recorded.get('sha256') != file_sha256(csv_path):
+        return False
+    meta_path.write_text(json.dumps({**recorded, **current}))
+    return True
+
+
+def _write_parquet(csv_path, parquet_path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    coercers = _staged_coercers()
+
+    with open(csv_path, "r") as file:
+        reader = csv.DictReader(file)
+        fields = reader.fieldnames
+        field_coercers = [coercers.get(field) for field in fields]
+        schema = pa.schema(
+            [pa.field(field, _arrow_type(coerce)) for field, coerce in zip(fields, field_coercers)]
+            + [pa.field(DIGEST_COLUMN, pa.binary(32))]
+        )
+
+        tmp_path = parquet_path.with_suffix(".parquet.tmp")
+        rows = 0
+        with pq.ParquetWriter(tmp_path, schema, compression="zstd") as writer:
+            columns = [[] for _ in range(len(fields) + 1)]
+            for row in reader:
+                for values, field, coerce in zip(columns, fields, field_coercers):
+                    raw = row[field]
+                    values.append(coerce(raw) if coerce else raw)
+                columns[-1].append(row_digest(row))
+                rows += 1
+
+                if len(columns[-1]) >= ROW_GROUP_ROWS:
+                    writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+                    columns = [[] for _ in range(len(fields) + 1)]
+
+            if columns[-1]:
+                writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+    os.replace(tmp_path, parquet_path)
+    return rows
+
+
+def stage_csv(csv_path, force=False):
+    """Build the Parquet staging file for ``csv_path`` if it is missing or stale, and return its path"""
+    parquet_path, meta_path = staging_paths(csv_path)
+    if not force and is_fresh(csv_path):
+        return parquet_path
+
+    STAGING_DIR.mkdir(parents=True, exist_ok=True)
+    rows = _write_parquet(csv_path, parquet_path)
+    meta_path.write_text(json.dumps({**_source_meta(csv_path), 'sha256': file_sha256(csv_path)}))
+    print(f"Staged {rows} rows from {Path(csv_path).name} into {parquet_path}")
+    return parquet_path
+
+
+def read_staged(csv_path, columns=None):
+    """Return the staged data for ``csv_path`` as a pyarrow Table, reading only ``columns``"""
+    import pyarrow.parquet as pq
+
+    return pq.read_table(stage_csv(csv_path), columns=columns, memory_map=True)
+
+
+def staged_chunks(csv_path, batch_rows=ROW_GROUP_ROWS, targets=TARGETS):
+    """
+    Yield chunks from the staging file in the same shape as
+    ``decode.decode_range``, so the ingest sinks can consume either.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    needed = {"game_bam_id", DIGEST_COLUMN, *PLAYER_FIELDS}
+    for _, _, schema in targets:
+        needed.update(field for _, field, _ in schema)
+
+    parquet = pq.ParquetFile(stage_csv(csv_path), memory_map=True)
+    columns = [name for name in parquet.schema_arrow.names if name in needed]
+
+    for record_batch in parquet.iter_batches(batch_size=batch_rows, columns=columns):
+        table = pa.Table.from_batches([record_batch])
+        table = table.append_column("_row_index", pa.array(range(table.num_rows), pa.int64()))
+
+        digests = {}
+        for game_bam_id, digest in zip(table["game_bam_id"].to_pylist(), table[DIGEST_COLUMN].to_pylist()):
+            if game_bam_id is not None:
+                digests.setdefault(game_bam_id, []).append(digest)
+
+        players = {}
+        player_rows = table.filter(pc.or_(pc.equal(table["batter_team"], PADRES),
+                                          pc.equal(table["pitcher_team"], PADRES)))
+        for row in player_rows.select(list(PLAYER_FIELDS)).to_pylist():
+            for bam_id, player in padres_players_in_row(row):
+                players.setdefault(bam_id, player)
+
+        batches = {}
+        for name, role, schema in targets:
+            rows = table.filter(pc.equal(table[f"{role}_team"], PADRES))
+            batch = {
+                'row_index': rows["_row_index"].to_pylist(),
+                'bam_id': rows[f"{role}_bam_id"].to_pylist(),
+            }
+            for column, field, coerce in schema:
+                values = rows[field]
+                if coerce is bool_or_false:
+                    values = pc.fill_null(values, False)
+                batch[column] = values.to_pylist()
+            batches[name] = batch
+
+        yield {
+            'rows': table.num_rows,
+            'players': list(players.items()),
+            'digests': digests,
+            'batches': batches,
+        }
+
+
+if __name__ == "__main__":
+    stage_csv(project_root / "data" / "padres_project_data.csv", force="--force" in sys.argv)